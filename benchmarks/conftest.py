@@ -0,0 +1,262 @@
+"""
+Timing harness of the benchmark suite.
+
+The benchmarks are regular pytest functions that request the `benchmark` fixture, and are not collected by the test
+suite in `test/`.
+Run them with ``python -m pytest benchmarks``.
+Use ``--benchmark-json=results.json`` to save the results and ``--benchmark-compare=results.json`` to compare a later
+run against them.
+"""
+
+import os
+
+# Pin the math libraries to one thread before numpy is loaded, such that numbers are comparable across machines.
+for _variable in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_variable, "1")
+
+import gc
+import json
+import platform
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+import pytest
+from krrood.entity_query_language.symbol_graph import SymbolGraph
+from typing_extensions import Any, Callable, Dict, List, Optional, Tuple
+
+from semantic_digital_twin.exceptions import ParsingError
+from semantic_digital_twin.testing import (
+    apartment_world,
+    hsrb_world,
+    kitchen_world,
+    pr2_world,
+    tracy_world,
+)
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    The measured durations of one benchmark.
+    """
+
+    name: str
+    """
+    The node id of the benchmark.
+    """
+
+    durations: List[float]
+    """
+    The duration of every measured round in seconds.
+    """
+
+    @property
+    def minimum(self) -> float:
+        return float(np.min(self.durations))
+
+    @property
+    def median(self) -> float:
+        return float(np.median(self.durations))
+
+    @property
+    def interquartile_range(self) -> float:
+        """
+        Spread of the durations that, unlike the standard deviation, is robust against single outliers.
+        """
+        lower, upper = np.percentile(self.durations, [25, 75])
+        return float(upper - lower)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "rounds": len(self.durations),
+            "min": self.minimum,
+            "median": self.median,
+            "iqr": self.interquartile_range,
+            "durations": self.durations,
+        }
+
+
+@dataclass
+class Benchmark:
+    """
+    Measures a function over several rounds, after some unmeasured warmup rounds.
+    Garbage collection is disabled while a round is measured, and every round starts with a collected heap.
+    """
+
+    name: str
+    """
+    The node id of the benchmark.
+    """
+
+    rounds: int
+    """
+    The number of measured rounds.
+    """
+
+    warmup_rounds: int
+    """
+    The number of rounds that are executed before measuring, e.g. to fill caches or compile functions.
+    """
+
+    result: Optional[BenchmarkResult] = field(default=None, init=False)
+    """
+    The result of the benchmark, available after it was called.
+    """
+
+    def __call__(
+        self,
+        function: Callable[..., Any],
+        setup: Optional[Callable[[], Tuple]] = None,
+        rounds: Optional[int] = None,
+        warmup_rounds: Optional[int] = None,
+    ) -> Any:
+        """
+        Measures a function.
+
+        :param function: The function to measure.
+        :param setup: Called before every round, is not measured. Its result is passed as arguments to `function`.
+            Use it for operations that consume their input, like merging worlds.
+        :param rounds: Overrides the number of measured rounds for expensive benchmarks.
+        :param warmup_rounds: Overrides the number of warmup rounds.
+        :return: The return value of the last call of `function`.
+        """
+        rounds = self.rounds if rounds is None else min(rounds, self.rounds)
+        warmup_rounds = self.warmup_rounds if warmup_rounds is None else warmup_rounds
+        durations = []
+        result = None
+        for round_index in range(warmup_rounds + rounds):
+            args = setup() if setup is not None else ()
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                result = function(*args)
+                duration = time.perf_counter() - start
+            finally:
+                gc.enable()
+            if round_index >= warmup_rounds:
+                durations.append(duration)
+        self.result = BenchmarkResult(name=self.name, durations=durations)
+        return result
+
+
+_results_key = pytest.StashKey[List[BenchmarkResult]]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark-rounds",
+        type=int,
+        default=20,
+        help="Maximum number of measured rounds per benchmark.",
+    )
+    group.addoption(
+        "--benchmark-warmup-rounds",
+        type=int,
+        default=2,
+        help="Number of unmeasured rounds before measuring.",
+    )
+    group.addoption(
+        "--benchmark-json",
+        default=None,
+        help="Save the results to this JSON file.",
+    )
+    group.addoption(
+        "--benchmark-compare",
+        default=None,
+        help="Compare the medians against the results saved in this JSON file.",
+    )
+
+
+def pytest_configure(config):
+    SymbolGraph()
+    config.stash[_results_key] = []
+
+
+@pytest.fixture
+def benchmark(request) -> Benchmark:
+    benchmark = Benchmark(
+        name=request.node.nodeid,
+        rounds=request.config.getoption("--benchmark-rounds"),
+        warmup_rounds=request.config.getoption("--benchmark-warmup-rounds"),
+    )
+    yield benchmark
+    if benchmark.result is not None:
+        request.config.stash[_results_key].append(benchmark.result)
+
+
+@pytest.fixture(
+    params=[
+        "pr2_world",
+        "hsrb_world",
+        "tracy_world",
+        "apartment_world",
+        "kitchen_world",
+    ]
+)
+def world(request):
+    """
+    Every world of `semantic_digital_twin.testing`.
+    Worlds that need ROS packages, which can't be resolved on this machine, are skipped.
+    """
+    try:
+        return request.getfixturevalue(request.param)
+    except ParsingError as e:
+        pytest.skip(f"{request.param} can't be loaded: {e}")
+
+
+def _machine_info() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.system(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = sorted(config.stash[_results_key], key=lambda result: result.name)
+    if not results:
+        return
+
+    baseline = {}
+    compare_path = config.getoption("--benchmark-compare")
+    if compare_path is not None:
+        with open(compare_path) as f:
+            baseline = {
+                result["name"]: result["median"] for result in json.load(f)["results"]
+            }
+
+    terminalreporter.section("benchmarks")
+    name_width = max(len(result.name) for result in results)
+    header = f"{'name':<{name_width}}  {'rounds':>6}  {'min [ms]':>10}  {'median [ms]':>11}  {'iqr [ms]':>10}"
+    if baseline:
+        header += f"  {'vs baseline':>11}"
+    terminalreporter.write_line(header)
+    for result in results:
+        line = (
+            f"{result.name:<{name_width}}  {len(result.durations):>6}  "
+            f"{result.minimum * 1e3:>10.3f}  {result.median * 1e3:>11.3f}  "
+            f"{result.interquartile_range * 1e3:>10.3f}"
+        )
+        if result.name in baseline:
+            line += f"  {result.median / baseline[result.name]:>10.2f}x"
+        terminalreporter.write_line(line)
+
+    json_path = config.getoption("--benchmark-json")
+    if json_path is not None:
+        with open(json_path, "w") as f:
+            json.dump(
+                {
+                    "machine_info": _machine_info(),
+                    "results": [result.to_json() for result in results],
+                },
+                f,
+                indent=2,
+            )
+        terminalreporter.write_line(f"Saved benchmark results to {json_path}")
@@ -0,0 +1,102 @@
+import numpy as np
+
+from semantic_digital_twin.collision_checking.collision_detector import CollisionCheck
+from semantic_digital_twin.collision_checking.signed_distance_field import (
+    SignedDistanceFieldCache,
+)
+from semantic_digital_twin.collision_checking.trimesh_collision_detector import (
+    TrimeshCollisionDetector,
+)
+
+
+def test_check_collisions(benchmark, world):
+    rng = np.random.default_rng(0)
+    initial_positions = world.state.positions.copy()
+    detector = TrimeshCollisionDetector(world)
+    collision_checks = [
+        CollisionCheck(body_a, body_b, 0.05, world)
+        for body_a, body_b in world._collision_pair_manager.enabled_collision_pairs
+        if body_a is not body_b
+    ]
+
+    def move_all_dofs():
+        world.state.positions[:] = initial_positions + rng.uniform(
+            -0.1, 0.1, initial_positions.shape
+        )
+        world.notify_state_change()
+        return (collision_checks,)
+
+    benchmark(detector.check_collisions, setup=move_all_dofs)
+
+
+def test_check_collision_matrix(benchmark, world):
+    rng = np.random.default_rng(0)
+    initial_positions = world.state.positions.copy()
+    detector = TrimeshCollisionDetector(world)
+    collision_matrix = world._collision_pair_manager.compute_collision_matrix(0.05)
+
+    def move_all_dofs():
+        world.state.positions[:] = initial_positions + rng.uniform(
+            -0.1, 0.1, initial_positions.shape
+        )
+        world.notify_state_change()
+        return (collision_matrix,)
+
+    benchmark(detector.check_collisions, setup=move_all_dofs)
+
+
+def test_compute_collision_matrix(benchmark, world):
+    benchmark(lambda: world._collision_pair_manager.compute_collision_matrix(0.05))
+
+
+def test_check_trajectory(benchmark, world):
+    rng = np.random.default_rng(0)
+    initial_positions = world.state.positions.copy()
+    detector = TrimeshCollisionDetector(world)
+    collision_matrix = world._collision_pair_manager.compute_collision_matrix(0.0)
+    configurations = initial_positions + rng.uniform(
+        -0.1, 0.1, (10, len(initial_positions))
+    )
+
+    benchmark(
+        lambda: detector.check_trajectory(configurations, collision_matrix),
+        rounds=5,
+    )
+
+
+def test_check_collisions_between_ticks(benchmark, world):
+    rng = np.random.default_rng(0)
+    initial_positions = world.state.positions.copy()
+    velocities = rng.uniform(-0.3, 0.3, initial_positions.shape)
+    detector = TrimeshCollisionDetector(world)
+    collision_matrix = world._collision_pair_manager.compute_collision_matrix(0.1)
+    tick = 0
+
+    def move_like_a_control_loop():
+        nonlocal tick
+        tick += 1
+        world.state.positions[:] = initial_positions + np.sin(velocities * tick * 0.01)
+        world.notify_state_change()
+        return (collision_matrix,)
+
+    benchmark(detector.check_collisions, setup=move_like_a_control_loop)
+
+
+def test_check_collisions_with_signed_distance_fields(benchmark, world, tmp_path):
+    rng = np.random.default_rng(0)
+    initial_positions = world.state.positions.copy()
+    detector = TrimeshCollisionDetector(
+        world,
+        signed_distance_fields=SignedDistanceFieldCache(cache_directory=str(tmp_path)),
+        use_temporal_coherence=False,
+    )
+    collision_matrix = world._collision_pair_manager.compute_collision_matrix(0.05)
+
+    def move_all_dofs():
+        world.state.positions[:] = initial_positions + rng.uniform(
+            -0.1, 0.1, initial_positions.shape
+        )
+        world.notify_state_change()
+        return (collision_matrix,)
+
+    benchmark(detector.check_collisions, setup=move_all_dofs)
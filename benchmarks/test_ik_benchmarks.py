@@ -0,0 +1,25 @@
+import pytest
+
+from semantic_digital_twin.spatial_computations.ik_solver import (
+    InverseKinematicsSolver,
+)
+from semantic_digital_twin.spatial_types.spatial_types import TransformationMatrix
+from semantic_digital_twin.testing import pr2_world
+
+
+@pytest.mark.parametrize("tip_name", ["r_gripper_tool_frame", "l_gripper_tool_frame"])
+def test_inverse_kinematics(benchmark, pr2_world, tip_name):
+    root = pr2_world.root
+    tip = pr2_world.get_kinematic_structure_entity_by_name(tip_name)
+    initial_positions = pr2_world.state.positions.copy()
+    root_T_tip_goal = pr2_world.compute_forward_kinematics_np(root, tip)
+    root_T_tip_goal[0, 3] -= 0.2
+    target = TransformationMatrix(root_T_tip_goal, reference_frame=root)
+    solver = InverseKinematicsSolver(pr2_world)
+
+    def reset_state():
+        pr2_world.state.positions[:] = initial_positions
+        pr2_world.notify_state_change()
+        return root, tip, target
+
+    benchmark(solver.solve, setup=reset_state)
@@ -0,0 +1,23 @@
+from krrood.ormatic.dao import to_dao
+from krrood.ormatic.utils import create_engine
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from semantic_digital_twin.orm.ormatic_interface import *
+from semantic_digital_twin.world import World
+
+
+def test_orm_round_trip(benchmark, world):
+    def create_session():
+        session = Session(create_engine("sqlite:///:memory:"))
+        Base.metadata.create_all(bind=session.bind)
+        return (session,)
+
+    def round_trip(session: Session) -> World:
+        session.add(to_dao(world))
+        session.commit()
+        reconstructed = session.scalar(select(WorldMappingDAO)).from_dao()
+        session.close()
+        return reconstructed
+
+    benchmark(round_trip, setup=create_session, rounds=3, warmup_rounds=1)
@@ -0,0 +1,30 @@
+import os
+
+import pytest
+
+from semantic_digital_twin.adapters.procthor.procthor_parser import ProcTHORParser
+from semantic_digital_twin.adapters.urdf import URDFParser
+from semantic_digital_twin.exceptions import ParsingError
+
+resources_dir = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "resources"
+)
+urdf_dir = os.path.join(resources_dir, "urdf")
+
+
+@pytest.mark.parametrize("urdf", sorted(os.listdir(urdf_dir)))
+def test_parse_urdf(benchmark, urdf):
+    parser = URDFParser.from_file(file_path=os.path.join(urdf_dir, urdf))
+    try:
+        parser.parse()
+    except ParsingError as e:
+        pytest.skip(f"{urdf} can't be parsed: {e}")
+    benchmark(parser.parse, rounds=5, warmup_rounds=0)
+
+
+@pytest.mark.parametrize("house", ["house_987654321.json"])
+def test_parse_procthor(benchmark, house):
+    parser = ProcTHORParser.from_file(
+        os.path.join(resources_dir, "procthor_json", house)
+    )
+    benchmark(parser.parse, rounds=3, warmup_rounds=0)
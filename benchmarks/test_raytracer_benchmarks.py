@@ -0,0 +1,25 @@
+import numpy as np
+
+from semantic_digital_twin.spatial_computations.raytracer import RayTracer
+from semantic_digital_twin.spatial_types.spatial_types import TransformationMatrix
+
+
+def test_ray_test(benchmark, world):
+    rng = np.random.default_rng(0)
+    ray_tracer = RayTracer(world)
+    directions = rng.normal(size=(10_000, 3))
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    origins = np.tile([0.0, 0.0, 1.0], (len(directions), 1))
+    benchmark(ray_tracer.ray_test, setup=lambda: (origins, origins + 10 * directions))
+
+
+def test_depth_map(benchmark, world):
+    ray_tracer = RayTracer(world)
+    camera_pose = TransformationMatrix.from_xyz_rpy(
+        x=-3, z=1.5, pitch=0.3, reference_frame=world.root
+    )
+    benchmark(
+        ray_tracer.create_depth_map,
+        setup=lambda: (camera_pose, 128),
+        rounds=5,
+    )
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from semantic_digital_twin.adapters.ros.messages import (
+    MetaData,
+    ModificationBlock,
+    PackedMessage,
+    PackedWorldStateUpdate,
+    WorldStateUpdate,
+)
+from semantic_digital_twin.adapters.world_entity_kwargs_tracker import (
+    KinematicStructureEntityKwargsTracker,
+)
+
+meta_data = MetaData(node_name="benchmark", process_id=0, object_id=0)
+
+
+@pytest.fixture
+def state_update(world) -> WorldStateUpdate:
+    return WorldStateUpdate(
+        ids=world.state.keys(),
+        states=world.state.positions.tolist(),
+        meta_data=meta_data,
+    )
+
+
+@pytest.fixture
+def modification_block(world) -> ModificationBlock:
+    return ModificationBlock(
+        modifications=world.get_world_model_manager().model_modification_blocks[-1],
+        meta_data=meta_data,
+    )
+
+
+def test_encode_state_update(benchmark, state_update):
+    benchmark(lambda: json.dumps(state_update.to_json()))
+
+
+def test_decode_state_update(benchmark, world, state_update):
+    payload = json.dumps(state_update.to_json())
+
+    def decode():
+        tracker = KinematicStructureEntityKwargsTracker.from_world(world)
+        return WorldStateUpdate.from_json(
+            json.loads(payload), **tracker.create_kwargs()
+        )
+
+    benchmark(decode)
+
+
+def test_encode_packed_state_update(benchmark, world):
+    benchmark(
+        lambda: PackedWorldStateUpdate(
+            schema_id=0,
+            indices=range(len(world.state)),
+            states=world.state.positions,
+        ).to_bytes()
+    )
+
+
+def test_decode_packed_state_update(benchmark, world):
+    payload = PackedWorldStateUpdate(
+        schema_id=0, indices=range(len(world.state)), states=world.state.positions
+    ).to_bytes()
+    benchmark(lambda: PackedMessage.from_bytes(payload))
+
+
+def test_encode_modification_block(benchmark, modification_block):
+    benchmark(lambda: json.dumps(modification_block.to_json()), rounds=5)
+
+
+def test_decode_modification_block(benchmark, world, modification_block):
+    payload = json.dumps(modification_block.to_json())
+
+    def decode():
+        tracker = KinematicStructureEntityKwargsTracker.from_world(world)
+        return ModificationBlock.from_json(
+            json.loads(payload), **tracker.create_kwargs()
+        )
+
+    benchmark(decode, rounds=5)
@@ -0,0 +1,54 @@
+import os
+
+import numpy as np
+import pytest
+
+from semantic_digital_twin.adapters.urdf import URDFParser
+from semantic_digital_twin.datastructures.prefixed_name import PrefixedName
+from semantic_digital_twin.world import World
+from semantic_digital_twin.world_description.connections import Connection6DoF
+from semantic_digital_twin.world_description.world_entity import Body
+
+urdf_dir = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "resources", "urdf"
+)
+
+
+def test_state_change_forward_kinematics(benchmark, world):
+    rng = np.random.default_rng(0)
+    initial_positions = world.state.positions.copy()
+
+    def move_all_dofs():
+        world.state.positions[:] = initial_positions + rng.uniform(
+            -0.1, 0.1, initial_positions.shape
+        )
+        return ()
+
+    benchmark(world.notify_state_change, setup=move_all_dofs)
+
+
+def test_model_change_recompilation(benchmark, world):
+    benchmark(world._notify_model_change, rounds=5)
+
+
+@pytest.mark.parametrize(
+    "urdf", ["pr2_kinematic_tree.urdf", "simple_two_arm_robot.urdf", "table.urdf"]
+)
+def test_merge_world(benchmark, urdf):
+    def parse_worlds():
+        world = World()
+        with world.modify_world():
+            world.add_kinematic_structure_entity(
+                Body(name=PrefixedName("odom_combined"))
+            )
+        other = URDFParser.from_file(file_path=os.path.join(urdf_dir, urdf)).parse()
+        return world, other
+
+    def merge(world: World, other: World):
+        with world.modify_world():
+            connection = Connection6DoF.create_with_dofs(
+                parent=world.root, child=other.root, world=world
+            )
+            world.merge_world(other, connection)
+
+    benchmark(merge, setup=parse_worlds, rounds=5)
@@ -0,0 +1,57 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# This script generates an SRDF file with the disabled self collisions of a robot, which can be loaded with
+# World.load_collision_srdf.
+# Pairs of bodies are disabled if they are adjacent, collide in the default configuration, almost always collide or
+# never collide in random configurations of the robot.
+#
+# Example:
+#   python scripts/generate_collision_srdf.py resources/urdf/hsrb.urdf HSRB resources/collision_configs/hsrb.srdf
+# ----------------------------------------------------------------------------------------------------------------------
+import argparse
+
+from krrood.entity_query_language.symbol_graph import SymbolGraph
+
+from semantic_digital_twin.adapters.urdf import URDFParser
+from semantic_digital_twin.collision_checking.self_collision_matrix import (
+    SelfCollisionMatrixGenerator,
+)
+from semantic_digital_twin.robots.hsrb import HSRB
+from semantic_digital_twin.robots.pr2 import PR2
+from semantic_digital_twin.robots.tracy import Tracy
+
+robot_classes = {
+    robot_class.__name__: robot_class for robot_class in [HSRB, PR2, Tracy]
+}
+
+
+def generate_collision_srdf(
+    urdf_path: str,
+    robot_class_name: str,
+    srdf_path: str,
+    number_of_samples: int,
+    seed: int,
+):
+    SymbolGraph()
+    world = URDFParser.from_file(file_path=urdf_path).parse()
+    robot = robot_classes[robot_class_name].from_world(world)
+    generator = SelfCollisionMatrixGenerator(
+        robot, number_of_samples=number_of_samples, seed=seed
+    )
+    generator.save_srdf(srdf_path)
+    print(
+        f"Disabled {len(generator.disabled_collision_pairs)} pairs of "
+        f"{len(robot.bodies_with_enabled_collision)} bodies, saved to {srdf_path}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("urdf_path", help="The URDF file of the robot.")
+    parser.add_argument("robot_class", choices=sorted(robot_classes))
+    parser.add_argument("srdf_path", help="The SRDF file to write.")
+    parser.add_argument("--samples", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    generate_collision_srdf(
+        args.urdf_path, args.robot_class, args.srdf_path, args.samples, args.seed
+    )
@@ -1,9 +1,14 @@
-from abc import ABC
+from __future__ import annotations
+
+import struct
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from enum import IntEnum
 from functools import lru_cache
 from uuid import UUID
 
-from typing_extensions import Dict, Any, Self, List
+import numpy as np
+from typing_extensions import Dict, Any, Self, List, ClassVar, Type, TYPE_CHECKING
 
 from krrood.adapters.json_serializer import SubclassJSONSerializer, to_json, from_json
 
@@ -11,6 +16,9 @@ from ...world_description.world_modification import (
     WorldModelModificationBlock,
 )
 
+if TYPE_CHECKING:
+    from ...world_description.world_state import WorldState
+
 
 @dataclass
 class MetaData(SubclassJSONSerializer):
@@ -101,6 +109,182 @@ class WorldStateUpdate(Message):
         )
 
 
+class PackedMessageType(IntEnum):
+    """
+    Identifies the kind of a binary message in its header.
+    """
+
+    WORLD_STATE_SCHEMA = 0
+    PACKED_WORLD_STATE_UPDATE = 1
+
+
+@dataclass
+class PackedMessage(ABC):
+    """
+    Message that is serialized into a compact binary frame instead of JSON.
+    Every frame starts with a header containing the message type, the number of entries and the id of the schema
+    the message belongs to, followed by the payload of the message.
+    """
+
+    schema_id: int
+    """
+    Identifies the column layout of the publishing world, for which the message was created.
+    """
+
+    message_type: ClassVar[PackedMessageType]
+    """
+    The type of the message, written into the header.
+    """
+
+    header: ClassVar[struct.Struct] = struct.Struct("<B3xIQ")
+    """
+    Message type, padding to keep the payload aligned, number of entries and schema id.
+    """
+
+    @property
+    @abstractmethod
+    def number_of_entries(self) -> int:
+        """
+        :return: The number of entries in the payload.
+        """
+
+    @abstractmethod
+    def _payload_to_bytes(self) -> bytes:
+        """
+        :return: The payload of the message in binary form.
+        """
+
+    @classmethod
+    @abstractmethod
+    def _from_payload(
+        cls, schema_id: int, number_of_entries: int, payload: memoryview
+    ) -> Self:
+        """
+        Creates the message from the payload of a frame.
+        """
+
+    def to_bytes(self) -> bytes:
+        """
+        :return: The message as binary frame.
+        """
+        return (
+            self.header.pack(self.message_type, self.number_of_entries, self.schema_id)
+            + self._payload_to_bytes()
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PackedMessage:
+        """
+        Creates the message of the type given in the header of a binary frame.
+
+        :param data: The binary frame, for example the data of a ROS byte array message.
+        :return: The message.
+        """
+        data = memoryview(data).cast("B")
+        message_type, number_of_entries, schema_id = cls.header.unpack_from(data)
+        message_class = _packed_message_classes[PackedMessageType(message_type)]
+        return message_class._from_payload(
+            schema_id, number_of_entries, data[cls.header.size :]
+        )
+
+
+@dataclass
+class WorldStateSchema(PackedMessage):
+    """
+    Announces the order of the free variables of a world state, such that updates only have to contain column
+    indices instead of the ids.
+    """
+
+    ids: List[UUID]
+    """
+    The ids of the free variables in column order.
+    """
+
+    message_type: ClassVar[PackedMessageType] = PackedMessageType.WORLD_STATE_SCHEMA
+
+    @property
+    def number_of_entries(self) -> int:
+        return len(self.ids)
+
+    def _payload_to_bytes(self) -> bytes:
+        return b"".join(dof_id.bytes for dof_id in self.ids)
+
+    def columns_in(self, world_state: WorldState) -> np.ndarray:
+        """
+        :param world_state: The world state that receives updates in this schema.
+        :return: The column in the world state of every column in this schema, or -1 if the free variable doesn't
+            exist in the world state. Only valid for the current layout version of the world state.
+        """
+        index = {dof_id: column for column, dof_id in enumerate(world_state.keys())}
+        return np.fromiter(
+            (index.get(dof_id, -1) for dof_id in self.ids),
+            dtype=np.intp,
+            count=len(self.ids),
+        )
+
+    @classmethod
+    def _from_payload(
+        cls, schema_id: int, number_of_entries: int, payload: memoryview
+    ) -> Self:
+        return cls(
+            schema_id=schema_id,
+            ids=[
+                UUID(bytes=bytes(payload[offset : offset + 16]))
+                for offset in range(0, 16 * number_of_entries, 16)
+            ],
+        )
+
+
+@dataclass
+class PackedWorldStateUpdate(PackedMessage):
+    """
+    Binary counterpart of `WorldStateUpdate`, that refers to the free variables by their column in a schema.
+    """
+
+    indices: np.ndarray
+    """
+    The columns of the changed free variables in the schema.
+    """
+
+    states: np.ndarray
+    """
+    The states of the changed free variables.
+    """
+
+    message_type: ClassVar[PackedMessageType] = (
+        PackedMessageType.PACKED_WORLD_STATE_UPDATE
+    )
+
+    @property
+    def number_of_entries(self) -> int:
+        return len(self.indices)
+
+    def _payload_to_bytes(self) -> bytes:
+        return (
+            np.asarray(self.states, dtype="<f8").tobytes()
+            + np.asarray(self.indices, dtype="<u4").tobytes()
+        )
+
+    @classmethod
+    def _from_payload(
+        cls, schema_id: int, number_of_entries: int, payload: memoryview
+    ) -> Self:
+        states = np.frombuffer(payload, dtype="<f8", count=number_of_entries)
+        indices = np.frombuffer(
+            payload,
+            dtype="<u4",
+            count=number_of_entries,
+            offset=states.nbytes,
+        )
+        return cls(schema_id=schema_id, indices=indices, states=states)
+
+
+_packed_message_classes: Dict[PackedMessageType, Type[PackedMessage]] = {
+    message_class.message_type: message_class
+    for message_class in (WorldStateSchema, PackedWorldStateUpdate)
+}
+
+
 @dataclass
 class ModificationBlock(Message):
     """
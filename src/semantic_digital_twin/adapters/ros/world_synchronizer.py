@@ -1,10 +1,11 @@
+import array
 import json
 import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from functools import cached_property
-from typing import ClassVar, Optional, Type, List, Dict
-from uuid import UUID
+from typing import ClassVar, Optional, Type, List, Dict, Set, Tuple, Union
+from uuid import UUID, uuid4
 
 import numpy as np
 import rclpy  # type: ignore
@@ -17,7 +18,16 @@ from rclpy.subscription import Subscription
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from .messages import MetaData, WorldStateUpdate, Message, ModificationBlock, LoadModel
+from .messages import (
+    MetaData,
+    WorldStateUpdate,
+    Message,
+    ModificationBlock,
+    LoadModel,
+    PackedMessage,
+    PackedWorldStateUpdate,
+    WorldStateSchema,
+)
 from ..world_entity_kwargs_tracker import KinematicStructureEntityKwargsTracker
 from ...callbacks.callback import Callback, StateChangeCallback, ModelChangeCallback
 from ...orm.ormatic_interface import *
@@ -187,70 +197,257 @@ class SynchronizerOnCallback(Synchronizer, Callback, ABC):
 class StateSynchronizer(StateChangeCallback, SynchronizerOnCallback):
     """
     Synchronizes the state (values of free variables) of the semantic digital twin with the associated ROS topic.
+
+    By default, states are published as compact binary frames on a separate topic.
+    Whenever the column layout of the world state changes, a `WorldStateSchema` is announced that maps the columns to
+    the ids of the free variables, such that each update only contains the schema id, the columns and the values.
+    The JSON messages on `topic_name` are still received and can be published instead by disabling
+    `use_binary_messages`.
     """
 
     message_type: ClassVar[Optional[Type[SubclassJSONSerializer]]] = WorldStateUpdate
 
     topic_name: str = "/semantic_digital_twin/world_state"
 
+    use_binary_messages: bool = True
+    """
+    Whether to publish binary frames instead of JSON messages.
+    """
+
+    schema_announcement_interval: int = 100
+    """
+    The schema is announced again after this many binary updates, in case a subscriber missed the announcement.
+    """
+
+    binary_publisher: Optional[Publisher] = field(init=False, default=None)
+    """
+    The publisher used to publish binary frames.
+    """
+
+    binary_subscriber: Optional[Subscription] = field(init=False, default=None)
+    """
+    The subscriber to binary frames.
+    """
+
+    _schema_id: Optional[int] = field(init=False, default=None, repr=False)
+    """
+    The id of the schema that was last announced by this synchronizer.
+    """
+
+    _schema_layout_version: int = field(init=False, default=-1, repr=False)
+    """
+    The layout version of the world state, for which the schema was announced.
+    """
+
+    _updates_since_schema_announcement: int = field(init=False, default=0, repr=False)
+    """
+    The number of binary updates published since the schema was last announced.
+    """
+
+    _schema_subscription_count: int = field(init=False, default=0, repr=False)
+    """
+    The number of subscribers to binary frames when the schema was last announced.
+    The schema is announced again when new subscribers joined, such that they can decode the following updates.
+    """
+
+    _own_schema_ids: Set[int] = field(init=False, default_factory=set, repr=False)
+    """
+    The ids of all schemas announced by this synchronizer, used to skip its own binary frames.
+    """
+
+    _received_schemas: Dict[int, WorldStateSchema] = field(
+        init=False, default_factory=dict, repr=False
+    )
+    """
+    Maps the ids of schemas announced by other synchronizers to the schemas.
+    """
+
+    _schema_columns: Dict[int, Tuple[int, np.ndarray]] = field(
+        init=False, default_factory=dict, repr=False
+    )
+    """
+    Maps the ids of received schemas to the layout version of the world state and the column in the world state
+    of every column in the schema, or -1 if the free variable doesn't exist in this world.
+    """
+
+    @property
+    def binary_topic_name(self) -> str:
+        """
+        The topic name of the binary publisher and subscriber.
+        """
+        return f"{self.topic_name}/binary"
+
     def __post_init__(self):
         super().__post_init__()
         SynchronizerOnCallback.__post_init__(self)
+        self.binary_publisher = self.node.create_publisher(
+            std_msgs.msg.UInt8MultiArray, topic=self.binary_topic_name, qos_profile=10
+        )
+        self.binary_subscriber = self.node.create_subscription(
+            std_msgs.msg.UInt8MultiArray,
+            topic=self.binary_topic_name,
+            callback=self.binary_subscription_callback,
+            qos_profile=10,
+        )
 
-    def apply_message(self, msg: WorldStateUpdate):
+    def binary_subscription_callback(self, msg: std_msgs.msg.UInt8MultiArray):
+        """
+        Decodes a binary frame. Schemas are recorded immediately, updates are handled like JSON messages.
+        Frames of this synchronizer and updates of unknown schemas are skipped.
+        """
+        msg = PackedMessage.from_bytes(msg.data)
+        if msg.schema_id in self._own_schema_ids:
+            return
+        match msg:
+            case WorldStateSchema():
+                self._received_schemas[msg.schema_id] = msg
+                self._schema_columns.pop(msg.schema_id, None)
+            case PackedWorldStateUpdate():
+                if msg.schema_id not in self._received_schemas:
+                    return
+                self._subscription_callback(msg)
+
+    def apply_message(self, msg: Union[WorldStateUpdate, PackedWorldStateUpdate]):
         """
         Update the world state with the provided message.
 
         :param msg: The message containing the new state information.
         """
-        # Parse incoming states: WorldState has 'states' only
-        indices = [self.world.state._index[_id] for _id in msg.ids]
-
-        if indices:
-            self.world.state.data[0, indices] = np.asarray(msg.states, dtype=float)
+        match msg:
+            case PackedWorldStateUpdate():
+                columns = self._columns_of_schema(msg.schema_id)[msg.indices]
+                known = columns >= 0
+                indices = columns[known]
+                states = msg.states[known]
+            case _:
+                # Parse incoming states: WorldState has 'states' only
+                indices = [self.world.state._index[_id] for _id in msg.ids]
+                states = np.asarray(msg.states, dtype=float)
+
+        if len(indices):
+            self.world.state.data[0, indices] = states
             self.update_previous_world_state()
+            # only skip the callback of a notification that is actually sent
+            self._skip_next_world_callback = True
             self.world.notify_state_change()
 
+    def _columns_of_schema(self, schema_id: int) -> np.ndarray:
+        """
+        :param schema_id: The id of a received schema.
+        :return: The column in the world state of every column in the schema, or -1 if the free variable doesn't
+            exist in this world.
+        """
+        layout_version = self.world.state.layout_version
+        cached = self._schema_columns.get(schema_id)
+        if cached is not None and cached[0] == layout_version:
+            return cached[1]
+        columns = self._received_schemas[schema_id].columns_in(self.world.state)
+        self._schema_columns[schema_id] = (layout_version, columns)
+        return columns
+
     def world_callback(self):
         """
         Publish the current world state to the ROS topic.
         """
-        changes = self.compute_state_changes()
+        changed_columns = self.compute_changed_columns()
 
-        if not changes:
+        if len(changed_columns) == 0:
             return
 
-        msg = WorldStateUpdate(
-            ids=list(changes.keys()),
-            states=list(changes.values()),
-            meta_data=self.meta_data,
-        )
+        if self.use_binary_messages:
+            self._publish_binary_update(changed_columns)
+        else:
+            ids = self.world.state.keys()
+            states = self.world.state.positions
+            msg = WorldStateUpdate(
+                ids=[ids[i] for i in changed_columns],
+                states=[float(states[i]) for i in changed_columns],
+                meta_data=self.meta_data,
+            )
+            self.publish(msg)
         self.update_previous_world_state()
-        self.publish(msg)
 
-    def compute_state_changes(self) -> Dict[UUID, float]:
+    def _publish_binary_update(self, changed_columns: np.ndarray):
         """
-        Compute and return only the position changes since the last published snapshot.
+        Publishes the changed columns as binary frame, and announces the schema first if necessary.
 
-        Returns a mapping of DOF name to current position for entries whose position
-        differs from the previous snapshot, using a vectorized tolerance-based diff.
+        :param changed_columns: The columns of the world state that changed.
+        """
+        subscription_count = self.binary_publisher.get_subscription_count()
+        if (
+            self._schema_layout_version != self.world.state.layout_version
+            or subscription_count > self._schema_subscription_count
+            or self._updates_since_schema_announcement
+            >= self.schema_announcement_interval
+        ):
+            self._announce_schema()
+        self._schema_subscription_count = subscription_count
+        msg = PackedWorldStateUpdate(
+            schema_id=self._schema_id,
+            indices=changed_columns,
+            states=self.world.state.positions[changed_columns],
+        )
+        self.publish_binary(msg)
+        self._updates_since_schema_announcement += 1
+
+    def _announce_schema(self):
+        """
+        Publishes the current column layout of the world state.
+        A new schema id is only created when the layout changed.
+        """
+        if self._schema_layout_version != self.world.state.layout_version:
+            self._schema_id = uuid4().int >> 64
+            self._own_schema_ids.add(self._schema_id)
+            self._schema_layout_version = self.world.state.layout_version
+        self.publish_binary(
+            WorldStateSchema(schema_id=self._schema_id, ids=self.world.state.keys())
+        )
+        self._updates_since_schema_announcement = 0
+
+    def publish_binary(self, msg: PackedMessage):
+        """
+        Publishes a message as binary frame on the binary topic.
+        """
+        self.binary_publisher.publish(
+            std_msgs.msg.UInt8MultiArray(data=array.array("B", msg.to_bytes()))
+        )
+
+    def compute_changed_columns(self) -> np.ndarray:
+        """
+        Compute the columns of the world state whose position changed since the last published snapshot.
+        If the number of DOFs changed (model update), all columns are returned, such that the other side can resync.
+
+        :return: The indices of the changed columns.
         """
-        ids = self.world.state.keys()  # List[PrefixedName] in column order
         curr = self.world.state.positions  # np.ndarray shape (N,)
         prev = self.previous_world_state_data  # np.ndarray shape (N,)
 
-        # If the number of DOFs changed (model update), send everything once
-        # so the other side can resync, then the snapshot will be updated afterward.
         if prev.shape != curr.shape:
-            return {n: float(v) for n, v in zip(ids, curr)}
+            return np.arange(curr.shape[0])
 
         # Vectorized comparison: O(N) with minimal Python overhead
         changed_mask = ~np.isclose(curr, prev, rtol=1e-8, atol=1e-12, equal_nan=True)
-        if not np.any(changed_mask):
-            return {}
+        return np.nonzero(changed_mask)[0]
+
+    def compute_state_changes(self) -> Dict[UUID, float]:
+        """
+        Compute and return only the position changes since the last published snapshot.
+
+        Returns a mapping of DOF name to current position for entries whose position
+        differs from the previous snapshot, using a vectorized tolerance-based diff.
+        """
+        ids = self.world.state.keys()  # List[PrefixedName] in column order
+        curr = self.world.state.positions  # np.ndarray shape (N,)
+        return {ids[i]: float(curr[i]) for i in self.compute_changed_columns()}
 
-        idx = np.nonzero(changed_mask)[0]
-        return {ids[i]: float(curr[i]) for i in idx}
+    def close(self):
+        if self.binary_subscriber is not None:
+            self.node.destroy_subscription(self.binary_subscriber)
+            self.binary_subscriber = None
+        if self.binary_publisher is not None:
+            self.node.destroy_publisher(self.binary_publisher)
+            self.binary_publisher = None
+        super().close()
 
 
 @dataclass
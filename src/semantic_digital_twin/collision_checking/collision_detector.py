@@ -2,12 +2,25 @@ from __future__ import annotations
 
 import abc
 from dataclasses import dataclass, field
+from functools import cached_property
 from itertools import chain
-from typing_extensions import Tuple, Set, List, Optional, Iterable, TYPE_CHECKING
+from typing_extensions import (
+    Dict,
+    Iterator,
+    Tuple,
+    Set,
+    List,
+    Optional,
+    Iterable,
+    Sequence,
+    Union,
+    TYPE_CHECKING,
+)
 
 import numpy as np
 
 from ..world_description.connections import ActiveConnection
+from ..world_description.degree_of_freedom import DegreeOfFreedom
 from ..world_description.world_entity import Body
 
 if TYPE_CHECKING:
@@ -108,6 +121,105 @@ class CollisionCheck:
         return body_a, body_b
 
 
+@dataclass
+class CollisionMatrix:
+    """
+    The pairs of bodies that are checked for collisions, as boolean upper-triangular mask over body indices.
+    Entry (i, j) with i < j is True, if collisions between the i-th and j-th body are checked.
+    A body is never checked against itself.
+
+    In contrast to a set of `CollisionCheck`s, this representation is built with a few numpy operations, even for
+    worlds with thousands of bodies.
+    Use `collision_checks` to materialize `CollisionCheck`s for the pairs that are actually needed.
+    """
+
+    bodies: List[Body]
+    """
+    The bodies that the rows and columns of the mask refer to.
+    """
+
+    mask: np.ndarray
+    """
+    A boolean N x N matrix, where N is the number of bodies. Only the strict upper triangle is used.
+    """
+
+    distance: float
+    """
+    Minimum distance to check for collisions, for all pairs.
+    """
+
+    _world: World
+    """
+    The world context, used to create collision checks.
+    """
+
+    @cached_property
+    def body_indices(self) -> Dict[Body, int]:
+        """
+        :return: The index of each body in `bodies`.
+        """
+        return {body: index for index, body in enumerate(self.bodies)}
+
+    def pair_indices(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :return: The row and column indices of all checked pairs, with rows < columns.
+        """
+        return np.nonzero(np.triu(self.mask, k=1))
+
+    def disable_pairs(
+        self, body_a_indices: np.ndarray, body_b_indices: np.ndarray
+    ) -> None:
+        """
+        Disables the collision checks of several pairs at once. The order of the bodies in a pair doesn't matter.
+
+        :param body_a_indices: The indices of the first bodies of the pairs.
+        :param body_b_indices: The indices of the second bodies of the pairs.
+        """
+        self.mask[body_a_indices, body_b_indices] = False
+        self.mask[body_b_indices, body_a_indices] = False
+
+    def is_enabled(self, body_a: Body, body_b: Body) -> bool:
+        """
+        :return: True, if collisions between both bodies are checked.
+        """
+        index_a = self.body_indices.get(body_a)
+        index_b = self.body_indices.get(body_b)
+        if index_a is None or index_b is None or index_a == index_b:
+            return False
+        return bool(self.mask[min(index_a, index_b), max(index_a, index_b)])
+
+    def pairs(self) -> Iterator[Tuple[Body, Body]]:
+        """
+        :return: The bodies of all checked pairs.
+        """
+        for index_a, index_b in zip(*self.pair_indices()):
+            yield self.bodies[index_a], self.bodies[index_b]
+
+    def collision_checks(
+        self,
+        body_a_indices: Optional[np.ndarray] = None,
+        body_b_indices: Optional[np.ndarray] = None,
+    ) -> List[CollisionCheck]:
+        """
+        Materializes collision checks, e.g., only for the pairs that pass a broadphase.
+
+        :param body_a_indices: The indices of the first bodies of the pairs, all checked pairs if None.
+        :param body_b_indices: The indices of the second bodies of the pairs, all checked pairs if None.
+        :return: A collision check for each pair.
+        """
+        if body_a_indices is None or body_b_indices is None:
+            body_a_indices, body_b_indices = self.pair_indices()
+        return [
+            CollisionCheck(
+                self.bodies[index_a], self.bodies[index_b], self.distance, self._world
+            )
+            for index_a, index_b in zip(body_a_indices, body_b_indices)
+        ]
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(np.triu(self.mask, k=1)))
+
+
 @dataclass
 class Collision:
     contact_distance: float
@@ -154,6 +266,33 @@ class Collision:
         return self.body_a == other.body_a and self.body_b == other.body_b
 
 
+@dataclass
+class TrajectoryCollision:
+    """
+    The first collision along a trajectory.
+    """
+
+    segment_index: int
+    """
+    The collision happens between the configurations with index `segment_index` and `segment_index + 1`.
+    """
+
+    segment_fraction: float
+    """
+    Where in the segment the collision happens, 0 is at the start and 1 at the end of the segment.
+    """
+
+    configuration: np.ndarray
+    """
+    The interpolated configuration in which the collision was found, in the order of the world state.
+    """
+
+    collision: Collision
+    """
+    The colliding pair of bodies, with contact points in the interpolated configuration.
+    """
+
+
 @dataclass
 class CollisionDetector(abc.ABC):
     """
@@ -176,15 +315,39 @@ class CollisionDetector(abc.ABC):
 
     @abc.abstractmethod
     def check_collisions(
-        self, collision_matrix: Optional[Iterable[CollisionCheck]] = None
+        self,
+        collision_matrix: Optional[
+            Union[Iterable[CollisionCheck], CollisionMatrix]
+        ] = None,
     ) -> List[Collision]:
         """
         Computes the collisions for all checks in the collision matrix.
         If collision_matrix is None, checks all collisions.
-        :param collision_matrix:
+        :param collision_matrix: Either collision checks, or a mask over pairs of bodies.
         :return: A list of detected collisions.
         """
 
+    @abc.abstractmethod
+    def check_trajectory(
+        self,
+        configurations: np.ndarray,
+        collision_matrix: Union[Iterable[CollisionCheck], CollisionMatrix],
+        degrees_of_freedom: Optional[Sequence[DegreeOfFreedom]] = None,
+        resolution: float = 0.01,
+    ) -> Optional[TrajectoryCollision]:
+        """
+        Checks a trajectory for collisions, including the motion between its configurations, which are linearly
+        interpolated in joint space. The state of the world is not changed.
+
+        :param configurations: An N x M array, each row is one configuration of the trajectory.
+        :param collision_matrix: The pairs of bodies to check.
+        :param degrees_of_freedom: The M degrees of freedom of the columns of `configurations`.
+            All other degrees of freedom keep their current position.
+            If None, the columns are all degrees of freedom in the order of the world state.
+        :param resolution: The maximum distance that any point of a body moves between two checked configurations.
+        :return: The first collision along the trajectory, or None if it is collision free.
+        """
+
     @abc.abstractmethod
     def reset_cache(self):
         """
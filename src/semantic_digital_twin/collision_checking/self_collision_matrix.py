@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import Enum
+
+import numpy as np
+from lxml import etree
+from typing_extensions import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from .collision_detector import CollisionMatrix
+from .trimesh_collision_detector import TrimeshCollisionDetector
+from ..world_description.connections import ActiveConnection
+from ..world_description.degree_of_freedom import DegreeOfFreedom
+from ..world_description.world_entity import Body
+
+if TYPE_CHECKING:
+    from ..robots.abstract_robot import AbstractRobot
+
+
+class DisableCollisionReason(Enum):
+    """
+    Why collisions between two bodies of a robot don't have to be checked.
+    The values are the reasons used in SRDF files.
+    """
+
+    ADJACENT = "Adjacent"
+    """
+    The bodies are directly connected, ignoring bodies without collision geometry in between.
+    """
+
+    DEFAULT = "Default"
+    """
+    The bodies collide in the configuration the robot was in when the matrix was computed.
+    """
+
+    ALMOST_ALWAYS = "AlmostAlways"
+    """
+    The bodies collided in almost all sampled configurations.
+    """
+
+    NEVER = "Never"
+    """
+    The bodies didn't collide in any sampled configuration.
+    """
+
+
+@dataclass
+class SelfCollisionMatrixGenerator:
+    """
+    Computes which pairs of bodies of a robot never have to be checked for self collisions, by sampling random
+    configurations of the robot, and saves them as SRDF, which can be loaded with `World.load_collision_srdf`.
+
+    This is meant to be run once per robot, instead of relying on the rules of the `CollisionPairManager`, which
+    only disable pairs that can't move relative to each other.
+    The more samples are used, the less likely a pair is classified as never colliding by mistake.
+    """
+
+    robot: AbstractRobot
+    """
+    The robot to compute the self collision matrix for.
+    """
+
+    number_of_samples: int = 1000
+    """
+    The number of random configurations that are checked for collisions.
+    """
+
+    almost_always_threshold: float = 0.95
+    """
+    Pairs that collide in at least this fraction of the samples are disabled.
+    """
+
+    seed: Optional[int] = None
+    """
+    The seed of the random number generator for the configurations.
+    """
+
+    disabled_collision_pairs: Dict[Tuple[Body, Body], DisableCollisionReason] = field(
+        default_factory=dict, init=False
+    )
+    """
+    The result of `compute_disabled_collision_pairs`.
+    """
+
+    def compute_disabled_collision_pairs(
+        self,
+    ) -> Dict[Tuple[Body, Body], DisableCollisionReason]:
+        """
+        Classifies the pairs of bodies with enabled collision of the robot.
+        A pair gets the first reason that applies, in the order of `DisableCollisionReason`.
+        The state of the world is restored afterward.
+
+        :return: The reason for every pair that can be disabled. Pairs that are not included have to be checked.
+        """
+        world = self.robot._world
+        bodies = sorted(self.robot.bodies_with_enabled_collision, key=lambda b: b.id)
+        number_of_bodies = len(bodies)
+        collision_matrix = CollisionMatrix(
+            bodies=bodies,
+            mask=np.triu(
+                np.ones((number_of_bodies, number_of_bodies), dtype=bool), k=1
+            ),
+            distance=0.0,
+            _world=world,
+        )
+        self.disabled_collision_pairs = {}
+
+        for body_a, body_b in self._compute_adjacent_pairs(bodies):
+            self._disable(
+                collision_matrix, body_a, body_b, DisableCollisionReason.ADJACENT
+            )
+
+        detector = TrimeshCollisionDetector(world)
+        with world.reset_state_context():
+            for collision in detector.check_collisions(collision_matrix):
+                self._disable(
+                    collision_matrix,
+                    collision.body_a,
+                    collision.body_b,
+                    DisableCollisionReason.DEFAULT,
+                )
+
+            dofs = self._sampled_degrees_of_freedom()
+            columns = world.state.get_columns(dofs)
+            lower_limits, upper_limits = self._position_limits(dofs)
+            rng = np.random.default_rng(self.seed)
+            collision_counts = np.zeros((number_of_bodies, number_of_bodies), dtype=int)
+            for _ in range(self.number_of_samples):
+                world.state.set_positions(
+                    columns, rng.uniform(lower_limits, upper_limits)
+                )
+                world.notify_state_change()
+                for collision in detector.check_collisions(collision_matrix):
+                    index_a = collision_matrix.body_indices[collision.body_a]
+                    index_b = collision_matrix.body_indices[collision.body_b]
+                    collision_counts[min(index_a, index_b), max(index_a, index_b)] += 1
+
+        almost_always = collision_matrix.mask & (
+            collision_counts >= self.almost_always_threshold * self.number_of_samples
+        )
+        never = collision_matrix.mask & (collision_counts == 0)
+        for reason, mask in (
+            (DisableCollisionReason.ALMOST_ALWAYS, almost_always),
+            (DisableCollisionReason.NEVER, never),
+        ):
+            for index_a, index_b in zip(*np.nonzero(mask)):
+                self.disabled_collision_pairs[bodies[index_a], bodies[index_b]] = reason
+        return self.disabled_collision_pairs
+
+    def save_srdf(self, file_path: str) -> None:
+        """
+        Writes the disabled collision pairs as `disable_self_collision` elements of an SRDF file.
+        Computes them first, if `compute_disabled_collision_pairs` wasn't called yet.
+
+        :param file_path: The path of the SRDF file.
+        """
+        if not self.disabled_collision_pairs:
+            self.compute_disabled_collision_pairs()
+        srdf_root = etree.Element("robot", name=self.robot.name.name)
+        # sorted by name, such that the file doesn't change when it is generated again
+        link_names_and_reasons = sorted(
+            (*sorted((body_a.name.name, body_b.name.name)), reason.value)
+            for (body_a, body_b), reason in self.disabled_collision_pairs.items()
+        )
+        for link1, link2, reason in link_names_and_reasons:
+            etree.SubElement(
+                srdf_root,
+                "disable_self_collision",
+                link1=link1,
+                link2=link2,
+                reason=reason,
+            )
+        etree.ElementTree(srdf_root).write(
+            file_path, pretty_print=True, xml_declaration=True, encoding="UTF-8"
+        )
+
+    def _disable(
+        self,
+        collision_matrix: CollisionMatrix,
+        body_a: Body,
+        body_b: Body,
+        reason: DisableCollisionReason,
+    ) -> None:
+        index_a = collision_matrix.body_indices[body_a]
+        index_b = collision_matrix.body_indices[body_b]
+        collision_matrix.disable_pairs(np.array([index_a]), np.array([index_b]))
+        pair = (body_a, body_b) if index_a < index_b else (body_b, body_a)
+        self.disabled_collision_pairs[pair] = reason
+
+    def _compute_adjacent_pairs(self, bodies: List[Body]) -> List[Tuple[Body, Body]]:
+        """
+        :param bodies: The bodies with enabled collision of the robot.
+        :return: Each body paired with its closest ancestor that is one of `bodies`, if it has one.
+        """
+        world = self.robot._world
+        body_set = set(bodies)
+        adjacent_pairs = []
+        for body in bodies:
+            parent = world.compute_parent_kinematic_structure_entity(body)
+            while parent is not None and parent not in body_set:
+                parent = world.compute_parent_kinematic_structure_entity(parent)
+            if parent is not None:
+                adjacent_pairs.append((parent, body))
+        return adjacent_pairs
+
+    def _sampled_degrees_of_freedom(self) -> List[DegreeOfFreedom]:
+        """
+        :return: The degrees of freedom that move the bodies of the robot relative to each other.
+        """
+        dofs = {
+            dof: None
+            for connection in self.robot.connections
+            if isinstance(connection, ActiveConnection)
+            for dof in connection.active_dofs
+        }
+        return list(dofs)
+
+    @staticmethod
+    def _position_limits(
+        dofs: List[DegreeOfFreedom],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :param dofs: The degrees of freedom to sample.
+        :return: The lower and upper position limits of the degrees of freedom.
+            Missing limits, e.g., of continuous joints, are replaced by -pi and pi.
+        """
+        lower_limits = np.array(
+            [
+                (
+                    -np.pi
+                    if dof.lower_limits.position is None
+                    else dof.lower_limits.position
+                )
+                for dof in dofs
+            ],
+            dtype=float,
+        )
+        upper_limits = np.array(
+            [
+                (
+                    np.pi
+                    if dof.upper_limits.position is None
+                    else dof.upper_limits.position
+                )
+                for dof in dofs
+            ],
+            dtype=float,
+        )
+        return lower_limits, upper_limits
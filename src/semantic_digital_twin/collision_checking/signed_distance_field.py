@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass, field
+
+import numpy as np
+from scipy.ndimage import binary_fill_holes, distance_transform_edt, map_coordinates
+from trimesh import Trimesh
+from typing_extensions import Dict, Optional, Self, Tuple
+
+from ..world_description.world_entity import Body
+
+
+def default_cache_directory() -> str:
+    """
+    :return: The directory in which signed distance fields are cached, inside `$XDG_CACHE_HOME` or `~/.cache`.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "semantic_digital_twin", "signed_distance_fields")
+
+
+def sample_surface_grid(mesh: Trimesh, spacing: float) -> np.ndarray:
+    """
+    Samples points on a regular grid on every triangle of a mesh, in contrast to `trimesh.sample`, which samples
+    randomly and can leave gaps.
+
+    :param mesh: The mesh to sample.
+    :param spacing: The maximum distance of any point on the surface from its closest sample.
+    :return: An N x 3 array with the sampled points, including all vertices.
+    """
+    triangles = mesh.triangles
+    longest_edges = np.linalg.norm(
+        triangles - np.roll(triangles, 1, axis=1), axis=2
+    ).max(axis=1, initial=0)
+    subdivisions = np.maximum(np.ceil(longest_edges / spacing), 1).astype(int)
+    points = [mesh.vertices]
+    for number_of_subdivisions in np.unique(subdivisions):
+        steps = np.arange(number_of_subdivisions + 1)
+        i, j = np.meshgrid(steps, steps, indexing="ij")
+        in_triangle = i + j <= number_of_subdivisions
+        barycentric = np.stack([i[in_triangle], j[in_triangle]], axis=1)
+        barycentric = barycentric / number_of_subdivisions
+        selected = triangles[subdivisions == number_of_subdivisions]
+        edges = selected[:, 1:] - selected[:, :1]
+        points.append(
+            (
+                selected[:, None, 0] + np.einsum("kj,fjd->fkd", barycentric, edges)
+            ).reshape(-1, 3)
+        )
+    return np.concatenate(points)
+
+
+@dataclass
+class SignedDistanceField:
+    """
+    The signed distance to the surface of a mesh, sampled on a regular grid of voxel centers in the frame of the
+    mesh. Distances are negative inside the mesh, if it is closed, and are trilinearly interpolated between the
+    voxel centers.
+
+    The grid is computed from a voxelization of the surface with an Euclidean distance transform, which is much
+    faster than exact point-to-mesh queries for every voxel.
+    The error of an interpolated distance is bounded by `max_error`.
+    """
+
+    lower_corner: np.ndarray
+    """
+    The center of the voxel with index (0, 0, 0).
+    """
+
+    voxel_size: float
+    """
+    The edge length of a voxel.
+    """
+
+    distances: np.ndarray
+    """
+    The signed distances at the voxel centers, as X x Y x Z array.
+    """
+
+    @classmethod
+    def from_mesh(cls, mesh: Trimesh, voxel_size: float, padding: float) -> Self:
+        """
+        :param mesh: The mesh to compute the signed distance field of.
+        :param voxel_size: The edge length of a voxel.
+        :param padding: How far the grid extends beyond the bounding box of the mesh.
+        :return: The signed distance field of the mesh.
+        """
+        lower_corner = mesh.bounds[0] - padding
+        shape = (
+            np.ceil((mesh.bounds[1] + padding - lower_corner) / voxel_size).astype(int)
+            + 1
+        )
+        surface_points = sample_surface_grid(mesh, voxel_size / 2)
+        surface_voxels = np.zeros(shape, dtype=bool)
+        surface_voxels[
+            tuple(np.round((surface_points - lower_corner) / voxel_size).astype(int).T)
+        ] = True
+        inside = binary_fill_holes(surface_voxels) & ~surface_voxels
+        distances = distance_transform_edt(~surface_voxels, sampling=voxel_size)
+        distances[inside] *= -1
+        return cls(
+            lower_corner=lower_corner,
+            voxel_size=voxel_size,
+            distances=distances.astype(np.float32),
+        )
+
+    @classmethod
+    def from_mesh_cached(
+        cls,
+        mesh: Trimesh,
+        voxel_size: float,
+        padding: float,
+        cache_directory: Optional[str] = None,
+    ) -> Self:
+        """
+        Like `from_mesh`, but loads the signed distance field from `cache_directory`, if it was already computed
+        for a mesh with the same vertices and faces, and saves it there otherwise.
+
+        :param mesh: The mesh to compute the signed distance field of.
+        :param voxel_size: The edge length of a voxel.
+        :param padding: How far the grid extends beyond the bounding box of the mesh.
+        :param cache_directory: The directory of the cached files, nothing is cached if None.
+        :return: The signed distance field of the mesh.
+        """
+        if cache_directory is None:
+            return cls.from_mesh(mesh, voxel_size, padding)
+        file_path = os.path.join(
+            cache_directory, f"{cls.content_hash(mesh, voxel_size, padding)}.npz"
+        )
+        if os.path.exists(file_path):
+            return cls.load(file_path)
+        signed_distance_field = cls.from_mesh(mesh, voxel_size, padding)
+        os.makedirs(cache_directory, exist_ok=True)
+        signed_distance_field.save(file_path)
+        return signed_distance_field
+
+    @staticmethod
+    def content_hash(mesh: Trimesh, voxel_size: float, padding: float) -> str:
+        """
+        :return: A hash of the geometry of the mesh and the grid parameters, which identifies a signed distance
+            field independently of the name of the body or the file the mesh was loaded from.
+        """
+        content_hash = hashlib.sha256()
+        content_hash.update(np.ascontiguousarray(mesh.vertices, dtype=np.float64))
+        content_hash.update(np.ascontiguousarray(mesh.faces, dtype=np.int64))
+        content_hash.update(np.array([voxel_size, padding], dtype=np.float64))
+        return content_hash.hexdigest()
+
+    def save(self, file_path: str) -> None:
+        # write to a temporary file first, such that processes that share the cache never read half-written files
+        temporary_file_path = f"{file_path}.{os.getpid()}.tmp.npz"
+        np.savez_compressed(
+            temporary_file_path,
+            lower_corner=self.lower_corner,
+            voxel_size=self.voxel_size,
+            distances=self.distances,
+        )
+        os.replace(temporary_file_path, file_path)
+
+    @classmethod
+    def load(cls, file_path: str) -> Self:
+        with np.load(file_path) as data:
+            return cls(
+                lower_corner=data["lower_corner"],
+                voxel_size=float(data["voxel_size"]),
+                distances=data["distances"],
+            )
+
+    @property
+    def max_error(self) -> float:
+        """
+        An upper bound of the difference between an interpolated and the exact distance, for closed meshes and
+        points inside the grid.
+        The distances at the voxel centers are off by at most half a voxel diagonal plus the spacing of the
+        surface samples, which is half a voxel, and the interpolation adds at most another half voxel diagonal.
+        """
+        return (0.5 + np.sqrt(3)) * self.voxel_size
+
+    def distance(self, points: np.ndarray) -> np.ndarray:
+        """
+        :param points: An N x 3 array of points in the frame of the mesh.
+        :return: The signed distance of each point to the surface of the mesh.
+            For points outside the grid, the distance to the grid is added to the distance at its closest point.
+        """
+        voxel_coordinates = (points - self.lower_corner) / self.voxel_size
+        clipped_coordinates = np.clip(
+            voxel_coordinates, 0, np.array(self.distances.shape) - 1
+        )
+        distance_to_grid = np.linalg.norm(
+            voxel_coordinates - clipped_coordinates, axis=1
+        )
+        return (
+            map_coordinates(self.distances, clipped_coordinates.T, order=1)
+            + distance_to_grid * self.voxel_size
+        )
+
+    def closest_points(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Approximates the closest points on the surface by following the gradient of the signed distance field.
+        Points outside the grid use the closest point of their projection onto the grid.
+
+        :param points: An N x 3 array of points in the frame of the mesh.
+        :return: The closest points on the surface of the mesh, and the signed distance of each point.
+        """
+        grid_points = np.clip(
+            points,
+            self.lower_corner,
+            self.lower_corner + (np.array(self.distances.shape) - 1) * self.voxel_size,
+        )
+        distances = self.distance(grid_points)
+        offsets = np.eye(3) * self.voxel_size / 2
+        gradients = np.stack(
+            [
+                self.distance(grid_points + offset)
+                - self.distance(grid_points - offset)
+                for offset in offsets
+            ],
+            axis=1,
+        )
+        gradient_norms = np.linalg.norm(gradients, axis=1, keepdims=True)
+        directions = np.divide(
+            gradients,
+            gradient_norms,
+            out=np.zeros_like(gradients),
+            where=gradient_norms > 0,
+        )
+        closest_points = grid_points - directions * distances[:, None]
+        is_outside_grid = np.any(points != grid_points, axis=1)
+        distances[is_outside_grid] = np.linalg.norm(
+            points[is_outside_grid] - closest_points[is_outside_grid], axis=1
+        )
+        return closest_points, distances
+
+
+@dataclass
+class SignedDistanceFieldCache:
+    """
+    Signed distance fields of the collision geometry of bodies, and points on the surfaces of the bodies that are
+    checked against them.
+    Meant for static bodies of the environment, like walls and furniture, whose distances are otherwise computed
+    from their meshes in every query, although they never move.
+
+    The distance between a body and a body with a signed distance field is the minimum of the field over points
+    sampled on the surface of the body, and is off by at most `max_error`.
+    The fields are computed once per body and cached on disk, keyed by the content of the collision meshes, such
+    that they are shared by all worlds with the same environment.
+    Call `clear` after changing the collision geometry of a body.
+    """
+
+    voxel_size: float = 0.02
+    """
+    The edge length of the voxels of the signed distance fields.
+    """
+
+    padding: float = 0.1
+    """
+    How far the signed distance fields extend beyond the bounding box of a body.
+    Should be at least the largest distance threshold that is queried.
+    """
+
+    cache_directory: Optional[str] = field(default_factory=default_cache_directory)
+    """
+    The directory in which the signed distance fields are cached, nothing is written to disk if None.
+    """
+
+    _fields: Dict[Body, SignedDistanceField] = field(default_factory=dict, init=False)
+    """
+    The signed distance field of each body, in the frame of the body.
+    """
+
+    _surface_points: Dict[Body, np.ndarray] = field(default_factory=dict, init=False)
+    """
+    Points on the surface of the collision geometry of each body, in the frame of the body.
+    """
+
+    @property
+    def max_error(self) -> float:
+        """
+        An upper bound of the error of `compute_distance`: the error of the signed distance field plus the
+        spacing of the surface samples.
+        """
+        return (1 + np.sqrt(3)) * self.voxel_size
+
+    def signed_distance_field(self, body: Body) -> SignedDistanceField:
+        """
+        :param body: A body with collision geometry.
+        :return: The signed distance field of the collision geometry of the body, in the frame of the body.
+        """
+        try:
+            return self._fields[body]
+        except KeyError:
+            signed_distance_field = self._fields[body] = (
+                SignedDistanceField.from_mesh_cached(
+                    body.collision.combined_mesh,
+                    self.voxel_size,
+                    self.padding,
+                    self.cache_directory,
+                )
+            )
+            return signed_distance_field
+
+    def surface_points(self, body: Body) -> np.ndarray:
+        """
+        :param body: A body with collision geometry.
+        :return: Points on the surface of the collision geometry of the body, in the frame of the body.
+        """
+        try:
+            return self._surface_points[body]
+        except KeyError:
+            surface_points = self._surface_points[body] = np.unique(
+                sample_surface_grid(body.collision.combined_mesh, self.voxel_size / 2),
+                axis=0,
+            )
+            return surface_points
+
+    def compute_distance(
+        self, field_body: Body, other_body: Body, field_T_other: np.ndarray
+    ) -> Tuple[float, np.ndarray, np.ndarray]:
+        """
+        Computes the distance between two bodies from the signed distance field of the first one.
+
+        :param field_body: The body whose signed distance field is used, typically a static one.
+        :param other_body: The body whose surface points are looked up in the signed distance field.
+        :param field_T_other: The pose of `other_body` relative to `field_body`.
+        :return: The signed distance, the closest point on `field_body` and the closest point on `other_body`,
+            both relative to `field_body`.
+        """
+        field_P_points = (
+            self.surface_points(other_body) @ field_T_other[:3, :3].T
+            + field_T_other[:3, 3]
+        )
+        signed_distance_field = self.signed_distance_field(field_body)
+        closest_index = np.argmin(signed_distance_field.distance(field_P_points))
+        closest_points, distances = signed_distance_field.closest_points(
+            field_P_points[closest_index : closest_index + 1]
+        )
+        return float(distances[0]), closest_points[0], field_P_points[closest_index]
+
+    def clear(self) -> None:
+        """
+        Drops the signed distance fields and surface points of all bodies, but not the files on disk.
+        """
+        self._fields.clear()
+        self._surface_points.clear()
@@ -1,11 +1,32 @@
 from dataclasses import dataclass, field
 from itertools import combinations
-from typing_extensions import Optional, Set, List, Dict, Iterable
+from typing_extensions import (
+    Callable,
+    Optional,
+    Set,
+    List,
+    Dict,
+    Iterable,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import fcl
+import numpy as np
 from trimesh.collision import CollisionManager, mesh_to_BVH
+from trimesh.util import concatenate
 
-from .collision_detector import CollisionDetector, CollisionCheck, Collision
+from .collision_detector import (
+    CollisionDetector,
+    CollisionCheck,
+    Collision,
+    CollisionMatrix,
+    TrajectoryCollision,
+)
+from .signed_distance_field import SignedDistanceFieldCache
+from ..world_description.degree_of_freedom import DegreeOfFreedom
+from ..world_description.geometry import Box, Cylinder, Mesh, Shape, Sphere
 from ..world_description.world_entity import Body
 
 
@@ -25,11 +46,107 @@ class TrimeshCollisionDetector(CollisionDetector):
     """
     Last synced model version of the world
     """
-    _collision_objects: Dict[Body, fcl.CollisionObject] = field(
+    _collision_objects: Dict[Body, List[fcl.CollisionObject]] = field(
         default_factory=dict, init=False
     )
     """
-    The FCL collision objects for each body in the world
+    The FCL collision objects for each body in the world.
+    Boxes, spheres and cylinders are native FCL primitives, all meshes of a body are combined into one BVH.
+    """
+    _collision_object_origins: Dict[Body, np.ndarray] = field(
+        default_factory=dict, init=False
+    )
+    """
+    The poses of the collision objects of each body relative to the body, stacked into an N x 4 x 4 array.
+    """
+    _bodies: List[Body] = field(default_factory=list, init=False)
+    """
+    All bodies with collision objects, sorted by id. If the root of the world has collisions, it comes last.
+    """
+    _body_indices: Dict[Body, int] = field(default_factory=dict, init=False)
+    """
+    The index of each body in `_bodies`, which is also its row in the pose and bounding box arrays.
+    """
+    _forward_kinematics_indices: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=int), init=False
+    )
+    """
+    The index of each body in `_bodies` in the forward kinematics of all kinematic structure entities.
+    The poses are gathered with these indices, instead of using the forward kinematics of all collision bodies,
+    because those are only updated when the world model changes, not when a collision config changes.
+    """
+    _map_T_bodies: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 4, 4)), init=False
+    )
+    """
+    The poses of all bodies in `_bodies` the collision objects were last moved to.
+    """
+    _poses_are_outdated: bool = field(default=True, init=False)
+    """
+    True, if the collision objects of all bodies have to be moved on the next state synchronization,
+    e.g., because bodies were added.
+    """
+    _local_aabb_centers: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 3)), init=False
+    )
+    """
+    The centers of the axis-aligned bounding boxes of the collision objects in their body frame.
+    """
+    _local_aabb_half_extents: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 3)), init=False
+    )
+    """
+    The half extents of the axis-aligned bounding boxes of the collision objects in their body frame.
+    """
+    _aabb_lower: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 3)), init=False
+    )
+    """
+    The lower corners of the axis-aligned bounding boxes of the collision objects in the world frame.
+    """
+    _aabb_upper: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 3)), init=False
+    )
+    """
+    The upper corners of the axis-aligned bounding boxes of the collision objects in the world frame.
+    """
+    _body_radii: np.ndarray = field(default_factory=lambda: np.empty(0), init=False)
+    """
+    An upper bound of the distance of any point of the collision objects of a body from the origin of the body.
+    """
+    use_temporal_coherence: bool = True
+    """
+    If True, pairs are skipped, if their last computed distance proves that they are still further apart than their
+    threshold, despite the motion of both bodies since then.
+    """
+    signed_distance_fields: Optional[SignedDistanceFieldCache] = None
+    """
+    If set, the distance between a static and a moving body is computed from the signed distance field of the
+    static body, instead of its mesh. Its error is bounded by `SignedDistanceFieldCache.max_error`.
+    """
+    _is_static: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=bool), init=False
+    )
+    """
+    True for bodies in `_bodies` whose pose doesn't depend on any degree of freedom.
+    """
+    _travelled_distances: np.ndarray = field(
+        default_factory=lambda: np.empty(0), init=False
+    )
+    """
+    An upper bound of the distance any point of a body travelled, summed over all state synchronizations.
+    """
+    _cached_distances: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 0)), init=False
+    )
+    """
+    The last distance computed by `check_collisions` between the i-th and j-th body of `_bodies`, or -inf.
+    """
+    _cached_travelled_distances: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 0)), init=False
+    )
+    """
+    The sum of the travelled distances of the i-th and j-th body, when their distance was cached.
     """
 
     def sync_world_model(self) -> None:
@@ -42,40 +159,261 @@ class TrimeshCollisionDetector(CollisionDetector):
             self._collision_objects.keys()
         )
         for body in bodies_to_be_added:
-            self._collision_objects[body] = fcl.CollisionObject(
-                mesh_to_BVH(body.collision.combined_mesh),
-                fcl.Transform(
-                    body.global_pose.to_np()[:3, :3], body.global_pose.to_np()[:3, 3]
-                ),
-            )
+            collision_objects, origins = self._create_collision_objects(body)
+            self._collision_objects[body] = collision_objects
+            self._collision_object_origins[body] = origins
         bodies_to_be_removed = set(self._collision_objects.keys()) - set(
             self._world.bodies_with_enabled_collision
         )
         for body in bodies_to_be_removed:
             del self._collision_objects[body]
+            del self._collision_object_origins[body]
+        self._sync_broadphase_model()
+        self._last_synced_model = self._world.get_world_model_manager().version
+
+    @staticmethod
+    def _create_collision_objects(
+        body: Body,
+    ) -> Tuple[List[fcl.CollisionObject], np.ndarray]:
+        """
+        Creates the FCL collision objects for the collision shapes of a body.
+        Boxes, spheres and cylinders are mapped to the analytic FCL primitives, which are much faster to query than
+        meshes. Only meshes are turned into a BVH, which is shared by all meshes of the body.
+
+        :param body: The body to create the collision objects for.
+        :return: The collision objects, and their poses relative to the body as N x 4 x 4 array.
+        """
+        collision_objects = []
+        origins = []
+        meshes = []
+        for shape in body.collision:
+            body_T_shape = shape.origin.to_np()
+            match shape:
+                case Box():
+                    geometry = fcl.Box(shape.scale.x, shape.scale.y, shape.scale.z)
+                case Sphere():
+                    geometry = fcl.Sphere(shape.radius)
+                case Cylinder():
+                    geometry = fcl.Cylinder(shape.width / 2, shape.height)
+                case _:
+                    mesh = shape.mesh.copy()
+                    mesh.apply_transform(body_T_shape)
+                    meshes.append(mesh)
+                    continue
+            collision_objects.append(fcl.CollisionObject(geometry))
+            origins.append(body_T_shape)
+        if meshes:
+            collision_objects.append(
+                fcl.CollisionObject(mesh_to_BVH(concatenate(meshes)))
+            )
+            origins.append(np.eye(4))
+        return collision_objects, np.array(origins).reshape(-1, 4, 4)
+
+    def _sync_broadphase_model(self) -> None:
+        """
+        Orders the bodies, looks up their forward kinematics and computes their local bounding boxes.
+        """
+        self._bodies = sorted(
+            (body for body in self._collision_objects if body != self._world.root),
+            key=lambda body: body.id,
+        )
+        if self._world.root in self._collision_objects:
+            self._bodies.append(self._world.root)
+        self._body_indices = {body: index for index, body in enumerate(self._bodies)}
+        self._forward_kinematics_indices = (
+            self._world._forward_kinematic_manager._entity_indices(self._bodies)
+        )
+        self._map_T_bodies = np.tile(np.eye(4), (len(self._bodies), 1, 1))
+        self._poses_are_outdated = True
+
+        local_bounds = np.array(
+            [self._local_bounds(body) for body in self._bodies]
+        ).reshape(-1, 2, 3)
+        self._local_aabb_centers = local_bounds.mean(axis=1)
+        self._local_aabb_half_extents = (local_bounds[:, 1] - local_bounds[:, 0]) / 2
+        self._aabb_lower = np.empty_like(self._local_aabb_centers)
+        self._aabb_upper = np.empty_like(self._local_aabb_centers)
+        self._body_radii = np.linalg.norm(
+            self._local_aabb_centers, axis=1
+        ) + np.linalg.norm(self._local_aabb_half_extents, axis=1)
+        static_entities = set(self._world.static_kinematic_structure_entities)
+        self._is_static = np.array(
+            [body in static_entities for body in self._bodies], dtype=bool
+        )
+        self._travelled_distances = np.zeros(len(self._bodies))
+        self.reset_cache()
+
+    @staticmethod
+    def _local_bounds(body: Body) -> np.ndarray:
+        """
+        :param body: A body with collision shapes.
+        :return: The lower and upper corner of the axis-aligned bounding box of all collision shapes of the body,
+            in the body frame, as 2 x 3 array.
+        """
+        lower_corners = []
+        upper_corners = []
+        for shape in body.collision:
+            body_T_shape = shape.origin.to_np()
+            match shape:
+                case Mesh():
+                    shape_bounds = shape.mesh.bounds
+                case _:
+                    bounding_box = shape.local_frame_bounding_box
+                    shape_bounds = np.array(
+                        [
+                            [
+                                bounding_box.min_x,
+                                bounding_box.min_y,
+                                bounding_box.min_z,
+                            ],
+                            [
+                                bounding_box.max_x,
+                                bounding_box.max_y,
+                                bounding_box.max_z,
+                            ],
+                        ]
+                    )
+            center = (
+                body_T_shape[:3, :3] @ shape_bounds.mean(axis=0) + body_T_shape[:3, 3]
+            )
+            half_extents = np.abs(body_T_shape[:3, :3]) @ (
+                (shape_bounds[1] - shape_bounds[0]) / 2
+            )
+            lower_corners.append(center - half_extents)
+            upper_corners.append(center + half_extents)
+        return np.array([np.min(lower_corners, axis=0), np.max(upper_corners, axis=0)])
 
     def sync_world_state(self) -> None:
         """
-        Synchronize the collision checker with the current world state
+        Synchronize the collision checker with the current world state.
+        The poses are taken from the compiled forward kinematics of all bodies, and only the collision objects of
+        bodies whose pose changed since the last synchronization are moved.
         """
-        if self._last_synced_state == self._world.state.version:
+        if (
+            self._last_synced_state == self._world.state.version
+            and not self._poses_are_outdated
+        ):
             return
-        for body, coll_obj in self._collision_objects.items():
-            coll_obj.setTransform(
-                fcl.Transform(
-                    body.global_pose.to_np()[:3, :3], body.global_pose.to_np()[:3, 3]
-                )
+        fk_manager = self._world._forward_kinematic_manager
+        map_T_bodies = fk_manager.forward_kinematics_for_all_bodies.reshape(-1, 4, 4)[
+            self._forward_kinematics_indices
+        ]
+        if self._poses_are_outdated:
+            changed_bodies = np.arange(len(self._bodies))
+        else:
+            changed_bodies = np.flatnonzero(
+                np.any(map_T_bodies != self._map_T_bodies, axis=(1, 2))
             )
+        self._travelled_distances[changed_bodies] += self._motion_bounds(
+            np.stack(
+                [self._map_T_bodies[changed_bodies], map_T_bodies[changed_bodies]]
+            ),
+            self._body_radii[changed_bodies],
+        )[0]
+        self._map_T_bodies = map_T_bodies
+
+        for body_index in changed_bodies:
+            self._move_collision_objects(body_index, self._map_T_bodies[body_index])
+        self._sync_broadphase_state(changed_bodies)
+        self._poses_are_outdated = False
+        self._last_synced_state = self._world.state.version
+
+    def _move_collision_objects(self, body_index: int, map_T_body: np.ndarray) -> None:
+        """
+        Moves the collision objects of a body.
+
+        :param body_index: The index of the body in `_bodies`.
+        :param map_T_body: The new pose of the body.
+        """
+        body = self._bodies[body_index]
+        map_T_objects = map_T_body @ self._collision_object_origins[body]
+        for collision_object, map_T_object in zip(
+            self._collision_objects[body], map_T_objects
+        ):
+            collision_object.setTransform(
+                fcl.Transform(map_T_object[:3, :3], map_T_object[:3, 3])
+            )
+
+    def _sync_broadphase_state(self, changed_bodies: np.ndarray) -> None:
+        """
+        Moves the bounding boxes of bodies to their current poses.
+
+        :param changed_bodies: The indices of the bodies whose pose changed.
+        """
+        (
+            self._aabb_lower[changed_bodies],
+            self._aabb_upper[changed_bodies],
+        ) = self._compute_bounding_boxes(
+            self._map_T_bodies[changed_bodies], changed_bodies
+        )
+
+    def _compute_bounding_boxes(
+        self, map_T_bodies: np.ndarray, body_indices: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the axis-aligned bounding boxes of bodies in the world frame.
+
+        :param map_T_bodies: An ... x N x 4 x 4 array with poses of the bodies.
+        :param body_indices: The N indices of the bodies in `_bodies`.
+        :return: The lower and upper corners of the bounding boxes, as ... x N x 3 arrays.
+        """
+        map_R_bodies = map_T_bodies[..., :3, :3]
+        centers = (
+            np.einsum(
+                "...ij,...j->...i", map_R_bodies, self._local_aabb_centers[body_indices]
+            )
+            + map_T_bodies[..., :3, 3]
+        )
+        half_extents = np.einsum(
+            "...ij,...j->...i",
+            np.abs(map_R_bodies),
+            self._local_aabb_half_extents[body_indices],
+        )
+        return centers - half_extents, centers + half_extents
+
+    def _broadphase(
+        self,
+        body_a_indices: np.ndarray,
+        body_b_indices: np.ndarray,
+        distances: np.ndarray,
+        aabb_lower: Optional[np.ndarray] = None,
+        aabb_upper: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Computes a lower bound of the distance between the bodies of each pair from their bounding boxes.
+
+        :param body_a_indices: The rows of the first bodies of the pairs in the bounding box arrays.
+        :param body_b_indices: The rows of the second bodies of the pairs in the bounding box arrays.
+        :param distances: The distance threshold of each pair.
+        :param aabb_lower: The lower corners of the bounding boxes, the ones of the current state if None.
+        :param aabb_upper: The upper corners of the bounding boxes, the ones of the current state if None.
+        :return: A boolean mask of the pairs that may be closer than their threshold.
+        """
+        if aabb_lower is None or aabb_upper is None:
+            aabb_lower, aabb_upper = self._aabb_lower, self._aabb_upper
+        gaps = np.maximum(
+            aabb_lower[body_b_indices] - aabb_upper[body_a_indices],
+            aabb_lower[body_a_indices] - aabb_upper[body_b_indices],
+        )
+        np.maximum(gaps, 0, out=gaps)
+        return np.linalg.norm(gaps, axis=1) <= distances
 
     def check_collisions(
-        self, collision_matrix: Optional[Iterable[CollisionCheck]] = None
+        self,
+        collision_matrix: Optional[
+            Union[Iterable[CollisionCheck], CollisionMatrix]
+        ] = None,
     ) -> List[Collision]:
         """
         Checks for collisions in the current world state. The collision manager from trimesh returns all collisions,
         which are then filtered based on the provided collision matrix. If there are multiple contacts between two bodies,
         only the first contact is returned.
+        Pairs whose bounding boxes are further apart than their distance threshold are skipped without computing
+        their distance.
+        With `use_temporal_coherence`, pairs are also skipped if the distance computed by a previous call, minus how
+        far both bodies moved since then, is still above their threshold.
 
-        :param collision_matrix: An optional set of CollisionCheck objects to filter the collisions. If None is provided, all collisions are checked.
+        :param collision_matrix: An optional set of CollisionCheck objects or a CollisionMatrix to filter the collisions. If None is provided, all collisions are checked.
         :return: A list of Collision objects representing the detected collisions.
         """
         self.sync_world_model()
@@ -83,43 +421,437 @@ class TrimeshCollisionDetector(CollisionDetector):
 
         if collision_matrix is None:
             return []
+        collision_pairs = self._collision_pairs(collision_matrix)
+        if collision_pairs is None:
+            return []
+        body_a_indices, body_b_indices, distances, create_collision_checks = (
+            collision_pairs
+        )
+        candidates = np.flatnonzero(
+            self._broadphase(body_a_indices, body_b_indices, distances)
+        )
+        if not self.use_temporal_coherence:
+            collisions, _ = self._narrowphase(
+                create_collision_checks(candidates), self._map_T_bodies
+            )
+            return collisions
 
-        collision_pairs = [
-            (cc.body_a, cc.body_b, cc.distance) for cc in collision_matrix
+        candidates = candidates[
+            ~self._beyond_cached_distances(
+                body_a_indices[candidates],
+                body_b_indices[candidates],
+                distances[candidates],
+            )
         ]
-        result = []
-        for body_a, body_b, distance in collision_pairs:
+        collisions, min_distances = self._narrowphase(
+            create_collision_checks(candidates), self._map_T_bodies
+        )
+        self._cache_distances(
+            body_a_indices[candidates], body_b_indices[candidates], min_distances
+        )
+        return collisions
+
+    def _beyond_cached_distances(
+        self,
+        body_a_indices: np.ndarray,
+        body_b_indices: np.ndarray,
+        distances: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Uses the distances cached by previous calls of `check_collisions` to find pairs that can't be closer than
+        their threshold.
+        The distance between two bodies shrinks at most by how far the points of both bodies travelled since the
+        distance was cached.
+
+        :param body_a_indices: The indices of the first bodies of the pairs in `_bodies`.
+        :param body_b_indices: The indices of the second bodies of the pairs in `_bodies`.
+        :param distances: The distance threshold of each pair.
+        :return: A boolean mask of the pairs that are still further apart than their threshold.
+        """
+        travelled_since_cached = (
+            self._travelled_distances[body_a_indices]
+            + self._travelled_distances[body_b_indices]
+            - self._cached_travelled_distances[body_a_indices, body_b_indices]
+        )
+        return (
+            self._cached_distances[body_a_indices, body_b_indices]
+            - travelled_since_cached
+            > distances
+        )
+
+    def _cache_distances(
+        self,
+        body_a_indices: np.ndarray,
+        body_b_indices: np.ndarray,
+        min_distances: np.ndarray,
+    ) -> None:
+        """
+        Stores the distances of pairs in the current state for `_beyond_cached_distances`.
+
+        :param body_a_indices: The indices of the first bodies of the pairs in `_bodies`.
+        :param body_b_indices: The indices of the second bodies of the pairs in `_bodies`.
+        :param min_distances: The distance between the bodies of each pair.
+        """
+        travelled_distances = (
+            self._travelled_distances[body_a_indices]
+            + self._travelled_distances[body_b_indices]
+        )
+        for rows, columns in (
+            (body_a_indices, body_b_indices),
+            (body_b_indices, body_a_indices),
+        ):
+            self._cached_distances[rows, columns] = min_distances
+            self._cached_travelled_distances[rows, columns] = travelled_distances
+
+    def _collision_pairs(
+        self, collision_matrix: Union[Iterable[CollisionCheck], CollisionMatrix]
+    ) -> Optional[
+        Tuple[
+            np.ndarray,
+            np.ndarray,
+            np.ndarray,
+            Callable[[np.ndarray], List[CollisionCheck]],
+        ]
+    ]:
+        """
+        Converts the pairs to check into index arrays, without creating Python objects per pair for a
+        CollisionMatrix.
+
+        :param collision_matrix: Either collision checks, or a mask over pairs of bodies.
+        :return: The indices of the first and second bodies of the pairs in `_bodies`, the distance threshold of
+            each pair, and a function that creates the collision checks for some of the pairs, given their indices.
+            None, if there are no pairs.
+        """
+        if isinstance(collision_matrix, CollisionMatrix):
+            matrix_a_indices, matrix_b_indices = collision_matrix.pair_indices()
+            if len(matrix_a_indices) == 0:
+                return None
+            try:
+                detector_indices = np.array(
+                    [self._body_indices[body] for body in collision_matrix.bodies]
+                )
+            except KeyError as e:
+                raise ValueError(
+                    f"Body {e.args[0].name} does not have collision enabled or is not part of the world."
+                ) from e
+            return (
+                detector_indices[matrix_a_indices],
+                detector_indices[matrix_b_indices],
+                np.full(len(matrix_a_indices), collision_matrix.distance),
+                lambda pair_indices: collision_matrix.collision_checks(
+                    matrix_a_indices[pair_indices], matrix_b_indices[pair_indices]
+                ),
+            )
+
+        collision_checks = list(collision_matrix)
+        for collision_check in collision_checks:
             if (
-                body_a not in self._collision_objects
-                or body_b not in self._collision_objects
+                collision_check.body_a not in self._collision_objects
+                or collision_check.body_b not in self._collision_objects
             ):
                 raise ValueError(
-                    f"One of the bodies {body_a.name}, {body_b.name} does not have collision enabled or is not part of the world."
+                    f"One of the bodies {collision_check.body_a.name}, {collision_check.body_b.name} does not have collision enabled or is not part of the world."
                 )
-            distance_request = fcl.DistanceRequest(
-                enable_nearest_points=True, enable_signed_distance=True
-            )
-            distance_result = fcl.DistanceResult()
-            fcl.distance(
-                self._collision_objects[body_a],
-                self._collision_objects[body_b],
-                distance_request,
-                distance_result,
+        if not collision_checks:
+            return None
+        return (
+            np.array([self._body_indices[cc.body_a] for cc in collision_checks]),
+            np.array([self._body_indices[cc.body_b] for cc in collision_checks]),
+            np.array([cc.distance for cc in collision_checks], dtype=float),
+            lambda pair_indices: [collision_checks[index] for index in pair_indices],
+        )
+
+    def _narrowphase(
+        self, collision_checks: Sequence[CollisionCheck], map_T_bodies: np.ndarray
+    ) -> Tuple[List[Collision], np.ndarray]:
+        """
+        Computes the exact distance of the bodies of each collision check.
+
+        :param collision_checks: The collision checks that passed the broadphase.
+        :param map_T_bodies: The poses of all bodies in `_bodies`, which the collision objects were moved to.
+        :return: A Collision for every check whose bodies are closer than its distance threshold, and the distance
+            of every check.
+        """
+        result = []
+        min_distances = np.empty(len(collision_checks))
+        for check_index, collision_check in enumerate(collision_checks):
+            min_distance, map_P_pa, map_P_pb = self._compute_closest_points(
+                collision_check.body_a, collision_check.body_b, map_T_bodies
             )
-            if distance_result.min_distance <= distance:
+            min_distances[check_index] = min_distance
+            if min_distance <= collision_check.distance:
                 result.append(
                     Collision(
-                        distance_result.min_distance,
-                        body_a,
-                        body_b,
-                        map_P_pa=distance_result.nearest_points[0],
-                        map_P_pb=distance_result.nearest_points[1],
-                        map_V_n_input=distance_result.nearest_points[0]
-                        - distance_result.nearest_points[1],
+                        min_distance,
+                        collision_check.body_a,
+                        collision_check.body_b,
+                        map_P_pa=map_P_pa,
+                        map_P_pb=map_P_pb,
+                        map_V_n_input=map_P_pa - map_P_pb,
                     )
                 )
+        return result, min_distances
 
-        return result
+    def _compute_closest_points(
+        self, body_a: Body, body_b: Body, map_T_bodies: np.ndarray
+    ) -> Tuple[float, np.ndarray, np.ndarray]:
+        """
+        Uses the signed distance field of one of the bodies, if exactly one of them is static and
+        `signed_distance_fields` is set, and FCL otherwise.
+
+        :param map_T_bodies: The poses of all bodies in `_bodies`, which the collision objects were moved to.
+        :return: The signed distance between the bodies, and the closest points on both bodies in the world frame.
+        """
+        index_a = self._body_indices[body_a]
+        index_b = self._body_indices[body_b]
+        if (
+            self.signed_distance_fields is None
+            or self._is_static[index_a] == self._is_static[index_b]
+        ):
+            distance_result = self._compute_distance(body_a, body_b)
+            return (
+                distance_result.min_distance,
+                distance_result.nearest_points[0],
+                distance_result.nearest_points[1],
+            )
+        field_index, other_index = (
+            (index_a, index_b) if self._is_static[index_a] else (index_b, index_a)
+        )
+        map_T_field = map_T_bodies[field_index]
+        distance, field_P_field, field_P_other = (
+            self.signed_distance_fields.compute_distance(
+                self._bodies[field_index],
+                self._bodies[other_index],
+                np.linalg.inv(map_T_field) @ map_T_bodies[other_index],
+            )
+        )
+        map_P_field = map_T_field[:3, :3] @ field_P_field + map_T_field[:3, 3]
+        map_P_other = map_T_field[:3, :3] @ field_P_other + map_T_field[:3, 3]
+        if field_index == index_a:
+            return distance, map_P_field, map_P_other
+        return distance, map_P_other, map_P_field
+
+    def check_trajectory(
+        self,
+        configurations: np.ndarray,
+        collision_matrix: Union[Iterable[CollisionCheck], CollisionMatrix],
+        degrees_of_freedom: Optional[Sequence[DegreeOfFreedom]] = None,
+        resolution: float = 0.01,
+    ) -> Optional[TrajectoryCollision]:
+        """
+        Checks a trajectory segment by segment, and stops at the first collision.
+
+        The subdivisions of all segments and the poses of all collision bodies at them are computed up front with
+        batched forward kinematics calls over the whole trajectory.
+        Each segment is subdivided, such that no point of a body moves more than `resolution` between two checked
+        configurations.
+        Pairs whose bounding boxes, swept over the whole segment, stay further apart than their threshold are skipped
+        for the segment. The remaining pairs go through the broadphase and narrowphase at every subdivision.
+        Collisions between two subdivisions can therefore only be missed for parts of bodies that are thinner than
+        the distance both bodies move in one subdivision.
+
+        .. note:: FCL's continuous collision checking is not used, because it interpolates the body poses linearly
+            in Cartesian space, instead of the joints, and misses collisions for some primitive shapes.
+        """
+        self.sync_world_model()
+        configurations = self._complete_configurations(
+            configurations, degrees_of_freedom
+        )
+        if len(configurations) == 1:
+            configurations = np.repeat(configurations, 2, axis=0)
+        collision_pairs = self._collision_pairs(collision_matrix)
+        if collision_pairs is None:
+            return None
+        body_a_indices, body_b_indices, distances, create_collision_checks = (
+            collision_pairs
+        )
+        all_body_indices = np.arange(len(self._bodies))
+
+        self._poses_are_outdated = True
+        subdivided_segments = self._subdivide_trajectory(
+            configurations, self._body_radii, resolution
+        )
+        for segment_index, (
+            fractions,
+            segment_configurations,
+            map_T_bodies,
+        ) in enumerate(subdivided_segments):
+            aabb_lower, aabb_upper = self._compute_bounding_boxes(
+                map_T_bodies, all_body_indices
+            )
+            segment_candidates = np.flatnonzero(
+                self._broadphase(
+                    body_a_indices,
+                    body_b_indices,
+                    distances,
+                    aabb_lower.min(axis=0) - resolution / 2,
+                    aabb_upper.max(axis=0) + resolution / 2,
+                )
+            )
+            if len(segment_candidates) == 0:
+                continue
+            segment_a_indices = body_a_indices[segment_candidates]
+            segment_b_indices = body_b_indices[segment_candidates]
+            # the start of a segment was already checked as end of the previous one
+            first_subdivision = 0 if segment_index == 0 else 1
+            for subdivision in range(first_subdivision, len(fractions)):
+                candidates = segment_candidates[
+                    self._broadphase(
+                        segment_a_indices,
+                        segment_b_indices,
+                        distances[segment_candidates],
+                        aabb_lower[subdivision],
+                        aabb_upper[subdivision],
+                    )
+                ]
+                if len(candidates) == 0:
+                    continue
+                for body_index in np.union1d(
+                    body_a_indices[candidates], body_b_indices[candidates]
+                ):
+                    self._move_collision_objects(
+                        body_index, map_T_bodies[subdivision, body_index]
+                    )
+                collisions, _ = self._narrowphase(
+                    create_collision_checks(candidates), map_T_bodies[subdivision]
+                )
+                if collisions:
+                    return TrajectoryCollision(
+                        segment_index=segment_index,
+                        segment_fraction=float(fractions[subdivision]),
+                        configuration=segment_configurations[subdivision],
+                        collision=min(
+                            collisions, key=lambda collision: collision.contact_distance
+                        ),
+                    )
+        return None
+
+    def _complete_configurations(
+        self,
+        configurations: np.ndarray,
+        degrees_of_freedom: Optional[Sequence[DegreeOfFreedom]],
+    ) -> np.ndarray:
+        """
+        :param configurations: An N x M array with positions of the degrees of freedom.
+        :param degrees_of_freedom: The M degrees of freedom, or None if the columns are already all degrees of
+            freedom in the order of the world state.
+        :return: An N x (number of degrees of freedom) array, with the current positions for all degrees of freedom
+            that are not part of `configurations`.
+        """
+        configurations = np.atleast_2d(np.asarray(configurations, dtype=float))
+        if degrees_of_freedom is None:
+            return configurations
+        complete_configurations = np.tile(
+            self._world.state.positions, (len(configurations), 1)
+        )
+        columns = self._world.state.get_columns(degrees_of_freedom)
+        complete_configurations[:, columns] = configurations
+        return complete_configurations
+
+    def _subdivide_trajectory(
+        self,
+        configurations: np.ndarray,
+        body_radii: np.ndarray,
+        resolution: float,
+    ) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Subdivides the linear interpolation between consecutive configurations, such that no point of a body moves
+        further than `resolution` between two subdivisions.
+        The number of subdivisions of a segment is estimated from the poses at its start and end, and refined if the
+        poses at the subdivisions show that the bodies move on curves, until the motion bound holds for every segment.
+        The poses of all subdivisions of all segments are computed with one batched forward kinematics call per
+        refinement.
+
+        :param configurations: The N configurations of the trajectory.
+        :param body_radii: The maximum distance of a point of the collision geometry from the origin of each body.
+        :param resolution: The maximum motion of a point between two subdivisions.
+        :return: For each of the N - 1 segments, the fractions of the segment at the subdivisions, the configurations
+            at the subdivisions, and the poses of all bodies at the subdivisions, as S x B x 4 x 4 array.
+        """
+        fk_manager = self._world._forward_kinematic_manager
+        map_T_waypoints = fk_manager.compute_for_configurations(
+            configurations, self._bodies
+        )
+        motion = self._motion_bounds(map_T_waypoints, body_radii).max(axis=1, initial=0)
+        number_of_steps = np.maximum(np.ceil(motion / resolution), 1).astype(int)
+        while True:
+            fractions = [np.linspace(0, 1, steps + 1) for steps in number_of_steps]
+            subdivided_configurations = np.concatenate(
+                [
+                    start + segment_fractions[:, None] * (end - start)
+                    for start, end, segment_fractions in zip(
+                        configurations[:-1], configurations[1:], fractions
+                    )
+                ]
+            )
+            map_T_bodies = fk_manager.compute_for_configurations(
+                subdivided_configurations, self._bodies
+            )
+            segment_starts = np.concatenate([[0], np.cumsum(number_of_steps + 1)])
+            segment_motion = np.array(
+                [
+                    self._motion_bounds(map_T_bodies[start:end], body_radii).max(
+                        initial=0
+                    )
+                    for start, end in zip(segment_starts[:-1], segment_starts[1:])
+                ]
+            )
+            if np.all(segment_motion <= resolution):
+                break
+            number_of_steps = np.maximum(
+                number_of_steps,
+                np.ceil(number_of_steps * segment_motion / resolution).astype(int),
+            )
+        return [
+            (
+                segment_fractions,
+                subdivided_configurations[start:end],
+                map_T_bodies[start:end],
+            )
+            for segment_fractions, start, end in zip(
+                fractions, segment_starts[:-1], segment_starts[1:]
+            )
+        ]
+
+    @staticmethod
+    def _motion_bounds(map_T_bodies: np.ndarray, body_radii: np.ndarray) -> np.ndarray:
+        """
+        :param map_T_bodies: An S x B x 4 x 4 array with poses of bodies at consecutive subdivisions.
+        :param body_radii: The maximum distance of a point of the collision geometry from the origin of each body.
+        :return: An (S - 1) x B array with an upper bound of the distance any point of a body moves between two
+            consecutive subdivisions, assuming it moves on a straight line.
+        """
+        translations = np.linalg.norm(
+            map_T_bodies[1:, :, :3, 3] - map_T_bodies[:-1, :, :3, 3], axis=-1
+        )
+        # the spectral norm of the change of the rotation part bounds the motion of a point at distance one, also
+        # for the scaled rotation matrices of linearly interpolated quaternions
+        rotation_changes = map_T_bodies[1:, :, :3, :3] - map_T_bodies[:-1, :, :3, :3]
+        spectral_norms = np.sqrt(
+            np.linalg.eigvalsh(
+                np.swapaxes(rotation_changes, -1, -2) @ rotation_changes
+            )[..., -1].clip(0)
+        )
+        return translations + spectral_norms * body_radii
+
+    def _compute_distance(self, body_a: Body, body_b: Body) -> fcl.DistanceResult:
+        """
+        :return: The result of the closest pair of collision objects of both bodies.
+        """
+        closest_result = None
+        for object_a in self._collision_objects[body_a]:
+            for object_b in self._collision_objects[body_b]:
+                distance_request = fcl.DistanceRequest(
+                    enable_nearest_points=True, enable_signed_distance=True
+                )
+                distance_result = fcl.DistanceResult()
+                fcl.distance(object_a, object_b, distance_request, distance_result)
+                if (
+                    closest_result is None
+                    or distance_result.min_distance < closest_result.min_distance
+                ):
+                    closest_result = distance_result
+        return closest_result
 
     def check_collision_between_bodies(
         self, body_a: Body, body_b: Body
@@ -130,4 +862,8 @@ class TrimeshCollisionDetector(CollisionDetector):
         return collision[0] if collision else None
 
     def reset_cache(self):
-        pass
+        number_of_bodies = len(self._bodies)
+        self._cached_distances = np.full((number_of_bodies, number_of_bodies), -np.inf)
+        self._cached_travelled_distances = np.zeros(
+            (number_of_bodies, number_of_bodies)
+        )
@@ -5,3 +5,4 @@ import numpy.typing as npt
 
 AnyMatrix4x4 = Annotated[Sequence[Sequence[float]], Literal[4, 4]]
 NpMatrix4x4 = Annotated[npt.NDArray[np.float64], Literal[4, 4]]
+NpMatrix4x4Batch = Annotated[npt.NDArray[np.float64], Literal["N", 4, 4]]
@@ -83,6 +83,19 @@ class MismatchingCommandLengthError(ValueError):
         super().__init__(f"Commands length {self.actual_length} does not match number of free variables {self.expected_length}.")
 
 
+class MismatchingBatchLengthError(ValueError):
+    """
+    An exception raised when the sequences of a batched query have different lengths.
+    """
+    roots_length: int
+    tips_length: int
+
+    def __init__(self, roots_length: int, tips_length: int):
+        self.roots_length = roots_length
+        self.tips_length = tips_length
+        super().__init__(f"Got {self.roots_length} roots but {self.tips_length} tips.")
+
+
 class UsageError(LogicalError):
     """
     An exception raised when an incorrect usage of the API is encountered.
@@ -217,11 +230,13 @@ class ParsingError(Exception):
 
 @dataclass
 class WorldEntityNotFoundError(UsageError):
-    name_or_hash: Union[PrefixedName, int]
+    name_or_hash: Union[PrefixedName, int, UUID]
 
     def __post_init__(self):
         if isinstance(self.name_or_hash, PrefixedName):
             msg = f"WorldEntity with name {self.name_or_hash} not found"
+        elif isinstance(self.name_or_hash, UUID):
+            msg = f"WorldEntity with id {self.name_or_hash} not found"
         else:
             msg = f"WorldEntity with hash {self.name_or_hash} not found"
         super().__init__(msg)
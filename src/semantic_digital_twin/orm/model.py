@@ -77,12 +77,12 @@ class WorldStateMapping(AlternativeMapping[WorldState]):
     def create_instance(cls, obj: WorldState):
         return cls(
             data=obj.data.ravel().tolist(),
-            ids=obj._ids,
+            ids=list(obj.keys()),
         )
 
     def create_from_dao(self) -> WorldState:
         return WorldState(
-            data=np.array(self.data, dtype=np.float64).reshape((4, len(self.ids))),
+            _data=np.array(self.data, dtype=np.float64).reshape((4, len(self.ids))),
             _ids=self.ids,
             _index={name: idx for idx, name in enumerate(self.ids)},
         )
@@ -1,17 +1,29 @@
 from __future__ import absolute_import, annotations
 
 from collections import OrderedDict
-from functools import lru_cache
-from typing import Dict, Tuple, TYPE_CHECKING
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
 from uuid import UUID
 
 import numpy as np
 import rustworkx.visit
 
-from ..datastructures.types import NpMatrix4x4
+from ..datastructures.types import NpMatrix4x4, NpMatrix4x4Batch
+from ..exceptions import MismatchingBatchLengthError, WrongDimensionsError
 from ..spatial_types import spatial_types as cas
-from ..spatial_types.math import inverse_frame
-from ..utils import copy_lru_cache
+from ..spatial_types.math import inverse_frame, inverse_frames
+from ..world_description.world_cache import cached_per_world_model
 
 from ..world_description.world_entity import Connection, KinematicStructureEntity
 
@@ -19,6 +31,44 @@ if TYPE_CHECKING:
     from ..world import World
 
 
+@dataclass
+class ForwardKinematicsGroup:
+    """
+    A set of kinematic structure entities, whose forward kinematics are compiled into one function.
+    The forward kinematics of a group only have to be re-evaluated, if one of the degrees of freedom it depends on
+    changed.
+    """
+
+    kinematic_structure_entities: List[KinematicStructureEntity]
+    """
+    The kinematic structure entities in this group.
+    """
+
+    degree_of_freedom_ids: List[UUID]
+    """
+    The ids of the degrees of freedom the forward kinematics of this group depend on, in the order of the parameters
+    of `compiled_fks`.
+    """
+
+    compiled_fks: cas.CompiledFunction
+    """
+    Computes the stacked forward kinematics of all entities in this group, given the positions of the degrees of
+    freedom in `degree_of_freedom_ids`.
+    """
+
+    rows: slice = field(init=False)
+    """
+    The rows of the forward kinematics of this group in `ForwardKinematicsManager.forward_kinematics_for_all_bodies`.
+    Assigned by the manager after every compilation.
+    """
+
+    columns: np.ndarray = field(init=False)
+    """
+    The columns of `degree_of_freedom_ids` in the world state.
+    Assigned by the manager after every compilation.
+    """
+
+
 class ForwardKinematicsManager(rustworkx.visit.DFSVisitor):
     """
     Visitor class for collection various forward kinematics expressions in a world model.
@@ -28,88 +78,434 @@ class ForwardKinematicsManager(rustworkx.visit.DFSVisitor):
     1. Efficient computation of forward kinematics between any bodies in the world.
     2. Efficient computation of forward kinematics for all bodies with collisions for updating collision checkers.
     3. Efficient computation of forward kinematics as position and quaternion, useful for ROS tf.
+
+    Entities that hang off the root only via constant connections are static, their poses are constant-folded.
+    The remaining entities are grouped by the degrees of freedom their forward kinematics depend on.
+    Entities whose forward kinematics share a degree of freedom end up in the same group, e.g., all links of a robot.
+    After a state change, only the groups that depend on a changed degree of freedom are re-evaluated.
+
+    After a model change, the results of entities whose chain of connections didn't change are reused, and groups
+    that only contain such entities keep their compiled function.
+    New or changed branches are compiled into groups of their own.
+    Once too many entities were compiled this way, all groups are rebuilt from scratch.
     """
 
-    compiled_collision_fks: cas.CompiledFunction
-    compiled_all_fks: cas.CompiledFunction
+    full_recompile_threshold: float = 0.5
+    """
+    Fraction of the dynamic entities that may be compiled incrementally since the last full compilation,
+    before all groups are rebuilt from scratch.
+    """
+
+    static_entities: List[KinematicStructureEntity]
+    """
+    The kinematic structure entities whose forward kinematics don't depend on any degree of freedom.
+    Their poses are computed with numpy during the traversal and never compiled or re-evaluated.
+    """
 
-    forward_kinematics_for_all_bodies: np.ndarray
+    groups: List[ForwardKinematicsGroup]
+    """
+    The groups of dynamic kinematic structure entities, whose forward kinematics are evaluated together.
+    """
+
+    _group_dependencies: np.ndarray
+    """
+    A boolean matrix of shape (number of groups) x (number of degrees of freedom).
+    An entry is True, if the forward kinematics of the group depend on the position of the degree of freedom.
+    """
+
+    _evaluated_positions: Optional[np.ndarray]
+    """
+    The positions of all degrees of freedom at the last evaluation of `forward_kinematics_for_all_bodies`.
+    None, if it was not evaluated since the last compilation.
+    """
+
+    _forward_kinematics_for_all_bodies: np.ndarray
     """
     A 2D array containing the stacked forward kinematics expressions for all bodies in the world.
     Dimensions are ((number of bodies) * 4) x 4.
     They are computed in batch for efficiency.
     """
-    body_id_to_forward_kinematics_idx: Dict[UUID, int]
+    _collision_rows: np.ndarray
+    """
+    The rows of `forward_kinematics_for_all_bodies` that belong to bodies with enabled collisions, sorted by body id.
+    """
+    _collision_fks: np.ndarray
+    """
+    The stacked forward kinematics of all bodies with enabled collisions, sorted by body id.
+    """
+    compiled_tf: Optional[cas.CompiledFunction]
+    """
+    Computes the forward kinematics of all connections in position/quaternion format.
+    Only compiled on the first call of `compute_tf` after a model change.
+    """
+    _tf: np.ndarray
+    """
+    The forward kinematics of all connections in position/quaternion format, see `compute_tf`.
+    """
+    idx_start: Dict[UUID, int]
     """
     Given a body id, returns the index of the first row in `forward_kinematics_for_all_bodies` that corresponds to that body.
     """
 
     def __init__(self, world: World):
         self.world = world
-        self.child_body_to_fk_expr: Dict[UUID, cas.TransformationMatrix] = {
-            self.world.root.id: cas.TransformationMatrix()
-        }
+        self.child_body_to_fk_expr: Dict[UUID, cas.TransformationMatrix] = {}
+        self.child_body_to_static_pose: Dict[UUID, NpMatrix4x4] = {}
+        self.child_body_to_dof_ids: Dict[UUID, FrozenSet[UUID]] = {}
+        self.child_body_to_connection_signature: Dict[UUID, Tuple[Any, ...]] = {}
         self.tf: Dict[Tuple[UUID, UUID], cas.Expression] = OrderedDict()
+        self._tf_connections: List[Connection] = []
+        self.groups = []
+        self.compiled_tf = None
+        self._changed_entity_ids: Set[UUID] = set()
+        self._number_of_incrementally_compiled_entities = 0
+        self._compute_np_cache: Dict[Tuple[UUID, UUID], NpMatrix4x4] = {}
+        self._evaluated_positions = None
+        self._all_fks_is_dirty = True
+        self._collision_fks_is_dirty = True
+        self._tf_is_dirty = True
 
     def recompile(self):
-        self.child_body_to_fk_expr: Dict[UUID, cas.TransformationMatrix] = {
-            self.world.root.id: cas.TransformationMatrix()
+        """
+        Traverses the kinematic structure and compiles the forward kinematics of all entities, whose chain of connections
+        changed since the last compilation.
+        A connection counts as changed, if it was replaced or one of the expressions its origin is composed of was
+        reassigned. Expressions are assumed to not be modified in place.
+        """
+        self._previous_fk_expr = self.child_body_to_fk_expr
+        self._previous_static_pose = self.child_body_to_static_pose
+        self._previous_dof_ids = self.child_body_to_dof_ids
+        self._previous_connection_signature = self.child_body_to_connection_signature
+
+        root_id = self.world.root.id
+        self.child_body_to_fk_expr: Dict[UUID, cas.TransformationMatrix] = {}
+        self.child_body_to_static_pose: Dict[UUID, NpMatrix4x4] = {root_id: np.eye(4)}
+        self.child_body_to_dof_ids: Dict[UUID, FrozenSet[UUID]] = {root_id: frozenset()}
+        self.child_body_to_connection_signature: Dict[UUID, Tuple[Any, ...]] = {}
+        self._changed_entity_ids = set()
+        if root_id not in self._previous_static_pose:
+            self._changed_entity_ids.add(root_id)
+        self._position_variable_to_dof_id = {
+            dof.variables.position: dof.id for dof in self.world.degrees_of_freedom
         }
-        self.tf: Dict[Tuple[UUID, UUID], cas.Expression] = OrderedDict()
+        self._tf_connections = []
+        self.compiled_tf = None
         self.world._travel_branch(self.world.root, self)
         self.compile()
 
     def connection_call(self, edge: Tuple[int, int, Connection]):
         """
-        Gathers forward kinematics expressions for a connection.
+        Gathers forward kinematics expressions and the degrees of freedom they depend on for a connection.
+        The poses of children that don't depend on any degree of freedom are folded into constant numpy arrays instead.
+        If neither the connection nor the chain of its parent changed since the last compilation, the previous
+        results are reused.
         """
         connection = edge[2]
-        map_T_parent = self.child_body_to_fk_expr[connection.parent.id]
-        self.child_body_to_fk_expr[connection.child.id] = map_T_parent.dot(
-            connection.origin_expression
-        )
-        self.tf[(connection.parent.id, connection.child.id)] = (
-            connection.origin_as_position_quaternion()
+        parent_id = connection.parent.id
+        child_id = connection.child.id
+        signature = self._connection_signature(connection)
+        self.child_body_to_connection_signature[child_id] = signature
+        self._tf_connections.append(connection)
+
+        previous_signature = self._previous_connection_signature.get(child_id, ())
+        if (
+            parent_id not in self._changed_entity_ids
+            and len(previous_signature) == len(signature)
+            and all(a is b for a, b in zip(previous_signature, signature))
+        ):
+            self.child_body_to_dof_ids[child_id] = self._previous_dof_ids[child_id]
+            if child_id in self._previous_static_pose:
+                self.child_body_to_static_pose[child_id] = self._previous_static_pose[
+                    child_id
+                ]
+            if child_id in self._previous_fk_expr:
+                self.child_body_to_fk_expr[child_id] = self._previous_fk_expr[child_id]
+            return
+
+        self._changed_entity_ids.add(child_id)
+        parent_T_child = connection.origin_expression
+        dof_ids = self.child_body_to_dof_ids[parent_id].union(
+            self._position_variable_to_dof_id[variable]
+            for variable in parent_T_child.free_variables()
         )
+        self.child_body_to_dof_ids[child_id] = dof_ids
+        if not dof_ids:
+            self.child_body_to_static_pose[child_id] = (
+                self.child_body_to_static_pose[parent_id] @ parent_T_child.to_np()
+            )
+        else:
+            map_T_parent = self.get_fk_expression(connection.parent)
+            self.child_body_to_fk_expr[child_id] = map_T_parent.dot(parent_T_child)
 
     tree_edge = connection_call
 
-    def compile(self) -> None:
+    @staticmethod
+    def _connection_signature(connection: Connection) -> Tuple[Any, ...]:
         """
-        Compiles forward kinematics expressions for fast evaluation.
+        :param connection: The connection to describe.
+        :return: The connection and the expressions its origin is composed of.
+            If any of them is replaced, the forward kinematics of the child have to be recompiled.
+        """
+        return (
+            connection,
+            connection.parent_T_connection_expression,
+            connection.kinematics,
+            connection.connection_T_child_expression,
+        )
+
+    def get_fk_expression(
+        self, kinematic_structure_entity: KinematicStructureEntity
+    ) -> cas.TransformationMatrix:
+        """
+        :param kinematic_structure_entity: A kinematic structure entity that was visited during the last traversal.
+        :return: The forward kinematics expression of the entity relative to the root of the world.
+            For static entities, this is a constant expression.
         """
-        all_fks = cas.Expression.vstack(
+        try:
+            return self.child_body_to_fk_expr[kinematic_structure_entity.id]
+        except KeyError:
+            fk_expression = self.child_body_to_fk_expr[
+                kinematic_structure_entity.id
+            ] = cas.TransformationMatrix(
+                data=self.child_body_to_static_pose[kinematic_structure_entity.id]
+            )
+            return fk_expression
+
+    def _group_by_degree_of_freedom_dependence(
+        self, kinematic_structure_entities: List[KinematicStructureEntity]
+    ) -> List[List[KinematicStructureEntity]]:
+        """
+        Groups dynamic kinematic structure entities, such that entities whose forward kinematics depend on a common
+        degree of freedom are in the same group.
+
+        :param kinematic_structure_entities: The dynamic entities to group.
+        :return: The groups, each a list of kinematic structure entities.
+        """
+        # union find over the degree of freedom ids
+        parent_dof_id: Dict[UUID, UUID] = {}
+
+        def find(dof_id: UUID) -> UUID:
+            parent_dof_id.setdefault(dof_id, dof_id)
+            while parent_dof_id[dof_id] != dof_id:
+                parent_dof_id[dof_id] = parent_dof_id[parent_dof_id[dof_id]]
+                dof_id = parent_dof_id[dof_id]
+            return dof_id
+
+        for entity in kinematic_structure_entities:
+            first_dof_id, *other_dof_ids = self.child_body_to_dof_ids[entity.id]
+            for dof_id in other_dof_ids:
+                parent_dof_id[find(dof_id)] = find(first_dof_id)
+
+        groups: Dict[UUID, List[KinematicStructureEntity]] = {}
+        for entity in kinematic_structure_entities:
+            first_dof_id = next(iter(self.child_body_to_dof_ids[entity.id]))
+            groups.setdefault(find(first_dof_id), []).append(entity)
+        return list(groups.values())
+
+    def _compile_group(
+        self, kinematic_structure_entities: List[KinematicStructureEntity]
+    ) -> ForwardKinematicsGroup:
+        """
+        :param kinematic_structure_entities: The dynamic entities of the new group.
+        :return: A group with a compiled function for the forward kinematics of the given entities.
+        """
+        dof_ids = set()
+        for entity in kinematic_structure_entities:
+            dof_ids.update(self.child_body_to_dof_ids[entity.id])
+        dofs = [dof for dof in self.world.degrees_of_freedom if dof.id in dof_ids]
+        group_fks = cas.Expression.vstack(
             [
-                self.child_body_to_fk_expr[body.id]
-                for body in self.world.kinematic_structure_entities
+                self.child_body_to_fk_expr[entity.id]
+                for entity in kinematic_structure_entities
             ]
         )
-        tf = cas.Expression.vstack([pose for pose in self.tf.values()])
-        collision_fks = []
-        for body in sorted(
-            self.world.bodies_with_enabled_collision, key=lambda b: b.id
+        return ForwardKinematicsGroup(
+            kinematic_structure_entities=kinematic_structure_entities,
+            degree_of_freedom_ids=[dof.id for dof in dofs],
+            compiled_fks=group_fks.compile(
+                parameters=[[dof.variables.position for dof in dofs]]
+            ),
+        )
+
+    def compile(self) -> None:
+        """
+        Compiles forward kinematics expressions for fast evaluation.
+        The poses of static entities are written once into the first rows of `forward_kinematics_for_all_bodies`,
+        only the groups of dynamic entities are compiled.
+        Groups of the previous compilation are kept, if none of their entities changed.
+        """
+        self.static_entities = []
+        dynamic_entities = []
+        for entity in self.world.kinematic_structure_entities:
+            if entity.id in self.child_body_to_static_pose:
+                self.static_entities.append(entity)
+            else:
+                dynamic_entities.append(entity)
+        dynamic_entity_ids = {entity.id for entity in dynamic_entities}
+
+        kept_groups = [
+            group
+            for group in self.groups
+            if all(
+                entity.id in dynamic_entity_ids
+                and entity.id not in self._changed_entity_ids
+                for entity in group.kinematic_structure_entities
+            )
+        ]
+        covered_entity_ids = {
+            entity.id
+            for group in kept_groups
+            for entity in group.kinematic_structure_entities
+        }
+        new_entities = [
+            entity for entity in dynamic_entities if entity.id not in covered_entity_ids
+        ]
+        self._number_of_incrementally_compiled_entities += len(new_entities)
+        if (
+            not kept_groups
+            or self._number_of_incrementally_compiled_entities
+            > self.full_recompile_threshold * len(dynamic_entities)
         ):
-            if body == self.world.root:
-                continue
-            collision_fks.append(self.child_body_to_fk_expr[body.id])
-        collision_fks = cas.Expression.vstack(collision_fks)
-        params = [v.variables.position for v in self.world.degrees_of_freedom]
-        self.compiled_all_fks = all_fks.compile(parameters=[params])
-        self.compiled_collision_fks = collision_fks.compile(parameters=[params])
-        self.compiled_tf = tf.compile(parameters=[params])
-        self.idx_start = {
-            body.id: i * 4
-            for i, body in enumerate(self.world.kinematic_structure_entities)
+            kept_groups = []
+            new_entities = dynamic_entities
+            self._number_of_incrementally_compiled_entities = 0
+
+        self.groups = kept_groups + [
+            self._compile_group(entities)
+            for entities in self._group_by_degree_of_freedom_dependence(new_entities)
+        ]
+        self._assign_rows_and_columns()
+
+    def _assign_rows_and_columns(self) -> None:
+        """
+        Assigns the rows of all entities in `forward_kinematics_for_all_bodies` and the state columns of the degrees of
+        freedom of all groups, and writes the poses of the static entities.
+        """
+        dof_id_to_column = {
+            dof.id: column for column, dof in enumerate(self.world.degrees_of_freedom)
         }
+        self.idx_start = {}
+        row = 0
+        for entity in self.static_entities:
+            self.idx_start[entity.id] = row
+            row += 4
+        self._group_dependencies = np.zeros(
+            (len(self.groups), len(dof_id_to_column)), dtype=bool
+        )
+        for group_index, group in enumerate(self.groups):
+            group.rows = slice(row, row + len(group.kinematic_structure_entities) * 4)
+            for entity in group.kinematic_structure_entities:
+                self.idx_start[entity.id] = row
+                row += 4
+            group.columns = np.array(
+                [dof_id_to_column[dof_id] for dof_id in group.degree_of_freedom_ids],
+                dtype=int,
+            )
+            self._group_dependencies[group_index, group.columns] = True
+
+        self._forward_kinematics_for_all_bodies = np.empty((row, 4))
+        if self.static_entities:
+            self._forward_kinematics_for_all_bodies[: len(self.static_entities) * 4] = (
+                np.vstack(
+                    [
+                        self.child_body_to_static_pose[entity.id]
+                        for entity in self.static_entities
+                    ]
+                )
+            )
+        self._evaluated_positions = None
+
+        self._collision_rows = np.array(
+            [
+                self.idx_start[body.id] + i
+                for body in sorted(
+                    self.world.bodies_with_enabled_collision, key=lambda b: b.id
+                )
+                if body != self.world.root
+                for i in range(4)
+            ],
+            dtype=int,
+        )
+        self.invalidate()
+
+    def notify_state_change(self) -> None:
+        """
+        Updates the forward kinematics after a state change.
+        If the world uses lazy forward kinematics, they are only marked as outdated, otherwise they are recomputed.
+        """
+        if self.world.lazy_forward_kinematics:
+            self.invalidate()
+        else:
+            self.recompute()
+
+    def invalidate(self) -> None:
+        """
+        Marks all forward kinematics as outdated, such that they are recomputed on their next access.
+        """
+        self._compute_np_cache.clear()
+        self._all_fks_is_dirty = True
+        self._collision_fks_is_dirty = True
+        self._tf_is_dirty = True
 
     def recompute(self) -> None:
         """
         Clears cache and recomputes all forward kinematics. Should be called after a state update.
         """
-        self.compute_np.cache_clear()
-        self.subs = self.world.state.positions
-        self.forward_kinematics_for_all_bodies = self.compiled_all_fks(self.subs)
-        self.collision_fks = self.compiled_collision_fks(self.subs)
+        self._compute_np_cache.clear()
+        self._update_forward_kinematics_for_all_bodies()
+        self._update_collision_fks()
+        self._tf_is_dirty = True
+
+    def _update_forward_kinematics_for_all_bodies(self) -> None:
+        """
+        Re-evaluates the forward kinematics of all groups that depend on a degree of freedom whose position changed since
+        the last evaluation.
+        """
+        positions = self.world.state.positions
+        if (
+            self._evaluated_positions is None
+            or self._evaluated_positions.shape != positions.shape
+        ):
+            groups_to_update = range(len(self.groups))
+            self._evaluated_positions = positions.copy()
+        else:
+            changed_columns = positions != self._evaluated_positions
+            groups_to_update = np.flatnonzero(
+                self._group_dependencies @ changed_columns
+            )
+            np.copyto(self._evaluated_positions, positions)
+        for group_index in groups_to_update:
+            group = self.groups[group_index]
+            self._forward_kinematics_for_all_bodies[group.rows] = group.compiled_fks(
+                positions[group.columns]
+            )
+        self._all_fks_is_dirty = False
+
+    def _update_collision_fks(self) -> None:
+        self._collision_fks = self.forward_kinematics_for_all_bodies[
+            self._collision_rows
+        ]
+        self._collision_fks_is_dirty = False
+
+    @property
+    def forward_kinematics_for_all_bodies(self) -> np.ndarray:
+        """
+        A 2D array containing the stacked forward kinematics of all kinematic structure entities in the world.
+        Dimensions are ((number of kinematic structure entities) * 4) x 4.
+        """
+        if self._all_fks_is_dirty:
+            self._update_forward_kinematics_for_all_bodies()
+        return self._forward_kinematics_for_all_bodies
+
+    @property
+    def collision_fks(self) -> np.ndarray:
+        """
+        A 2D array containing the stacked forward kinematics of all bodies with enabled collisions, sorted by body id.
+        Dimensions are ((number of bodies with collisions) * 4) x 4.
+        """
+        if self._collision_fks_is_dirty:
+            self._update_collision_fks()
+        return self._collision_fks
 
     def compute_tf(self) -> np.ndarray:
         """
@@ -118,11 +514,33 @@ class ForwardKinematicsManager(rustworkx.visit.DFSVisitor):
         The first 3 entries are position values, the last 4 entires are quaternion values in x, y, z, w order.
 
         This is not updated in 'recompute', because this functionality is only used with ROS.
+        It is evaluated on the first call after a state change.
         :return: A large matrix with all forward kinematics.
         """
-        return self.compiled_tf(self.subs)
+        if self.compiled_tf is None:
+            self._compile_tf()
+        if self._tf_is_dirty:
+            self._tf = self.compiled_tf(self.world.state.positions)
+            self._tf_is_dirty = False
+        return self._tf
+
+    def _compile_tf(self) -> None:
+        """
+        Compiles the forward kinematics of all connections visited during the last traversal in position/quaternion
+        format.
+        """
+        self.tf = OrderedDict(
+            (
+                (connection.parent.id, connection.child.id),
+                connection.origin_as_position_quaternion(),
+            )
+            for connection in self._tf_connections
+        )
+        tf = cas.Expression.vstack(list(self.tf.values()))
+        self.compiled_tf = tf.compile(
+            parameters=[[v.variables.position for v in self.world.degrees_of_freedom]]
+        )
 
-    @copy_lru_cache()
     def compose_expression(
         self, root: KinematicStructureEntity, tip: KinematicStructureEntity
     ) -> cas.TransformationMatrix:
@@ -133,7 +551,15 @@ class ForwardKinematicsManager(rustworkx.visit.DFSVisitor):
             It determines the endpoint of the forward kinematics calculation.
         :return: An expression representing the computed forward kinematics of the tip KinematicStructureEntity relative to the root KinematicStructureEntity.
         """
+        return deepcopy(self._compose_expression(root, tip))
 
+    @cached_per_world_model(lambda fk_manager: fk_manager.world._cache_manager)
+    def _compose_expression(
+        self, root: KinematicStructureEntity, tip: KinematicStructureEntity
+    ) -> cas.TransformationMatrix:
+        """
+        Cached implementation of `compose_expression`, the result must not be modified.
+        """
         fk = cas.TransformationMatrix()
         root_chain, tip_chain = self.world.compute_split_chain_of_connections(root, tip)
         connection: Connection
@@ -163,7 +589,6 @@ class ForwardKinematicsManager(rustworkx.visit.DFSVisitor):
             data=self.compute_np(root, tip), reference_frame=root
         )
 
-    @lru_cache(maxsize=None)
     def compute_np(
         self, root: KinematicStructureEntity, tip: KinematicStructureEntity
     ) -> NpMatrix4x4:
@@ -172,25 +597,36 @@ class ForwardKinematicsManager(rustworkx.visit.DFSVisitor):
 
         This method computes the transformation matrix representing the pose of the
         tip body relative to the root body, expressed as a numpy ndarray.
+        Results are cached until the next state change.
 
         :param root: Root body for which the kinematics are computed.
         :param tip: Tip body to which the kinematics are computed.
         :return: Transformation matrix representing the relative pose of the tip body with respect to the root body.
         """
-        root = root.id
-        tip = tip.id
+        key = (root.id, tip.id)
+        try:
+            return self._compute_np_cache[key]
+        except KeyError:
+            result = self._compute_np_cache[key] = self._compute_np(*key)
+            return result
+
+    def _compute_np(self, root: UUID, tip: UUID) -> NpMatrix4x4:
+        """
+        Uncached implementation of `compute_np` that works on ids.
+        """
+        forward_kinematics_for_all_bodies = self.forward_kinematics_for_all_bodies
         root_is_world = root == self.world.root.id
         tip_is_world = tip == self.world.root.id
 
         if not tip_is_world:
             i = self.idx_start[tip]
-            map_T_tip = self.forward_kinematics_for_all_bodies[i : i + 4]
+            map_T_tip = forward_kinematics_for_all_bodies[i : i + 4]
             if root_is_world:
                 return map_T_tip
 
         if not root_is_world:
             i = self.idx_start[root]
-            map_T_root = self.forward_kinematics_for_all_bodies[i : i + 4]
+            map_T_root = forward_kinematics_for_all_bodies[i : i + 4]
             root_T_map = inverse_frame(map_T_root)
             if tip_is_world:
                 return root_T_map
@@ -199,3 +635,93 @@ class ForwardKinematicsManager(rustworkx.visit.DFSVisitor):
             return np.eye(4)
 
         return root_T_map @ map_T_tip
+
+    def compute_for_configurations(
+        self,
+        positions: np.ndarray,
+        kinematic_structure_entities: Optional[
+            Sequence[KinematicStructureEntity]
+        ] = None,
+    ) -> np.ndarray:
+        """
+        Evaluates the forward kinematics relative to the root of the world for many configurations at once,
+        without writing them into the world state or triggering any callbacks.
+        Only the groups that contain a requested entity are evaluated, each with one mapped call of its compiled
+        function.
+
+        :param positions: An N x (number of degrees of freedom) array, each row contains the positions of all degrees
+            of freedom in the order of the world state.
+        :param kinematic_structure_entities: The entities whose poses are returned.
+            If None, all entities are returned in the order of `forward_kinematics_for_all_bodies`.
+        :return: An N x (number of entities) x 4 x 4 array, entry [i, j] is the pose of the j-th entity in the i-th
+            configuration.
+        """
+        positions = np.asarray(positions, dtype=float)
+        number_of_dofs = len(self.world.degrees_of_freedom)
+        if positions.ndim != 2 or positions.shape[1] != number_of_dofs:
+            raise WrongDimensionsError(f"(N, {number_of_dofs})", positions.shape)
+
+        number_of_entities = len(self._forward_kinematics_for_all_bodies) // 4
+        if kinematic_structure_entities is None:
+            requested_indices = None
+            is_requested = np.ones(number_of_entities, dtype=bool)
+        else:
+            requested_indices = self._entity_indices(kinematic_structure_entities)
+            is_requested = np.zeros(number_of_entities, dtype=bool)
+            is_requested[requested_indices] = True
+
+        number_of_static_entities = len(self.static_entities)
+        map_T_entities = np.empty((len(positions), number_of_entities, 4, 4))
+        map_T_entities[:, :number_of_static_entities] = (
+            self._forward_kinematics_for_all_bodies[
+                : number_of_static_entities * 4
+            ].reshape(-1, 4, 4)
+        )
+        for group in self.groups:
+            entities = slice(group.rows.start // 4, group.rows.stop // 4)
+            if not is_requested[entities].any():
+                continue
+            map_T_entities[:, entities] = group.compiled_fks.call_batch(
+                positions[:, group.columns]
+            ).reshape(len(positions), -1, 4, 4)
+
+        if requested_indices is None:
+            return map_T_entities
+        return map_T_entities[:, requested_indices]
+
+    def compute_np_batch(
+        self,
+        roots: Sequence[KinematicStructureEntity],
+        tips: Sequence[KinematicStructureEntity],
+    ) -> NpMatrix4x4Batch:
+        """
+        Computes the forward kinematics root_T_tip for many pairs of entities at once.
+        The poses of all roots and tips are gathered from `forward_kinematics_for_all_bodies` with one fancy index
+        and composed in batch, instead of calling `compute_np` for every pair.
+
+        :param roots: The root entity of each pair.
+        :param tips: The tip entity of each pair, same length as roots.
+        :return: An N x 4 x 4 array, where entry i is roots[i]_T_tips[i].
+        """
+        if len(roots) != len(tips):
+            raise MismatchingBatchLengthError(len(roots), len(tips))
+        map_T_entities = self.forward_kinematics_for_all_bodies.reshape(-1, 4, 4)
+        root_T_map = inverse_frames(map_T_entities[self._entity_indices(roots)])
+        map_T_tip = map_T_entities[self._entity_indices(tips)]
+        return np.einsum("nij,njk->nik", root_T_map, map_T_tip)
+
+    def _entity_indices(
+        self, kinematic_structure_entities: Sequence[KinematicStructureEntity]
+    ) -> np.ndarray:
+        """
+        :param kinematic_structure_entities: Entities that were visited during the last traversal.
+        :return: The index of each entity in `forward_kinematics_for_all_bodies`, when viewed as N x 4 x 4 array.
+        """
+        return (
+            np.fromiter(
+                (self.idx_start[entity.id] for entity in kinematic_structure_entities),
+                dtype=int,
+                count=len(kinematic_structure_entities),
+            )
+            // 4
+        )
@@ -8,8 +8,10 @@ from typing_extensions import Dict, TYPE_CHECKING, List, Tuple
 import daqp
 import numpy as np
 
+from ..datastructures.prefixed_name import PrefixedName
 from ..world_description.connections import ActiveConnection
 from ..world_description.degree_of_freedom import DegreeOfFreedom
+from ..world_description.world_cache import cached_per_world_model
 from ..spatial_types import spatial_types as cas
 
 if TYPE_CHECKING:
@@ -163,14 +165,8 @@ class InverseKinematicsSolver:
         :return: Dictionary mapping DOFs to their computed positions
         """
         target = root._world.transform(target, root)
-        qp_problem = QPProblem(
-            world=self.world,
-            root=root,
-            tip=tip,
-            target=target,
-            dt=dt,
-            max_translation_velocity=translation_velocity,
-            max_rotation_velocity=rotation_velocity,
+        qp_problem = self.get_qp_problem(
+            root, tip, dt, translation_velocity, rotation_velocity
         )
 
         # Initialize solver state
@@ -181,6 +177,7 @@ class InverseKinematicsSolver:
             passive_position=np.array(
                 [self.world.state[dof.id].position for dof in qp_problem.passive_dofs]
             ),
+            target=target.to_np()[:3].flatten(),
         )
 
         # Run iterative solver
@@ -190,6 +187,36 @@ class InverseKinematicsSolver:
 
         return {dof: final_position[i] for i, dof in enumerate(qp_problem.active_dofs)}
 
+    @cached_per_world_model(lambda ik_solver: ik_solver.world._cache_manager)
+    def get_qp_problem(
+        self,
+        root: KinematicStructureEntity,
+        tip: KinematicStructureEntity,
+        dt: float,
+        translation_velocity: float,
+        rotation_velocity: float,
+    ) -> QPProblem:
+        """
+        Returns the compiled QP problem for a kinematic chain.
+        The target pose is a parameter of the compiled functions, such that the problem is only built and compiled
+        once per chain, solver options and version of the world model, and is shared by all solvers of the world.
+
+        :param root: Root body of the kinematic chain
+        :param tip: Tip body of the kinematic chain
+        :param dt: Time step for integration
+        :param translation_velocity: Maximum translation velocity
+        :param rotation_velocity: Maximum rotation velocity
+        :return: The compiled QP problem.
+        """
+        return QPProblem(
+            world=self.world,
+            root=root,
+            tip=tip,
+            dt=dt,
+            max_translation_velocity=translation_velocity,
+            max_rotation_velocity=rotation_velocity,
+        )
+
     def _solve_iteratively(
         self,
         qp_problem: QPProblem,
@@ -230,10 +257,6 @@ class InverseKinematicsSolver:
         # Evaluate QP matrices at current state
         qp_matrices = qp_problem.evaluate_at_state(solver_state)
 
-        # Setup constraint sense (equality for last 6 constraints)
-        sense = np.zeros(qp_matrices.l.shape, dtype=c_int)
-        sense[-6:] = 5  # equality constraints
-
         # Solve QP
         (xstar, fval, exitflag, info) = daqp.solve(
             qp_matrices.H,
@@ -241,7 +264,7 @@ class InverseKinematicsSolver:
             qp_matrices.A,
             qp_matrices.u,
             qp_matrices.l,
-            sense,
+            qp_problem.sense,
         )
 
         if exitflag != 1:
@@ -292,11 +315,6 @@ class QPProblem:
     Tip body of the kinematic chain.
     """
 
-    target: cas.TransformationMatrix
-    """
-    Desired tip pose relative to the root body.
-    """
-
     dt: float
     """
     Time step for integration.
@@ -313,9 +331,11 @@ class QPProblem:
             self.active_variables,
             self.passive_variables,
         ) = self._extract_dofs()
+        self.target_variables, self.target = self._create_target()
         self._setup_constraints()
         self._setup_weights()
         self._compile_functions()
+        self._setup_buffers()
 
     def _extract_dofs(
         self,
@@ -350,6 +370,27 @@ class QPProblem:
 
         return active_dofs, passive_dofs, active_variables, passive_variables
 
+    def _create_target(
+        self,
+    ) -> Tuple[List[cas.FloatVariable], cas.TransformationMatrix]:
+        """
+        Creates the desired tip pose relative to the root body as a symbolic parameter.
+        Only the first three rows of the pose are variables, the last one is constant.
+        :return: The variables of the target in row-major order, and the target pose.
+        """
+        target_variables = [
+            cas.FloatVariable(
+                name=PrefixedName(f"root_T_tip_goal_{row}_{column}", "ik")
+            )
+            for row in range(3)
+            for column in range(4)
+        ]
+        rows = [target_variables[row * 4 : (row + 1) * 4] for row in range(3)]
+        target = cas.TransformationMatrix(
+            rows + [[0, 0, 0, 1]], reference_frame=self.root, sanity_check=False
+        )
+        return target_variables, target
+
     def _setup_constraints(self):
         """Setup all constraints for the QP problem."""
         self.constraint_builder = ConstraintBuilder(
@@ -390,31 +431,75 @@ class QPProblem:
         self.linear_weights = cas.Expression.zeros(*self.quadratic_weights.shape)
 
     def _compile_functions(self):
-        """Compile all symbolic expressions into functions."""
-        variable_args = [self.active_variables, self.passive_variables]
+        """
+        Compile all symbolic expressions into functions.
+        The vectors are compiled into one function, whose output buffer is shared with the QP matrices.
+        """
+        variable_args = [
+            self.active_variables,
+            self.passive_variables,
+            self.target_variables,
+        ]
 
-        self.l_f = self.l.compile(variable_args)
-        self.u_f = self.u.compile(variable_args)
+        self.vectors_f = cas.CompiledFunctionWithViews(
+            expressions=[
+                self.l,
+                self.u,
+                self.quadratic_weights,
+                self.linear_weights,
+            ],
+            variable_parameters=variable_args,
+        )
         self.A_f = self.A.compile(variable_args)
-        self.quadratic_weights_f = self.quadratic_weights.compile(variable_args)
-        self.linear_weights_f = self.linear_weights.compile(variable_args)
-
-    def evaluate_at_state(self, solver_state) -> QPMatrices:
-        """Evaluate QP matrices at the current solver state."""
-        return QPMatrices(
-            H=np.diag(
-                self.quadratic_weights_f(
-                    solver_state.position, solver_state.passive_position
-                )
-            ),
-            g=self.linear_weights_f(
-                solver_state.position, solver_state.passive_position
-            ),
-            A=self.A_f(solver_state.position, solver_state.passive_position),
-            l=self.l_f(solver_state.position, solver_state.passive_position),
-            u=self.u_f(solver_state.position, solver_state.passive_position),
+
+    def _setup_buffers(self):
+        """
+        Allocates the arrays that are passed to the QP solver once, such that solving the QP doesn't allocate memory
+        in each iteration.
+        """
+        l, u, self._quadratic_weights, g = self.vectors_f.split_out_view
+        number_of_variables = self._quadratic_weights.shape[0]
+        self.qp_matrices = QPMatrices(
+            H=np.zeros((number_of_variables, number_of_variables)),
+            g=g,
+            A=self.A_f._out,
+            l=l,
+            u=u,
         )
 
+        # Setup constraint sense (equality for last 6 constraints)
+        self.sense = np.zeros(l.shape, dtype=c_int)
+        self.sense[-6:] = 5  # equality constraints
+
+        self._bound_solver_state = None
+
+    def _bind_solver_state(self, solver_state: SolverState):
+        """
+        Binds the arrays of a solver state to the compiled functions, such that they can be evaluated without arguments.
+        The arrays of the solver state must be updated in place.
+        """
+        args = (
+            solver_state.position,
+            solver_state.passive_position,
+            solver_state.target,
+        )
+        for compiled_function in (self.vectors_f.compiled_function, self.A_f):
+            for arg_idx, arg in enumerate(args):
+                compiled_function.bind_args_to_memory_view(arg_idx, arg)
+        self._bound_solver_state = solver_state
+
+    def evaluate_at_state(self, solver_state: SolverState) -> QPMatrices:
+        """
+        Evaluate QP matrices at the current solver state.
+        The result is written into preallocated buffers, which are overwritten by the next evaluation.
+        """
+        if solver_state is not self._bound_solver_state:
+            self._bind_solver_state(solver_state)
+        self.vectors_f.compiled_function.evaluate()
+        self.A_f.evaluate()
+        np.fill_diagonal(self.qp_matrices.H, self._quadratic_weights)
+        return self.qp_matrices
+
 
 @dataclass
 class ConstraintBuilder:
@@ -439,7 +524,7 @@ class ConstraintBuilder:
 
     target: cas.TransformationMatrix
     """
-    Desired tip pose relative to the root body.
+    Desired tip pose relative to the root body. May contain variables, if the target is a parameter of the problem.
     """
 
     dt: float
@@ -556,9 +641,13 @@ class SolverState:
     Represents the state of the IK solver during iteration.
     """
 
-    def __init__(self, position: np.ndarray, passive_position: np.ndarray):
+    def __init__(
+        self, position: np.ndarray, passive_position: np.ndarray, target: np.ndarray
+    ):
         self.position = position
         self.passive_position = passive_position
+        # first three rows of the desired tip pose relative to the root body, row-major
+        self.target = target
         self.positions_history = []
         self.velocities_history = []
 
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing_extensions import Tuple, List, TYPE_CHECKING
+from uuid import UUID
+
+from typing_extensions import Tuple, List, Optional, Dict, Set, TYPE_CHECKING
 
 import numpy as np
 import trimesh
 from trimesh import Scene
 
-from ..datastructures.types import NpMatrix4x4
+from ..datastructures.types import NpMatrix4x4, NpMatrix4x4Batch
 from ..world_description.world_entity import Body
 from ..spatial_types.spatial_types import GenericSpatialType
 
@@ -38,7 +40,49 @@ class RayTracer:
     """
     scene: Scene
     """
-    The trimesh scene used for ray tracing which mirrors the world.
+    The trimesh scene which mirrors the world, used to place the camera.
+    """
+    _registered_body_ids: Set[UUID]
+    """
+    The ids of all bodies that have nodes in the scene.
+    """
+    _body_node_names: Dict[UUID, List[str]]
+    """
+    Maps the id of a registered body to the names of the scene nodes of its collision shapes.
+    """
+    _body_node_origins: Dict[UUID, np.ndarray]
+    """
+    Maps the id of a registered body to the poses of its scene nodes relative to the body, as N x 4 x 4 array.
+    """
+    _scene_bodies: List[Body]
+    """
+    The registered bodies, in the order of `_scene_body_poses`.
+    """
+    _scene_body_poses: np.ndarray
+    """
+    The poses of the registered bodies the scene nodes were last moved to.
+    NaN for bodies whose nodes were not moved yet.
+    """
+    _static_mesh: Optional[trimesh.Trimesh]
+    """
+    The collision meshes of all bodies that can't move, combined in the world frame.
+    None, if there are no such bodies.
+    """
+    _static_triangle_bodies: np.ndarray
+    """
+    The index of the body each triangle of `_static_mesh` belongs to.
+    """
+    _dynamic_bodies: List[Body]
+    """
+    The bodies with collision meshes whose pose depends on degrees of freedom.
+    """
+    _dynamic_meshes: List[trimesh.Trimesh]
+    """
+    The collision mesh of each body in `_dynamic_bodies` in its own frame.
+    """
+    _dynamic_local_bounds: np.ndarray
+    """
+    The axis-aligned bounding box of each mesh in `_dynamic_meshes`, as N x 2 x 3 array of lower and upper corners.
     """
 
     def __init__(self, world):
@@ -52,6 +96,16 @@ class RayTracer:
         self._last_world_state = -1
         self.index_to_body = {}
         self.scene_to_index = {}
+        self._registered_body_ids = set()
+        self._body_node_names = {}
+        self._body_node_origins = {}
+        self._scene_bodies = []
+        self._scene_body_poses = np.empty((0, 4, 4))
+        self._static_mesh = None
+        self._static_triangle_bodies = np.empty(0, dtype=int)
+        self._dynamic_bodies = []
+        self._dynamic_meshes = []
+        self._dynamic_local_bounds = np.empty((0, 2, 3))
 
         self.scene = Scene()
         self.update_scene()
@@ -62,50 +116,142 @@ class RayTracer:
         This method should be called whenever the world changes to ensure the ray tracer has the latest information.
         """
         if self._last_world_model != self.world.get_world_model_manager().version:
+            self.remove_deleted_bodies()
             self.add_missing_bodies()
+            self.build_ray_intersectors()
             self._last_world_model = self.world.get_world_model_manager().version
+            self._last_world_state = -1
         if self._last_world_state != self.world.state.version:
             self.update_transforms()
             self._last_world_state = self.world.state.version
 
     def add_missing_bodies(self):
         """
-        Adds all bodies from the world to the ray tracer scene that are not already present.
+        Adds all bodies from the world to the ray tracer scene that are not already registered.
+        The nodes of new bodies are placed on the next call of `update_transforms`.
         """
-        # Bodies are added to the scene with their name as the node name plus a suffix for collision geometries.
-        # We check if a body is not in the complete list of all node names in the scene graph.
-        # If the body is not present, we add it to the scene.
         bodies_to_add = [
             body
             for body in self.world.bodies
-            if body.name.name not in "\t".join(self.scene.graph.nodes)
+            if body.collision and body.id not in self._registered_body_ids
         ]
         for body in bodies_to_add:
+            node_names = []
             for i, collision in enumerate(body.collision):
+                node_name = f"{body.id}_collision_{i}"
                 self.scene.add_geometry(
                     collision.mesh,
-                    node_name=body.name.name + f"_collision_{i}",
+                    node_name=node_name,
+                    geom_name=node_name,
                     parent_node_name="world",
-                    transform=self.world.compute_forward_kinematics_np(
-                        self.world.root, body
-                    )
-                    @ collision.origin.to_np(),
                 )
-                self.scene_to_index[body.name.name + f"_collision_{i}"] = body.index
-                self.index_to_body[body.index] = body
+                self.scene_to_index[node_name] = body.index
+                node_names.append(node_name)
+            self.index_to_body[body.index] = body
+            self._registered_body_ids.add(body.id)
+            self._body_node_names[body.id] = node_names
+            self._body_node_origins[body.id] = np.array(
+                [collision.origin.to_np() for collision in body.collision]
+            )
+        if bodies_to_add:
+            self._update_scene_bodies()
+
+    def remove_deleted_bodies(self):
+        """
+        Removes all registered bodies from the ray tracer scene that are no longer part of the world.
+        """
+        body_ids = {body.id for body in self.world.bodies}
+        body_ids_to_remove = self._registered_body_ids - body_ids
+        for body_id in body_ids_to_remove:
+            node_names = self._body_node_names.pop(body_id)
+            self.scene.delete_geometry(node_names)
+            for node_name in node_names:
+                self.scene.graph.transforms.remove_node(node_name)
+                self.index_to_body.pop(self.scene_to_index.pop(node_name), None)
+            del self._body_node_origins[body_id]
+        self._registered_body_ids -= body_ids_to_remove
+        if body_ids_to_remove:
+            self._update_scene_bodies()
+
+    def _update_scene_bodies(self):
+        """
+        Orders the registered bodies and marks the nodes of all of them as not placed.
+        """
+        self._scene_bodies = [
+            body for body in self.world.bodies if body.id in self._registered_body_ids
+        ]
+        self._scene_body_poses = np.full((len(self._scene_bodies), 4, 4), np.nan)
 
-    def update_transforms(self):
+    def build_ray_intersectors(self):
         """
-        Updates the transforms of all bodies in the ray tracer scene.
-        This is necessary to ensure that the ray tracing uses the correct positions and orientations.
+        Builds the meshes that rays are intersected with, which are only valid for the current world model.
+        Bodies that can't move are combined into one mesh in the world frame.
+        Every other body keeps its mesh in its own frame, rays are transformed into that frame instead of moving
+        the mesh, so a state change never requires rebuilding any mesh or its acceleration structure.
         """
+        static_entities = set(self.world.static_kinematic_structure_entities)
+        static_meshes = []
+        static_bodies = []
+        self._dynamic_bodies = []
+        self._dynamic_meshes = []
         for body in self.world.bodies:
-            for i, collision in enumerate(body.collision):
-                transform = (
-                    self.world.compute_forward_kinematics_np(self.world.root, body)
-                    @ collision.origin.to_np()
-                )
-                self.scene.graph[body.name.name + f"_collision_{i}"] = transform
+            if not body.collision:
+                continue
+            mesh = body.collision.combined_mesh
+            if len(mesh.faces) == 0:
+                continue
+            self.index_to_body[body.index] = body
+            if body in static_entities:
+                static_meshes.append(mesh)
+                static_bodies.append(body)
+            else:
+                self._dynamic_bodies.append(body)
+                self._dynamic_meshes.append(mesh)
+
+        if static_bodies:
+            map_T_static_bodies = self._compute_global_poses(static_bodies)
+            static_meshes = [
+                mesh.copy().apply_transform(map_T_body)
+                for mesh, map_T_body in zip(static_meshes, map_T_static_bodies)
+            ]
+            self._static_mesh = trimesh.util.concatenate(static_meshes)
+            self._static_triangle_bodies = np.repeat(
+                [body.index for body in static_bodies],
+                [len(mesh.faces) for mesh in static_meshes],
+            )
+        else:
+            self._static_mesh = None
+            self._static_triangle_bodies = np.empty(0, dtype=int)
+        self._dynamic_local_bounds = np.array(
+            [mesh.bounds for mesh in self._dynamic_meshes]
+        ).reshape(-1, 2, 3)
+
+    def _compute_global_poses(self, bodies: List[Body]) -> NpMatrix4x4Batch:
+        """
+        :param bodies: The bodies to compute the poses of.
+        :return: The poses of the bodies relative to the root of the world, as N x 4 x 4 array.
+        """
+        return self.world.compute_forward_kinematics_np_batch(
+            [self.world.root] * len(bodies), bodies
+        )
+
+    def update_transforms(self):
+        """
+        Updates the transforms of all bodies in the ray tracer scene, whose pose changed since the last update.
+        This keeps the scene a mirror of the world, without touching nodes of bodies that didn't move.
+        """
+        map_T_bodies = self._compute_global_poses(self._scene_bodies)
+        changed_bodies = np.flatnonzero(
+            np.any(map_T_bodies != self._scene_body_poses, axis=(1, 2))
+        )
+        for body_index in changed_bodies:
+            body_id = self._scene_bodies[body_index].id
+            map_T_nodes = map_T_bodies[body_index] @ self._body_node_origins[body_id]
+            for node_name, map_T_node in zip(
+                self._body_node_names[body_id], map_T_nodes
+            ):
+                self.scene.graph[node_name] = map_T_node
+        self._scene_body_poses = map_T_bodies
 
     def create_segmentation_mask(
         self,
@@ -262,19 +408,121 @@ class RayTracer:
             raise ValueError("Origin and target points must have the same shape.")
 
         ray_directions = target_points - origin_points
-        points, index_ray, index_tri = self.scene.to_mesh().ray.intersects_location(
-            origin_points, ray_directions, multiple_hits=multiple_hits
+        points, index_ray, body_indices = self._intersect(
+            origin_points, ray_directions, multiple_hits
         )
         dist = np.linalg.norm(points - origin_points[index_ray], axis=1)
 
         valid_indices = np.where((dist >= min_dist) & (dist <= max_dist))[0]
         points = points[valid_indices]
         index_ray = index_ray[valid_indices]
-        index_tri = index_tri[valid_indices]
-
-        bodies = self.scene.triangles_node[index_tri]
+        body_indices = body_indices[valid_indices]
 
-        # map the name of the scene objects to the index
-        bodies = [self.index_to_body[self.scene_to_index[body]] for body in bodies]
+        bodies = [self.index_to_body[body_index] for body_index in body_indices]
 
         return points, index_ray, bodies
+
+    def _intersect(
+        self, origin_points: np.ndarray, ray_directions: np.ndarray, multiple_hits: bool
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Intersects rays with the static mesh and with the meshes of all dynamic bodies whose bounding box is hit.
+
+        :param origin_points: N x 3 array of ray origins.
+        :param ray_directions: N x 3 array of ray directions.
+        :param multiple_hits: Whether to return all hits or only the closest one of each ray.
+        :return: The hit points, the index of the ray and the index of the body of each hit,
+            sorted by ray and distance from its origin.
+        """
+        all_points = [np.empty((0, 3))]
+        all_index_ray = [np.empty(0, dtype=int)]
+        all_body_indices = [np.empty(0, dtype=int)]
+        if self._static_mesh is not None:
+            points, index_ray, index_tri = self._static_mesh.ray.intersects_location(
+                origin_points, ray_directions, multiple_hits=multiple_hits
+            )
+            all_points.append(points)
+            all_index_ray.append(index_ray)
+            all_body_indices.append(self._static_triangle_bodies[index_tri])
+
+        map_T_bodies = self._compute_global_poses(self._dynamic_bodies)
+        map_R_bodies = map_T_bodies[:, :3, :3]
+        box_centers = (
+            np.einsum(
+                "nij,nj->ni", map_R_bodies, self._dynamic_local_bounds.mean(axis=1)
+            )
+            + map_T_bodies[:, :3, 3]
+        )
+        box_half_extents = np.einsum(
+            "nij,nj->ni",
+            np.abs(map_R_bodies),
+            (self._dynamic_local_bounds[:, 1] - self._dynamic_local_bounds[:, 0]) / 2,
+        )
+        with np.errstate(divide="ignore"):
+            inverse_ray_directions = 1 / ray_directions
+        for body, mesh, map_T_body, box_lower, box_upper in zip(
+            self._dynamic_bodies,
+            self._dynamic_meshes,
+            map_T_bodies,
+            box_centers - box_half_extents,
+            box_centers + box_half_extents,
+        ):
+            rays = self._rays_hitting_box(
+                origin_points, inverse_ray_directions, box_lower, box_upper
+            )
+            if len(rays) == 0:
+                continue
+            map_R_body = map_T_body[:3, :3]
+            map_P_body = map_T_body[:3, 3]
+            body_P_origins = (origin_points[rays] - map_P_body) @ map_R_body
+            body_V_directions = ray_directions[rays] @ map_R_body
+            points, index_ray, _ = mesh.ray.intersects_location(
+                body_P_origins, body_V_directions, multiple_hits=multiple_hits
+            )
+            all_points.append(points @ map_R_body.T + map_P_body)
+            all_index_ray.append(rays[index_ray])
+            all_body_indices.append(np.full(len(index_ray), body.index))
+
+        points = np.concatenate(all_points)
+        index_ray = np.concatenate(all_index_ray)
+        body_indices = np.concatenate(all_body_indices)
+        dist = np.linalg.norm(points - origin_points[index_ray], axis=1)
+        order = np.lexsort((dist, index_ray))
+        points, index_ray, body_indices = (
+            points[order],
+            index_ray[order],
+            body_indices[order],
+        )
+        if not multiple_hits:
+            closest = np.unique(index_ray, return_index=True)[1]
+            points, index_ray, body_indices = (
+                points[closest],
+                index_ray[closest],
+                body_indices[closest],
+            )
+        return points, index_ray, body_indices
+
+    @staticmethod
+    def _rays_hitting_box(
+        origin_points: np.ndarray,
+        inverse_ray_directions: np.ndarray,
+        box_lower: np.ndarray,
+        box_upper: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Slab test of rays against an axis-aligned box.
+
+        :param origin_points: N x 3 array of ray origins.
+        :param inverse_ray_directions: N x 3 array of the element-wise inverse of the ray directions.
+        :param box_lower: The lower corner of the box.
+        :param box_upper: The upper corner of the box.
+        :return: The indices of the rays that hit the box.
+        """
+        with np.errstate(invalid="ignore"):
+            t_lower = (box_lower - origin_points) * inverse_ray_directions
+            t_upper = (box_upper - origin_points) * inverse_ray_directions
+        t_near = np.fmin(t_lower, t_upper)
+        t_far = np.fmax(t_lower, t_upper)
+        t_enter = np.fmax(np.fmax(t_near[:, 0], t_near[:, 1]), t_near[:, 2])
+        t_exit = np.fmin(np.fmin(t_far[:, 0], t_far[:, 1]), t_far[:, 2])
+        return np.flatnonzero(t_exit >= np.maximum(t_enter, 0))
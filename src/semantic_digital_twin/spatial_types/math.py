@@ -1,5 +1,5 @@
 import numpy as np
-from ..datastructures.types import AnyMatrix4x4, NpMatrix4x4
+from ..datastructures.types import AnyMatrix4x4, NpMatrix4x4, NpMatrix4x4Batch
 
 
 def inverse_frame(f1_T_f2: NpMatrix4x4) -> NpMatrix4x4:
@@ -15,3 +15,19 @@ def inverse_frame(f1_T_f2: NpMatrix4x4) -> NpMatrix4x4:
     f2_T_f1[:3, 3] = -Rt @ t
     f2_T_f1[3] = [0, 0, 0, 1]
     return f2_T_f1
+
+
+def inverse_frames(f1_T_f2: NpMatrix4x4Batch) -> NpMatrix4x4Batch:
+    """
+    Batched version of `inverse_frame`.
+
+    :param f1_T_f2: N x 4 x 4 array of transformation matrices
+    :return: N x 4 x 4 array with the inverse of each matrix
+    """
+    Rt = np.swapaxes(f1_T_f2[:, :3, :3], 1, 2)
+    t = f1_T_f2[:, :3, 3]
+    f2_T_f1 = np.zeros_like(f1_T_f2)
+    f2_T_f1[:, :3, :3] = Rt
+    f2_T_f1[:, :3, 3] = -np.einsum("nij,nj->ni", Rt, t)
+    f2_T_f1[:, 3, 3] = 1
+    return f2_T_f1
@@ -94,6 +94,19 @@ class CompiledFunction:
     Used to memorize if the result must be recomputed every time.
     """
 
+    batch_size: ClassVar[int] = 64
+    """
+    The number of evaluations `call_batch` computes with one call of the mapped CasADi function.
+    """
+
+    _batch_buffer: Optional[ca.FunctionBuffer] = field(init=False, default=None)
+    _batch_evaluator: Optional[functools.partial] = field(init=False, default=None)
+    _batch_args: List[np.ndarray] = field(init=False, default_factory=list)
+    _batch_out: np.ndarray = field(init=False, default=None)
+    """
+    Buffers of the mapped function used by `call_batch`, created on its first call.
+    """
+
     def __post_init__(self):
         if self.variable_parameters is None:
             self.variable_parameters = [self.expression.free_variables()]
@@ -298,6 +311,65 @@ class CompiledFunction:
         filtered_args = np.array(args, dtype=float)
         return self(filtered_args)
 
+    def call_batch(self, *args: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the compiled function for many sets of arguments at once.
+        The arguments are evaluated in chunks of `batch_size` by a CasADi map of the function, which is created on
+        the first call and reuses its buffers afterward.
+        In contrast to `__call__`, the result is a new array and the output buffer of `__call__` is not touched.
+        Only supported for dense functions.
+
+        :param args: A 2D numpy array for each List[FloatVariable] in self.variable_parameters.
+            Row i contains the values of the variables for the i-th evaluation.
+        :return: An array with one result per row of the args, stacked along the first axis.
+        """
+        if self._is_constant:
+            number_of_evaluations = len(args[0]) if args else 1
+            return np.broadcast_to(
+                self._out, (number_of_evaluations,) + self._out.shape
+            ).copy()
+        expected_number_of_args = len(self.variable_parameters)
+        actual_number_of_args = len(args)
+        if expected_number_of_args != actual_number_of_args:
+            raise WrongNumberOfArgsError(
+                expected_number_of_args,
+                actual_number_of_args,
+            )
+        if self._batch_evaluator is None:
+            self._setup_batch_function()
+
+        number_of_evaluations = len(args[0])
+        result = np.empty((number_of_evaluations,) + self._out.shape)
+        rows, columns = self._compiled_casadi_function.size_out(0)
+        batch_out = self._batch_out.reshape(
+            (rows, columns, self.batch_size), order="F"
+        ).transpose(2, 0, 1)
+        for start in range(0, number_of_evaluations, self.batch_size):
+            stop = builtins.min(start + self.batch_size, number_of_evaluations)
+            for batch_arg, arg in zip(self._batch_args, args):
+                batch_arg[:, : stop - start] = arg[start:stop].T
+            self._batch_evaluator()
+            result[start:stop] = batch_out[: stop - start].reshape(
+                (stop - start,) + self._out.shape
+            )
+        return result
+
+    def _setup_batch_function(self) -> None:
+        """
+        Setup the CasADi map of the compiled function, and its argument and output buffers, used by `call_batch`.
+        """
+        batch_function = self._compiled_casadi_function.map(self.batch_size)
+        batch_buffer, self._batch_evaluator = batch_function.buffer()
+        self._batch_args = [
+            np.zeros((len(parameters), self.batch_size), order="F")
+            for parameters in self.variable_parameters
+        ]
+        for arg_idx, batch_arg in enumerate(self._batch_args):
+            batch_buffer.set_arg(arg_idx, memoryview(batch_arg))
+        self._batch_out = np.zeros(batch_function.size_out(0), order="F")
+        batch_buffer.set_res(0, memoryview(self._batch_out))
+        self._batch_buffer = batch_buffer
+
 
 @dataclass
 class CompiledFunctionWithViews:
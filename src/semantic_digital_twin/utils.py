@@ -10,7 +10,8 @@ from typing import List
 try:
     from ament_index_python import PackageNotFoundError
 except ModuleNotFoundError:
-    PackageNotFoundError = None
+    # Without ROS, looking up a package fails with the import error, which is caught anyway.
+    PackageNotFoundError = ModuleNotFoundError
 from xml.etree import ElementTree as ET
 
 from typing_extensions import Any, Tuple
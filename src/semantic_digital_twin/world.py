@@ -6,8 +6,8 @@ import logging
 from copy import deepcopy, copy
 from dataclasses import dataclass, field
 from enum import IntEnum
-from functools import wraps, lru_cache, cached_property
-from itertools import combinations_with_replacement
+from functools import wraps, cached_property
+from itertools import chain, combinations_with_replacement
 from uuid import UUID
 
 import numpy as np
@@ -25,16 +25,17 @@ from typing_extensions import (
     Callable,
     Any,
     Iterable,
+    Sequence,
 )
 from typing_extensions import List
 from typing_extensions import Type, Set
 
 from .adapters.world_entity_kwargs_tracker import KinematicStructureEntityKwargsTracker
 from .callbacks.callback import ModelChangeCallback
-from .collision_checking.collision_detector import CollisionDetector
+from .collision_checking.collision_detector import CollisionDetector, CollisionMatrix
 from .collision_checking.trimesh_collision_detector import TrimeshCollisionDetector
 from .datastructures.prefixed_name import PrefixedName
-from .datastructures.types import NpMatrix4x4
+from .datastructures.types import NpMatrix4x4, NpMatrix4x4Batch
 from .exceptions import (
     DuplicateWorldEntityError,
     WorldEntityNotFoundError,
@@ -72,6 +73,11 @@ from .world_description.world_modification import (
     AddActuatorModification,
     RemoveActuatorModification,
 )
+from .world_description.world_cache import WorldCacheManager, cached_per_world_model
+from .world_description.world_entity_registry import (
+    WorldEntityRegistry,
+    WorldEntityIndex,
+)
 from .world_description.world_entity import (
     Connection,
     SemanticAnnotation,
@@ -131,6 +137,37 @@ class ResetStateContextManager:
             self.world.notify_state_change()
 
 
+@dataclass
+class BatchStateUpdateContextManager:
+    """
+    Context manager for batching state changes of a given `World` instance.
+    Calls of `World.notify_state_change` inside the context are suppressed, and it is called exactly once when the
+    outermost context is left.
+    """
+
+    world: World = field(kw_only=True, repr=False)
+    """
+    The world to batch state changes for.
+    """
+
+    first: bool = True
+    """
+    First time flag.
+    """
+
+    def __enter__(self):
+        if self.world.state_is_being_batch_updated:
+            self.first = False
+        self.world.state_is_being_batch_updated = True
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.first:
+            self.world.state_is_being_batch_updated = False
+            # also notify after an exception, such that the forward kinematics match the partially updated state
+            self.world.notify_state_change()
+
+
 @dataclass
 class WorldModelUpdateContextManager:
     """
@@ -243,6 +280,11 @@ def atomic_world_modification(
 class CollisionPairManager:
     """
     Manages disabled collision pairs in the world.
+
+    Pairs are disabled either explicitly, or by rules that apply to all pairs of bodies, like bodies that can't
+    move relative to each other.
+    Rules are stored per body and applied as vectorized operations on a `CollisionMatrix`, such that no Python
+    object is created per pair of bodies.
     """
 
     world: World
@@ -264,6 +306,19 @@ class CollisionPairManager:
     A set of Body pairs for which collisions are temporarily disabled.
     """
 
+    _rigid_body_groups: Dict[Body, int] = field(default_factory=dict, repr=False)
+    """
+    Maps bodies to a label of the group of bodies they are connected to without a controlled connection.
+    Collisions between bodies of the same group are disabled.
+    Computed by `disable_collisions_for_adjacent_bodies`.
+    """
+
+    _non_robot_bodies: Set[Body] = field(default_factory=set, repr=False)
+    """
+    Bodies that don't belong to a robot. Collisions between them are disabled.
+    Computed by `disable_non_robot_collisions`.
+    """
+
     def reset_temporary_collision_config(self):
         self._temp_disabled_collision_pairs = set()
         for body in self.world.bodies_with_enabled_collision:
@@ -273,17 +328,82 @@ class CollisionPairManager:
     def disabled_collision_pairs(
         self,
     ) -> Set[Tuple[Body, Body]]:
-        return self._disabled_collision_pairs | self._temp_disabled_collision_pairs
+        """
+        All explicitly disabled pairs and the pairs disabled by rules.
+        Materializes a tuple per pair, use `compute_collision_matrix` for large worlds.
+        """
+        rule_disabled_pairs = set()
+        groups: Dict[int, List[Body]] = {}
+        for body, group in self._rigid_body_groups.items():
+            groups.setdefault(group, []).append(body)
+        for bodies in chain(groups.values(), [self._non_robot_bodies]):
+            bodies = sorted(bodies, key=lambda body: body.id)
+            rule_disabled_pairs.update(combinations_with_replacement(bodies, 2))
+        return (
+            self._disabled_collision_pairs
+            | self._temp_disabled_collision_pairs
+            | rule_disabled_pairs
+        )
 
     @property
     def enabled_collision_pairs(self) -> Set[Tuple[Body, Body]]:
         """
         The complement of disabled_collision_pairs with respect to all possible body combinations with enabled collision.
+        Materializes a tuple per pair, use `compute_collision_matrix` for large worlds.
+        """
+        return set(self.compute_collision_matrix().pairs())
+
+    def compute_collision_matrix(self, distance: float = 0.0) -> CollisionMatrix:
         """
-        all_combinations = set(
-            combinations_with_replacement(self.world.bodies_with_enabled_collision, 2)
+        Computes which pairs of bodies with enabled collision have to be checked, by removing all disabled pairs
+        from the upper triangle of a boolean matrix.
+
+        :param distance: The minimum distance to check for collisions, for all pairs.
+        :return: The collision matrix over `World.bodies_with_enabled_collision`.
+        """
+        bodies = self.world.bodies_with_enabled_collision
+        number_of_bodies = len(bodies)
+        collision_matrix = CollisionMatrix(
+            bodies=bodies,
+            mask=np.triu(
+                np.ones((number_of_bodies, number_of_bodies), dtype=bool), k=1
+            ),
+            distance=distance,
+            _world=self.world,
+        )
+
+        # bodies without group get unique negative labels, such that they don't match any other body
+        groups = np.array(
+            [
+                self._rigid_body_groups.get(body, -index - 1)
+                for index, body in enumerate(bodies)
+            ],
+            dtype=int,
+        )
+        collision_matrix.mask &= groups[:, None] != groups[None, :]
+
+        is_non_robot_body = np.array(
+            [body in self._non_robot_bodies for body in bodies], dtype=bool
+        )
+        collision_matrix.mask &= ~(
+            is_non_robot_body[:, None] & is_non_robot_body[None, :]
+        )
+
+        body_indices = collision_matrix.body_indices
+        disabled_pair_indices = np.array(
+            [
+                (body_indices[body_a], body_indices[body_b])
+                for body_a, body_b in chain(
+                    self._disabled_collision_pairs, self._temp_disabled_collision_pairs
+                )
+                if body_a in body_indices and body_b in body_indices
+            ],
+            dtype=int,
+        ).reshape(-1, 2)
+        collision_matrix.disable_pairs(
+            disabled_pair_indices[:, 0], disabled_pair_indices[:, 1]
         )
-        return all_combinations - self.disabled_collision_pairs
+        return collision_matrix
 
     def add_temp_disabled_collision_pair(
         self, body_a: KinematicStructureEntity, body_b: KinematicStructureEntity
@@ -344,25 +464,24 @@ class CollisionPairManager:
 
     def disable_collisions_for_adjacent_bodies(self):
         """
-        Computes pairs of bodies that should not be collision checked because they have no controlled connections
-        between them.
+        Disables collisions between bodies that have no controlled connections between them.
 
         When all connections between two bodies are not controlled, these bodies cannot move relative to each
         other, so collision checking between them is unnecessary.
-
-        :return: Set of body pairs that should have collisions disabled
-        """
-
-        body_combinations = combinations_with_replacement(
-            self.world.bodies_with_enabled_collision, 2
-        )
-
-        for body_a, body_b in (
-            (a, b)
-            for a, b in body_combinations
-            if not self.world.is_controlled_connection_in_chain(a, b)
-        ):
-            self.add_disabled_collision_pair(body_a, body_b)
+        Such bodies form groups that are connected to the rest of the world by controlled connections.
+        Instead of computing the chain between every pair of bodies, each body is labeled with its group.
+        """
+        entity_groups: Dict[KinematicStructureEntity, int] = {}
+        for entity in self.world.kinematic_structure_entities_topologically_sorted:
+            parent_connection = self.world.compute_parent_connection(entity)
+            if parent_connection is None or parent_connection.is_controlled:
+                entity_groups[entity] = entity.index
+            else:
+                entity_groups[entity] = entity_groups[parent_connection.parent]
+        self._rigid_body_groups = {
+            body: entity_groups[body]
+            for body in self.world.bodies_with_enabled_collision
+        }
 
     def disable_non_robot_collisions(self) -> None:
         """
@@ -376,15 +495,9 @@ class CollisionPairManager:
         }
 
         # Bodies with collisions that are NOT part of a robot
-        non_robot_bodies: Set[Body] = (
+        self._non_robot_bodies = (
             set(self.world.bodies_with_enabled_collision) - robot_bodies
         )
-        if not non_robot_bodies:
-            return
-
-        # Disable every unordered pair (including self-collisions) exactly once
-        for a, b in combinations_with_replacement(non_robot_bodies, 2):
-            self.add_disabled_collision_pair(a, b)
 
     def add_disabled_collision_pair(self, body_a: Body, body_b: Body):
         """
@@ -440,7 +553,10 @@ class WorldModelManager:
             callback.notify()
 
 
-_LRU_CACHE_SIZE: int = 2048
+world_model_cache = cached_per_world_model(lambda world: world._cache_manager)
+"""
+Caches the result of a `World` method until the next change of the world model.
+"""
 
 
 @dataclass
@@ -487,11 +603,22 @@ class World:
     Is set to True, when a world.modify_world context is used.
     """
 
+    state_is_being_batch_updated: bool = False
+    """
+    Is set to True, when a world.batch_state_update context is used.
+    """
+
     name: Optional[str] = None
     """
     Name of the world. May act as default namespace for all bodies and semantic annotations in the world which do not have a prefix.
     """
 
+    lazy_forward_kinematics: bool = False
+    """
+    If True, a state change only marks the forward kinematics as outdated and they are evaluated on the first access
+    afterward. Useful if the state is written more often than poses are read.
+    """
+
     _atomic_modification_is_being_executed: bool = field(init=False, default=False)
     """
     Flag that indicates if an atomic world operation is currently being executed.
@@ -517,9 +644,31 @@ class World:
     Manages forward kinematics computations for the world.
     """
 
+    _cache_manager: WorldCacheManager = field(
+        init=False, default_factory=WorldCacheManager, repr=False
+    )
+    """
+    Holds the caches of all methods whose results are only valid for the current world model.
+    Invalidated on every model change.
+    """
+
+    _registry: WorldEntityRegistry = field(
+        init=False, default_factory=WorldEntityRegistry, repr=False
+    )
+    """
+    Indexes all world entities by hash, id and name for constant time lookups.
+    Kept up to date by the atomic world modifications.
+    """
+
     def __post_init__(self):
         self._collision_pair_manager = CollisionPairManager(self)
         self.state = WorldState(_world=self)
+        for dof in self.degrees_of_freedom:
+            self._registry.degrees_of_freedom.add(dof)
+        for actuator in self.actuators:
+            self._registry.actuators.add(actuator)
+        for semantic_annotation in self.semantic_annotations:
+            self._registry.semantic_annotations.add(semantic_annotation)
 
     def __hash__(self):
         return hash((id(self), self._model_manager.version))
@@ -551,7 +700,7 @@ class World:
 
     # %% Properties
     @property
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
+    @world_model_cache
     def root(self) -> Optional[KinematicStructureEntity]:
         """
         The root of the world is the unique node with in-degree 0.
@@ -608,6 +757,14 @@ class World:
             and not b.get_collision_config().disabled
         ]
 
+    @property
+    def static_kinematic_structure_entities(self) -> List[KinematicStructureEntity]:
+        """
+        :return: All kinematic structure entities whose pose relative to the root doesn't depend on any degree of
+            freedom, including the root.
+        """
+        return list(self._forward_kinematic_manager.static_entities)
+
     @property
     def bodies_topologically_sorted(self) -> List[Body]:
         return [
@@ -680,6 +837,7 @@ class World:
         self.kinematic_structure.add_edge(
             connection.parent.index, connection.child.index, connection
         )
+        self._registry.connections.add(connection)
 
     def add_body(
         self,
@@ -717,6 +875,7 @@ class World:
         kinematic_structure_entity.index = self.kinematic_structure.add_node(
             kinematic_structure_entity
         )
+        self._registry.kinematic_structure_entities.add(kinematic_structure_entity)
 
     def add_degree_of_freedom(self, dof: DegreeOfFreedom) -> None:
         """
@@ -728,6 +887,20 @@ class World:
         if not self.is_degree_of_freedom_in_world(dof):
             self._add_degree_of_freedom(dof)
 
+    def add_degrees_of_freedom(self, dofs: Iterable[DegreeOfFreedom]) -> None:
+        """
+        Adds multiple degrees of freedom to the world, growing the state at most once.
+        Degrees of freedom that are already in the world are skipped.
+
+        :param dofs: The degrees of freedom to register.
+        """
+        dofs = [dof for dof in dofs if not self.is_degree_of_freedom_in_world(dof)]
+        for dof in dofs:
+            self._raise_error_if_belongs_to_other_world(dof)
+        self.state.reserve(len(self.state) + len(dofs))
+        for dof in dofs:
+            self._add_degree_of_freedom(dof)
+
     @atomic_world_modification(modification=AddDegreeOfFreedomModification)
     def _add_degree_of_freedom(self, dof: DegreeOfFreedom) -> None:
         """
@@ -745,6 +918,7 @@ class World:
         dof.add_to_world(self)
         self.state.add_degree_of_freedom(dof)
         self.degrees_of_freedom.append(dof)
+        self._registry.degrees_of_freedom.add(dof)
 
     def add_semantic_annotation(self, semantic_annotation: SemanticAnnotation) -> None:
         """
@@ -781,6 +955,7 @@ class World:
         """
         semantic_annotation.add_to_world(self)
         self.semantic_annotations.append(semantic_annotation)
+        self._registry.semantic_annotations.add(semantic_annotation)
 
     def add_actuator(self, actuator: Actuator) -> None:
         """
@@ -789,7 +964,7 @@ class World:
 
         :param actuator: The actuator to register.
         """
-        if actuator._world is self and actuator in self.actuators:
+        if actuator._world is self and self.is_actuator_in_world(actuator):
             return
         if actuator._world is not None:
             raise AlreadyBelongsToAWorldError(
@@ -811,6 +986,7 @@ class World:
         """
         actuator._world = self
         self.actuators.append(actuator)
+        self._registry.actuators.add(actuator)
 
     def _raise_error_if_belongs_to_other_world(self, world_entity: WorldEntity):
         """
@@ -850,6 +1026,7 @@ class World:
                 self.kinematic_structure.remove_edge(parent_index, child_index)
             except NoEdgeBetweenNodes:
                 pass
+        self._registry.connections.remove(connection)
         connection.remove_from_world()
 
     def remove_kinematic_structure_entity(
@@ -874,18 +1051,26 @@ class World:
 
         :param kinematic_structure_entity: The kinematic_structure_entity to remove.
         """
-        self.kinematic_structure.remove_node(kinematic_structure_entity.index)
+        # rustworkx implicitly removes all edges of the node, so their connections are no longer in the world
+        index = kinematic_structure_entity.index
+        incident_edges = list(self.kinematic_structure.in_edges(index)) + list(
+            self.kinematic_structure.out_edges(index)
+        )
+        for _, _, connection in incident_edges:
+            self._registry.connections.remove(connection)
+        self.kinematic_structure.remove_node(index)
+        self._registry.kinematic_structure_entities.remove(kinematic_structure_entity)
         kinematic_structure_entity.remove_from_world()
 
     def remove_degree_of_freedom(self, dof: DegreeOfFreedom) -> None:
         if self.is_degree_of_freedom_in_world(dof):
             self._remove_degree_of_freedom(dof)
-            self.get_degree_of_freedom_by_name.cache_clear()
 
     @atomic_world_modification(modification=RemoveDegreeOfFreedomModification)
     def _remove_degree_of_freedom(self, dof: DegreeOfFreedom) -> None:
         dof.remove_from_world()
         self.degrees_of_freedom.remove(dof)
+        self._registry.degrees_of_freedom.remove(dof)
         del self.state[dof.id]
 
     def remove_semantic_annotation(
@@ -906,6 +1091,7 @@ class World:
         """
         semantic_annotation.remove_from_world()
         self.semantic_annotations.remove(semantic_annotation)
+        self._registry.semantic_annotations.remove(semantic_annotation)
 
     def remove_actuator(self, actuator: Actuator) -> None:
         """
@@ -923,6 +1109,7 @@ class World:
         """
         actuator.remove_from_world()
         self.actuators.remove(actuator)
+        self._registry.actuators.remove(actuator)
 
     # %% Other Atomic World Modifications
     @atomic_world_modification(modification=SetDofHasHardwareInterface)
@@ -947,7 +1134,7 @@ class World:
             dof.has_hardware_interface = value
 
     # %% Getter
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
+    @world_model_cache
     def get_connection(
         self, parent: KinematicStructureEntity, child: KinematicStructureEntity
     ) -> Connection:
@@ -956,7 +1143,7 @@ class World:
         """
         return self.kinematic_structure.get_edge_data(parent.index, child.index)
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
+    @world_model_cache
     def get_connections_by_type(
         self, connection_type: Type[GenericConnection]
     ) -> List[GenericConnection]:
@@ -970,7 +1157,7 @@ class World:
             connection_type, self.connections
         )
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
+    @world_model_cache
     def get_semantic_annotations_by_type(
         self, semantic_annotation_type: Type[GenericSemanticAnnotation]
     ) -> List[GenericSemanticAnnotation]:
@@ -984,7 +1171,7 @@ class World:
             semantic_annotation_type, self.semantic_annotations
         )
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
+    @world_model_cache
     def get_kinematic_structure_entity_by_type(
         self, entity_type: Type[GenericKinematicStructureEntity]
     ) -> List[GenericKinematicStructureEntity]:
@@ -1010,59 +1197,52 @@ class World:
         """
         return [entity for entity in iterable if isinstance(entity, world_entity_type)]
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
     def get_semantic_annotation_by_name(
         self, name: Union[str, PrefixedName]
     ) -> SemanticAnnotation:
-        semantic_annotation: SemanticAnnotation = (
-            self._get_world_entity_by_name_from_iterable(
-                name, self.semantic_annotations
-            )
+        return self._get_unique_world_entity_by_name(
+            name, self.get_semantic_annotations_by_name(name)
         )
-        return semantic_annotation
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
     def get_kinematic_structure_entity_by_name(
         self, name: Union[str, PrefixedName]
     ) -> KinematicStructureEntity:
-        return self._get_world_entity_by_name_from_iterable(
-            name, self.kinematic_structure_entities
+        return self._get_unique_world_entity_by_name(
+            name, self.get_kinematic_structure_entities_by_name(name)
         )
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
     def get_body_by_name(self, name: Union[str, PrefixedName]) -> Body:
-        return self._get_world_entity_by_name_from_iterable(name, self.bodies)
+        return self._get_unique_world_entity_by_name(
+            name, self.get_bodies_by_name(name)
+        )
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
     def get_degree_of_freedom_by_name(
         self, name: Union[str, PrefixedName]
     ) -> DegreeOfFreedom:
-        return self._get_world_entity_by_name_from_iterable(
-            name, self.degrees_of_freedom
+        return self._get_unique_world_entity_by_name(
+            name, self.get_degrees_of_freedom_by_name(name)
         )
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
     def get_connection_by_name(self, name: Union[str, PrefixedName]) -> Connection:
-        return self._get_world_entity_by_name_from_iterable(name, self.connections)
+        return self._get_unique_world_entity_by_name(
+            name, self.get_connections_by_name(name)
+        )
 
-    def _get_world_entity_by_name_from_iterable(
-        self,
+    @staticmethod
+    def _get_unique_world_entity_by_name(
         name: Union[str, PrefixedName],
-        world_entity_iterable: Iterable[GenericWorldEntity],
+        matches: List[GenericWorldEntity],
     ) -> GenericWorldEntity:
         """
         If more than one world entity matches the specified name, or if no world entity is found,
         an exception is raised.
         :param name: The name of the entity to retrieve. Can be a string or
             a `PrefixedName` instance.
-        :param world_entity_iterable:
+        :param matches: All world entities with the given name.
         :return: The `WorldEntity` object that matches the given name.
         :raises WorldEntityNotFoundError: If no world entity with the given name exists.
         :raises DuplicateWorldEntityError: If multiple world entities with the given name exist.
         """
-        matches = self._get_world_entities_by_name_from_iterable(
-            name, world_entity_iterable
-        )
         match matches:
             case []:
                 if isinstance(name, PrefixedName):
@@ -1076,155 +1256,110 @@ class World:
             case _:
                 raise DuplicateWorldEntityError(matches)
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
     def get_semantic_annotations_by_name(
         self, name: Union[str, PrefixedName]
     ) -> List[SemanticAnnotation]:
-        return self._get_world_entities_by_name_from_iterable(
-            name, self.semantic_annotations
-        )
+        """
+        Retrieve all semantic annotations with the given name.
+        If only a string was provided, it matches against the name without prefix.
+        If a `PrefixedName` was provided, it matches against the full name including prefix.
+        """
+        return self._registry.semantic_annotations.get_by_name(name)
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
     def get_kinematic_structure_entities_by_name(
         self, name: Union[str, PrefixedName]
     ) -> List[KinematicStructureEntity]:
-        return self._get_world_entities_by_name_from_iterable(
-            name, self.kinematic_structure_entities
-        )
+        """
+        Retrieve all kinematic structure entities with the given name.
+        If only a string was provided, it matches against the name without prefix.
+        If a `PrefixedName` was provided, it matches against the full name including prefix.
+        """
+        return self._registry.kinematic_structure_entities.get_by_name(name)
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
     def get_bodies_by_name(self, name: Union[str, PrefixedName]) -> List[Body]:
-        return self._get_world_entities_by_name_from_iterable(name, self.bodies)
+        """
+        Retrieve all bodies with the given name.
+        If only a string was provided, it matches against the name without prefix.
+        If a `PrefixedName` was provided, it matches against the full name including prefix.
+        """
+        return self._get_world_entity_by_type_from_iterable(
+            Body, self.get_kinematic_structure_entities_by_name(name)
+        )
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
     def get_degrees_of_freedom_by_name(
         self, name: Union[str, PrefixedName]
     ) -> List[DegreeOfFreedom]:
-        return self._get_world_entities_by_name_from_iterable(
-            name, self.degrees_of_freedom
-        )
+        """
+        Retrieve all degrees of freedom with the given name.
+        If only a string was provided, it matches against the name without prefix.
+        If a `PrefixedName` was provided, it matches against the full name including prefix.
+        """
+        return self._registry.degrees_of_freedom.get_by_name(name)
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
     def get_connections_by_name(
         self, name: Union[str, PrefixedName]
     ) -> List[Connection]:
-        return self._get_world_entities_by_name_from_iterable(name, self.connections)
-
-    @staticmethod
-    def _get_world_entities_by_name_from_iterable(
-        name: Union[str, PrefixedName],
-        world_entity_iterable: Iterable[GenericWorldEntity],
-    ) -> List[GenericWorldEntity]:
         """
-        Retrieve a world entity by its name from an iterable of world entities.
-        This iterable would, for example, be self.connections or self.kinematic_structure_entities.
-        This method accepts either a string or a `PrefixedName` instance.
-        It searches through the provided iterable and returns the list of world entities
-        that matches the given name.
+        Retrieve all connections with the given name.
         If only a string was provided, it matches against the name without prefix.
         If a `PrefixedName` was provided, it matches against the full name including prefix.
-        :param name: The name of the world entity to search for.
-        :param world_entity_iterable: The iterable to search for the world entity, for example self.connections or self.kinematic_structure_entities.
-        :return: The list of `WorldEntity` that match the given name.
-        """
-
-        match name:
-            case PrefixedName():
-                return [
-                    world_entity
-                    for world_entity in world_entity_iterable
-                    if world_entity.name == name
-                ]
-            case str():
-                return [
-                    world_entity
-                    for world_entity in world_entity_iterable
-                    if world_entity.name.name == name
-                ]
+        """
+        return self._registry.connections.get_by_name(name)
 
     def get_degree_of_freedom_by_id(self, id: UUID) -> DegreeOfFreedom:
-        return self._get_world_entity_by_hash_from_iterable(
-            hash(id), self.degrees_of_freedom
-        )
+        return self._get_world_entity_by_id(id, self._registry.degrees_of_freedom)
 
     def get_kinematic_structure_entity_by_id(
         self, id: UUID
     ) -> KinematicStructureEntity:
-        return self._get_world_entity_by_hash_from_iterable(
-            hash(id), self.kinematic_structure_entities
+        return self._get_world_entity_by_id(
+            id, self._registry.kinematic_structure_entities
         )
 
     def get_actuator_by_id(self, id: UUID) -> Actuator:
-        return self._get_world_entity_by_hash_from_iterable(hash(id), self.actuators)
+        return self._get_world_entity_by_id(id, self._registry.actuators)
 
-    def _get_world_entity_by_hash_from_iterable(
-        self, entity_hash: int, world_entity_iterable: Iterable[GenericWorldEntity]
+    @staticmethod
+    def _get_world_entity_by_id(
+        id: UUID, index: WorldEntityIndex[GenericWorldEntity]
     ) -> GenericWorldEntity:
         """
-        Retrieve a WorldEntity by its hash.
+        Retrieve a WorldEntity by its id.
 
-        :param entity_hash: The hash of the entity to retrieve.
-        :param world_entity_iterable: The iterable of world entities to search for the entity.
-        :return:
+        :param id: The id of the entity to retrieve.
+        :param index: The registry index of the entity kind to search in.
+        :return: The entity with the given id.
+        :raises WorldEntityNotFoundError: If no world entity with the given id exists.
         """
-        entity = next(
-            (entity for entity in world_entity_iterable if hash(entity) == entity_hash),
-            None,
-        )
+        entity = index.get_by_id(id)
         if entity is None:
-            raise WorldEntityNotFoundError(entity_hash)
+            raise WorldEntityNotFoundError(id)
         return entity
 
     # %% Existence Checks
     def is_semantic_annotation_in_world(
         self, semantic_annotation: SemanticAnnotation
     ) -> bool:
-        return self._is_world_entity_with_hash_in_world_from_iterable(
-            hash(semantic_annotation), self.semantic_annotations
-        )
+        return semantic_annotation in self._registry.semantic_annotations
 
     def is_body_in_world(self, body: Body) -> bool:
-        return self._is_world_entity_with_hash_in_world_from_iterable(
-            hash(body), self.bodies
+        return isinstance(
+            self._registry.kinematic_structure_entities.get_by_hash(hash(body)), Body
         )
 
     def is_kinematic_structure_entity_in_world(
         self, kinematic_structure_entity: KinematicStructureEntity
     ) -> bool:
-        return self._is_world_entity_with_hash_in_world_from_iterable(
-            hash(kinematic_structure_entity), self.kinematic_structure_entities
-        )
+        return kinematic_structure_entity in self._registry.kinematic_structure_entities
 
     def is_connection_in_world(self, connection: Connection) -> bool:
-        return self._is_world_entity_with_hash_in_world_from_iterable(
-            hash(connection), self.connections
-        )
+        return connection in self._registry.connections
 
     def is_degree_of_freedom_in_world(self, degree_of_freedom: DegreeOfFreedom) -> bool:
-        return self._is_world_entity_with_hash_in_world_from_iterable(
-            hash(degree_of_freedom), self.degrees_of_freedom
-        )
+        return degree_of_freedom in self._registry.degrees_of_freedom
 
     def is_actuator_in_world(self, actuator: Actuator) -> bool:
-        return self._is_world_entity_with_hash_in_world_from_iterable(
-            hash(actuator), self.actuators
-        )
-
-    @staticmethod
-    def _is_world_entity_with_hash_in_world_from_iterable(
-        entity_hash: int, world_entity_iterable: Iterable[WorldEntity]
-    ) -> bool:
-        """
-        Check if a world entity with a given hash exists in the world based on a given iterable.
-        :param entity_hash: The hash of the entity to retrieve.
-        :param world_entity_iterable: The iterable of world entities to search for the entity.
-        :return: True if the entity exists, False otherwise.
-        """
-        return any(
-            world_entity
-            for world_entity in world_entity_iterable
-            if hash(world_entity) == entity_hash
-        )
+        return actuator in self._registry.actuators
 
     # %% World Merging
     def merge_world_at_pose(self, other: World, pose: cas.TransformationMatrix) -> None:
@@ -1274,9 +1409,10 @@ class World:
 
     def _merge_dofs_with_state_of_world(self, other: World):
         old_state = deepcopy(other.state)
-        for dof in other.degrees_of_freedom.copy():
+        dofs = other.degrees_of_freedom.copy()
+        for dof in dofs:
             other.remove_degree_of_freedom(dof)
-            self.add_degree_of_freedom(dof)
+        self.add_degrees_of_freedom(dofs)
         for dof_id in old_state.keys():
             self.state[dof_id] = old_state[dof_id]
 
@@ -1321,7 +1457,7 @@ class World:
         self._travel_branch(root, visitor)
         return visitor.connections
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
+    @world_model_cache
     def get_kinematic_structure_entities_of_branch(
         self, root: KinematicStructureEntity
     ) -> List[KinematicStructureEntity]:
@@ -1455,9 +1591,12 @@ class World:
         """
         If you have changed the state of the world, call this function to trigger necessary events and increase
         the state version.
+        Inside a `batch_state_update` context, this is postponed until the context is left.
         """
+        if self.state_is_being_batch_updated:
+            return
         if not self.is_empty():
-            self._forward_kinematic_manager.recompute()
+            self._forward_kinematic_manager.notify_state_change()
         self.state._notify_state_change()
 
     def _notify_model_change(self) -> None:
@@ -1466,6 +1605,8 @@ class World:
         and forward kinematics expressions while also triggering registered callbacks
         for model changes.
         """
+        self._cache_manager.invalidate()
+        self.state._compact()
         self._model_manager.update_model_version_and_notify_callbacks()
         self._compile_forward_kinematics_expressions()
         self.notify_state_change()
@@ -1488,7 +1629,7 @@ class World:
             self.remove_degree_of_freedom(dof)
 
     # %% Kinematic Structure Computations
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
+    @world_model_cache
     def compute_descendent_child_kinematic_structure_entities(
         self, kinematic_structure_entity: KinematicStructureEntity
     ) -> List[KinematicStructureEntity]:
@@ -1500,13 +1641,14 @@ class World:
         children = self.compute_child_kinematic_structure_entities(
             kinematic_structure_entity
         )
+        descendants = list(children)
         for child in children:
-            children.extend(
+            descendants.extend(
                 self.compute_descendent_child_kinematic_structure_entities(child)
             )
-        return children
+        return descendants
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
+    @world_model_cache
     def compute_child_kinematic_structure_entities(
         self, kinematic_structure_entity: KinematicStructureEntity
     ) -> List[KinematicStructureEntity]:
@@ -1519,7 +1661,7 @@ class World:
             self.kinematic_structure.successors(kinematic_structure_entity.index)
         )
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
+    @world_model_cache
     def compute_parent_connection(
         self, kinematic_structure_entity: KinematicStructureEntity
     ) -> Optional[Connection]:
@@ -1539,7 +1681,7 @@ class World:
             )
         )
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
+    @world_model_cache
     def compute_parent_kinematic_structure_entity(
         self, kinematic_structure_entity: KinematicStructureEntity
     ) -> Optional[KinematicStructureEntity]:
@@ -1552,7 +1694,7 @@ class World:
         parent = self.kinematic_structure.predecessors(kinematic_structure_entity.index)
         return parent[0] if parent else None
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
+    @world_model_cache
     def compute_chain_of_connections(
         self, root: KinematicStructureEntity, tip: KinematicStructureEntity
     ) -> List[Connection]:
@@ -1615,7 +1757,7 @@ class World:
         new_tip_body = new_tip.parent if new_tip in downward_chain else new_tip.child
         return new_root_body, new_tip_body
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
+    @world_model_cache
     def compute_split_chain_of_connections(
         self, root: KinematicStructureEntity, tip: KinematicStructureEntity
     ) -> Tuple[List[Connection], List[Connection]]:
@@ -1648,7 +1790,7 @@ class World:
         ]
         return root_connections, tip_connections
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
+    @world_model_cache
     def compute_split_chain_of_kinematic_structure_entities(
         self, root: KinematicStructureEntity, tip: KinematicStructureEntity
     ) -> Tuple[
@@ -1713,7 +1855,7 @@ class World:
 
         return divergence_index - 1
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
+    @world_model_cache
     def compute_chain_of_kinematic_structure_entities(
         self, root: KinematicStructureEntity, tip: KinematicStructureEntity
     ) -> List[KinematicStructureEntity]:
@@ -1725,7 +1867,7 @@ class World:
         )
         return [self.kinematic_structure[index] for index in path_indeces]
 
-    @lru_cache(maxsize=_LRU_CACHE_SIZE)
+    @world_model_cache
     def _compute_chain_of_kinematic_structure_entities_indexes(
         self, root: KinematicStructureEntity, tip: KinematicStructureEntity
     ) -> List[int]:
@@ -1796,6 +1938,21 @@ class World:
         """
         return self._forward_kinematic_manager.compute_np(root, tip).copy()
 
+    def compute_forward_kinematics_np_batch(
+        self,
+        roots: Sequence[KinematicStructureEntity],
+        tips: Sequence[KinematicStructureEntity],
+    ) -> NpMatrix4x4Batch:
+        """
+        Compute the forward kinematics root_T_tip for many pairs of KinematicStructureEntities at once.
+        Much faster than calling `compute_forward_kinematics_np` for every pair, if many poses are needed.
+
+        :param roots: The root KinematicStructureEntity of each pair.
+        :param tips: The tip KinematicStructureEntity of each pair, same length as roots.
+        :return: An N x 4 x 4 array, where entry i is the pose of tips[i] relative to roots[i].
+        """
+        return self._forward_kinematic_manager.compute_np_batch(roots, tips)
+
     def compute_forward_kinematics_of_all_collision_bodies(self) -> np.ndarray:
         """
         Computes a 4 by X matrix, with the forward kinematics of all collision bodies stacked on top each other.
@@ -1849,6 +2006,8 @@ class World:
 
             self.semantic_annotations.clear()
             self.degrees_of_freedom.clear()
+            self._registry.semantic_annotations.clear()
+            self._registry.degrees_of_freedom.clear()
             self.state = WorldState(_world=self)
 
     def is_empty(self):
@@ -1938,6 +2097,15 @@ class World:
     def modify_world(self) -> WorldModelUpdateContextManager:
         return WorldModelUpdateContextManager(world=self)
 
+    def batch_state_update(self) -> BatchStateUpdateContextManager:
+        """
+        Use this context to change the state of multiple degrees of freedom, e.g., via connection setters, while
+        recomputing the forward kinematics and calling the state change callbacks only once at the end.
+
+        :return: A context manager that batches all state change notifications inside it.
+        """
+        return BatchStateUpdateContextManager(world=self)
+
     def reset_state_context(self) -> ResetStateContextManager:
         return ResetStateContextManager(self)
 
@@ -1974,14 +2142,14 @@ class World:
         :param derivative: The derivative level to which the control commands are
             applied.
         """
-        self.state._apply_control_commands(commands, dt, derivative)
-        for connection in self.connections:
-            match connection:
-                case HasUpdateState():
-                    connection.update_state(dt)
-                case _:
-                    pass
-        self.notify_state_change()
+        with self.batch_state_update():
+            self.state._apply_control_commands(commands, dt, derivative)
+            for connection in self.connections:
+                match connection:
+                    case HasUpdateState():
+                        connection.update_state(dt)
+                    case _:
+                        pass
 
     def set_positions_1DOF_connection(
         self, new_state: Dict[ActiveConnection1DOF, float]
@@ -1989,6 +2157,6 @@ class World:
         """
         Set the positions of 1DOF connections and notify the world of the state change.
         """
-        for connection, value in new_state.items():
-            connection.position = value
-        self.notify_state_change()
+        with self.batch_state_update():
+            for connection, value in new_state.items():
+                connection.position = value
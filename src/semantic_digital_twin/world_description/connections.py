@@ -17,7 +17,7 @@ from ..adapters.world_entity_kwargs_tracker import (
 )
 from ..datastructures.prefixed_name import PrefixedName
 from ..datastructures.types import NpMatrix4x4
-from ..spatial_types.derivatives import DerivativeMap
+from ..spatial_types.derivatives import DerivativeMap, Derivatives
 from .connection_properties import JointDynamics
 
 if TYPE_CHECKING:
@@ -70,12 +70,8 @@ class ActiveConnection(Connection):
     @classmethod
     def _from_json(cls, data: Dict[str, Any], **kwargs) -> Self:
         tracker = KinematicStructureEntityKwargsTracker.from_kwargs(kwargs)
-        parent = tracker.get_kinematic_structure_entity(
-            id=from_json(data["parent_id"])
-        )
-        child = tracker.get_kinematic_structure_entity(
-            id=from_json(data["child_id"])
-        )
+        parent = tracker.get_kinematic_structure_entity(id=from_json(data["parent_id"]))
+        child = tracker.get_kinematic_structure_entity(id=from_json(data["child_id"]))
         return cls(
             name=PrefixedName.from_json(data["name"]),
             parent=parent,
@@ -160,12 +156,8 @@ class ActiveConnection1DOF(ActiveConnection, ABC):
     @classmethod
     def _from_json(cls, data: Dict[str, Any], **kwargs) -> Self:
         tracker = KinematicStructureEntityKwargsTracker.from_kwargs(kwargs)
-        parent = tracker.get_kinematic_structure_entity(
-            id=from_json(data["parent_id"])
-        )
-        child = tracker.get_kinematic_structure_entity(
-            id=from_json(data["child_id"])
-        )
+        parent = tracker.get_kinematic_structure_entity(id=from_json(data["parent_id"]))
+        child = tracker.get_kinematic_structure_entity(id=from_json(data["child_id"]))
         return cls(
             name=PrefixedName.from_json(data["name"]),
             parent=parent,
@@ -276,42 +268,58 @@ class ActiveConnection1DOF(ActiveConnection, ABC):
     @property
     def position(self) -> float:
         return (
-            self._world.state[self.raw_dof.id].position * self.multiplier
+            self._world.state.get_value(self.raw_dof, Derivatives.position)
+            * self.multiplier
             + self.offset
         )
 
     @position.setter
     def position(self, value: float) -> None:
-        self._world.state[self.raw_dof.id].position = (
-            value - self.offset
-        ) / self.multiplier
+        self._world.state.set_value(
+            self.raw_dof, (value - self.offset) / self.multiplier, Derivatives.position
+        )
         self._world.notify_state_change()
 
     @property
     def velocity(self) -> float:
-        return self._world.state[self.raw_dof.id].velocity * self.multiplier
+        return (
+            self._world.state.get_value(self.raw_dof, Derivatives.velocity)
+            * self.multiplier
+        )
 
     @velocity.setter
     def velocity(self, value: float) -> None:
-        self._world.state[self.raw_dof.id].velocity = value / self.multiplier
+        self._world.state.set_value(
+            self.raw_dof, value / self.multiplier, Derivatives.velocity
+        )
         self._world.notify_state_change()
 
     @property
     def acceleration(self) -> float:
-        return self._world.state[self.raw_dof.id].acceleration * self.multiplier
+        return (
+            self._world.state.get_value(self.raw_dof, Derivatives.acceleration)
+            * self.multiplier
+        )
 
     @acceleration.setter
     def acceleration(self, value: float) -> None:
-        self._world.state[self.raw_dof.id].acceleration = value / self.multiplier
+        self._world.state.set_value(
+            self.raw_dof, value / self.multiplier, Derivatives.acceleration
+        )
         self._world.notify_state_change()
 
     @property
     def jerk(self) -> float:
-        return self._world.state[self.raw_dof.id].jerk * self.multiplier
+        return (
+            self._world.state.get_value(self.raw_dof, Derivatives.jerk)
+            * self.multiplier
+        )
 
     @jerk.setter
     def jerk(self, value: float) -> None:
-        self._world.state[self.raw_dof.id].jerk = value / self.multiplier
+        self._world.state.set_value(
+            self.raw_dof, value / self.multiplier, Derivatives.jerk
+        )
         self._world.notify_state_change()
 
     def copy_for_world(self, world: World):
@@ -411,12 +419,8 @@ class Connection6DoF(Connection):
     @classmethod
     def _from_json(cls, data: Dict[str, Any], **kwargs) -> Self:
         tracker = KinematicStructureEntityKwargsTracker.from_kwargs(kwargs)
-        parent = tracker.get_kinematic_structure_entity(
-            id=from_json(data["parent_id"])
-        )
-        child = tracker.get_kinematic_structure_entity(
-            id=from_json(data["child_id"])
-        )
+        parent = tracker.get_kinematic_structure_entity(id=from_json(data["parent_id"]))
+        child = tracker.get_kinematic_structure_entity(id=from_json(data["child_id"]))
         return cls(
             name=PrefixedName.from_json(data["name"]),
             parent=parent,
@@ -559,13 +563,9 @@ class Connection6DoF(Connection):
             transformation = cas.TransformationMatrix(data=transformation)
         position = transformation.to_position().to_np()
         orientation = transformation.to_rotation_matrix().to_quaternion().to_np()
-        self._world.state[self.x.id].position = position[0]
-        self._world.state[self.y.id].position = position[1]
-        self._world.state[self.z.id].position = position[2]
-        self._world.state[self.qx.id].position = orientation[0]
-        self._world.state[self.qy.id].position = orientation[1]
-        self._world.state[self.qz.id].position = orientation[2]
-        self._world.state[self.qw.id].position = orientation[3]
+        self._world.state.set_positions(
+            self.passive_dofs, np.concatenate((position[:3], orientation))
+        )
         self._world.notify_state_change()
 
     def copy_for_world(self, world: World) -> Connection6DoF:
@@ -639,12 +639,8 @@ class OmniDrive(ActiveConnection, HasUpdateState):
     @classmethod
     def _from_json(cls, data: Dict[str, Any], **kwargs) -> Self:
         tracker = KinematicStructureEntityKwargsTracker.from_kwargs(kwargs)
-        parent = tracker.get_kinematic_structure_entity(
-            id=from_json(data["parent_id"])
-        )
-        child = tracker.get_kinematic_structure_entity(
-            id=from_json(data["child_id"])
-        )
+        parent = tracker.get_kinematic_structure_entity(id=from_json(data["parent_id"]))
+        child = tracker.get_kinematic_structure_entity(id=from_json(data["child_id"]))
         return cls(
             name=PrefixedName.from_json(data["name"], **kwargs),
             parent=parent,
@@ -814,16 +810,18 @@ class OmniDrive(ActiveConnection, HasUpdateState):
 
     def update_state(self, dt: float) -> None:
         state = self._world.state
-        state[self.x_velocity.id].position = 0
-        state[self.y_velocity.id].position = 0
+        state.set_value(self.x_velocity, 0)
+        state.set_value(self.y_velocity, 0)
 
-        x_vel = state[self.x_velocity.id].velocity
-        y_vel = state[self.y_velocity.id].velocity
-        delta = state[self.yaw.id].position
+        x_vel = state.get_value(self.x_velocity, Derivatives.velocity)
+        y_vel = state.get_value(self.y_velocity, Derivatives.velocity)
+        delta = state.get_value(self.yaw)
         x_velocity = np.cos(delta) * x_vel - np.sin(delta) * y_vel
-        state[self.x.id].position += x_velocity * dt
         y_velocity = np.sin(delta) * x_vel + np.cos(delta) * y_vel
-        state[self.y.id].position += y_velocity * dt
+        x, y = state.get_positions([self.x, self.y])
+        state.set_positions(
+            [self.x, self.y], [x + x_velocity * dt, y + y_velocity * dt]
+        )
 
     @property
     def origin(self) -> cas.TransformationMatrix:
@@ -842,9 +840,9 @@ class OmniDrive(ActiveConnection, HasUpdateState):
             transformation = cas.TransformationMatrix(data=transformation)
         position = transformation.to_position()
         roll, pitch, yaw = transformation.to_rotation_matrix().to_rpy()
-        self._world.state[self.x.id].position = position.x.to_np()
-        self._world.state[self.y.id].position = position.y.to_np()
-        self._world.state[self.yaw.id].position = yaw.to_np()
+        self._world.state.set_value(self.x, position.x.to_np())
+        self._world.state.set_value(self.y, position.y.to_np())
+        self._world.state.set_value(self.yaw, yaw.to_np())
         self._world.notify_state_change()
 
     def get_free_variable_names(self) -> List[UUID]:
@@ -25,7 +25,7 @@ class PositionVariable(cas.FloatVariable):
     """ Backreference """
 
     def resolve(self) -> float:
-        return self.dof._world.state[self.dof.id].position
+        return self.dof._world.state.get_value(self.dof, Derivatives.position)
 
 
 @dataclass(eq=False)
@@ -39,7 +39,7 @@ class VelocityVariable(cas.FloatVariable):
     """ Backreference """
 
     def resolve(self) -> float:
-        return self.dof._world.state[self.dof.id].velocity
+        return self.dof._world.state.get_value(self.dof, Derivatives.velocity)
 
 
 @dataclass(eq=False)
@@ -53,7 +53,7 @@ class AccelerationVariable(cas.FloatVariable):
     """ Backreference """
 
     def resolve(self) -> float:
-        return self.dof._world.state[self.dof.id].acceleration
+        return self.dof._world.state.get_value(self.dof, Derivatives.acceleration)
 
 
 @dataclass(eq=False)
@@ -67,7 +67,7 @@ class JerkVariable(cas.FloatVariable):
     """ Backreference """
 
     def resolve(self) -> float:
-        return self.dof._world.state[self.dof.id].jerk
+        return self.dof._world.state.get_value(self.dof, Derivatives.jerk)
 
 
 @dataclass(eq=False)
@@ -104,6 +104,16 @@ class DegreeOfFreedom(WorldEntityWithID, SubclassJSONSerializer):
     A door hinge also has a dof that cannot be controlled.
     """
 
+    _state_column: int = field(init=False, default=-1, repr=False)
+    """
+    Cached column of this dof in the world state, see `WorldState.get_column`.
+    """
+
+    _state_layout_version: int = field(init=False, default=-1, repr=False)
+    """
+    The layout version of the world state for which `_state_column` is valid.
+    """
+
     def __post_init__(self):
         self.lower_limits = self.lower_limits or DerivativeMap()
         self.upper_limits = self.upper_limits or DerivativeMap()
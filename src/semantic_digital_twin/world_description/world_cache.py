@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import wraps
+
+from typing_extensions import Any, Callable, Dict, Hashable, TypeVar
+
+GenericFunction = TypeVar("GenericFunction", bound=Callable)
+
+
+@dataclass
+class CacheStatistics:
+    """
+    Statistics of a single cache in a `WorldCacheManager`.
+    """
+
+    hits: int = 0
+    """
+    Number of calls that were answered from the cache.
+    """
+
+    misses: int = 0
+    """
+    Number of calls that had to be computed.
+    """
+
+    size: int = 0
+    """
+    Number of entries currently stored in the cache.
+    """
+
+
+@dataclass
+class WorldCacheManager:
+    """
+    Holds all caches of results that are only valid for one version of a world model.
+
+    In contrast to `functools.lru_cache`, the caches are owned by the world and are cleared explicitly when the model
+    changes, instead of keying entries by a hash that contains the model version.
+    Entries of old model versions are therefore never kept alive, and don't evict entries of other worlds.
+    """
+
+    _caches: Dict[str, Dict[Hashable, Any]] = field(default_factory=dict)
+    """
+    Maps the name of a cache to its entries.
+    """
+
+    _statistics: Dict[str, CacheStatistics] = field(default_factory=dict)
+    """
+    Maps the name of a cache to its hit and miss counters.
+    """
+
+    invalidations: int = 0
+    """
+    How often all caches were cleared.
+    """
+
+    def get_cache(self, name: str) -> Dict[Hashable, Any]:
+        """
+        :param name: The name of the cache, typically the qualified name of the cached function.
+        :return: The entries of the cache, created if it doesn't exist yet.
+        """
+        try:
+            return self._caches[name]
+        except KeyError:
+            self._statistics[name] = CacheStatistics()
+            cache = self._caches[name] = {}
+            return cache
+
+    def invalidate(self) -> None:
+        """
+        Clears all caches. Must be called whenever the world model changes.
+        """
+        for cache in self._caches.values():
+            cache.clear()
+        self.invalidations += 1
+
+    @property
+    def statistics(self) -> Dict[str, CacheStatistics]:
+        """
+        :return: A snapshot of the statistics of every cache, keyed by cache name.
+        """
+        return {
+            name: CacheStatistics(
+                hits=statistics.hits,
+                misses=statistics.misses,
+                size=len(self._caches[name]),
+            )
+            for name, statistics in self._statistics.items()
+        }
+
+    @property
+    def size(self) -> int:
+        """
+        :return: The total number of entries in all caches.
+        """
+        return sum(len(cache) for cache in self._caches.values())
+
+    def reset_statistics(self) -> None:
+        """
+        Resets the hit and miss counters of all caches.
+        """
+        for statistics in self._statistics.values():
+            statistics.hits = 0
+            statistics.misses = 0
+
+
+def cached_per_world_model(
+    get_cache_manager: Callable[[Any], WorldCacheManager],
+) -> Callable[[GenericFunction], GenericFunction]:
+    """
+    Decorator for methods whose result only depends on their arguments and the current world model.
+    Results are stored in the `WorldCacheManager` returned by `get_cache_manager` and are dropped when it is invalidated.
+    All arguments must be hashable.
+
+    :param get_cache_manager: Returns the cache manager for the instance the method is called on.
+    """
+
+    def decorator(func: GenericFunction) -> GenericFunction:
+        name = func.__qualname__
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            cache_manager = get_cache_manager(self)
+            cache = cache_manager.get_cache(name)
+            try:
+                result = cache[key]
+            except KeyError:
+                cache_manager._statistics[name].misses += 1
+                result = cache[key] = func(self, *args, **kwargs)
+                return result
+            cache_manager._statistics[name].hits += 1
+            return result
+
+        return wrapper
+
+    return decorator
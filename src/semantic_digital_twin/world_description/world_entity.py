@@ -50,6 +50,7 @@ from ..spatial_types.spatial_types import TransformationMatrix, Expression, Poin
 from ..utils import IDGenerator, type_string_to_type, camel_case_split
 
 if TYPE_CHECKING:
+    from ..collision_checking.signed_distance_field import SignedDistanceFieldCache
     from ..world_description.degree_of_freedom import DegreeOfFreedom
     from ..world import World, GenericSemanticAnnotation
 
@@ -361,11 +362,72 @@ class Body(KinematicStructureEntity, SubclassJSONSerializer):
         return len(self.collision) > 0
 
     def compute_closest_points_multi(
-        self, others: list[Body], sample_size=25
+        self,
+        others: list[Body],
+        sample_size=25,
+        signed_distance_fields: Optional[SignedDistanceFieldCache] = None,
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Computes the closest points to each given body respectively.
 
+        :param others: The list of bodies to compute the closest points to.
+        :param sample_size: The number of samples to take from the surface of the other bodies.
+        :param signed_distance_fields: If given, the closest points to static bodies are looked up in their signed
+            distance fields, instead of sampling their surface. The distances to those bodies are signed, and off
+            by at most `SignedDistanceFieldCache.max_error`.
+        :return: A tuple containing: The points on the self body, the points on the other bodies, and the distances. All points are in the of this body.
+        """
+        if signed_distance_fields is None:
+            return self._compute_closest_points_by_sampling(others, sample_size)
+
+        static_entities = set(self._world.static_kinematic_structure_entities)
+        uses_field = np.array(
+            [other in static_entities for other in others], dtype=bool
+        )
+        points_self = np.empty((len(others), 3))
+        points_other = np.empty((len(others), 3))
+        distances = np.empty(len(others))
+        if not np.all(uses_field):
+            (
+                points_self[~uses_field],
+                points_other[~uses_field],
+                distances[~uses_field],
+            ) = self._compute_closest_points_by_sampling(
+                [
+                    other
+                    for other, other_uses_field in zip(others, uses_field)
+                    if not other_uses_field
+                ],
+                sample_size,
+            )
+
+        shape_T_self = np.linalg.inv(self.collision[0].origin.to_np())
+        for index in np.flatnonzero(uses_field):
+            other = others[index]
+            distance, other_P_other, other_P_self = (
+                signed_distance_fields.compute_distance(
+                    other, self, self._world.compute_forward_kinematics_np(other, self)
+                )
+            )
+            shape_T_other = shape_T_self @ self._world.compute_forward_kinematics_np(
+                self, other
+            )
+            points_self[index] = (
+                shape_T_other[:3, :3] @ other_P_self + shape_T_other[:3, 3]
+            )
+            points_other[index] = (
+                shape_T_other[:3, :3] @ other_P_other + shape_T_other[:3, 3]
+            )
+            distances[index] = distance
+        return points_self, points_other, distances
+
+    def _compute_closest_points_by_sampling(
+        self, others: list[Body], sample_size: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Computes the closest points to each given body respectively, by sampling points on the surface of the other
+        bodies close to this body.
+
         :param others: The list of bodies to compute the closest points to.
         :param sample_size: The number of samples to take from the surface of the other bodies.
         :return: A tuple containing: The points on the self body, the points on the other bodies, and the distances. All points are in the of this body.
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from typing_extensions import (
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    TYPE_CHECKING,
+)
+
+from ..datastructures.prefixed_name import PrefixedName
+
+if TYPE_CHECKING:
+    from .degree_of_freedom import DegreeOfFreedom
+    from .world_entity import (
+        WorldEntity,
+        KinematicStructureEntity,
+        Connection,
+        SemanticAnnotation,
+        Actuator,
+    )
+
+GenericIndexedWorldEntity = TypeVar("GenericIndexedWorldEntity", bound="WorldEntity")
+
+
+@dataclass
+class WorldEntityIndex(Generic[GenericIndexedWorldEntity]):
+    """
+    Index over one kind of world entity, that allows constant time lookups by hash, id, full name and short name.
+
+    The keys of an entity are computed when it is added, and the same keys are used when it is removed.
+    Entities are therefore found for removal, even if their hash changed in the meantime.
+    """
+
+    _by_hash: Dict[int, GenericIndexedWorldEntity] = field(default_factory=dict)
+    """
+    Maps the hash of an entity to the entity.
+    """
+
+    _by_id: Dict[UUID, GenericIndexedWorldEntity] = field(default_factory=dict)
+    """
+    Maps the id of an entity to the entity. Only contains entities that have an id.
+    """
+
+    _by_name: Dict[PrefixedName, List[GenericIndexedWorldEntity]] = field(
+        default_factory=dict
+    )
+    """
+    Maps the full name, including prefix, to all entities with that name.
+    """
+
+    _by_short_name: Dict[str, List[GenericIndexedWorldEntity]] = field(
+        default_factory=dict
+    )
+    """
+    Maps the name without prefix to all entities with that name.
+    """
+
+    _keys: Dict[
+        int, Tuple[int, Optional[UUID], Optional[PrefixedName]]
+    ] = field(default_factory=dict, repr=False)
+    """
+    Maps the memory id of an entity to the hash, id and name it was indexed with.
+    """
+
+    def add(self, entity: GenericIndexedWorldEntity) -> None:
+        """
+        Adds an entity to the index. Adding an entity that is already indexed has no effect.
+
+        :param entity: The entity to add.
+        """
+        if id(entity) in self._keys:
+            return
+        entity_hash = hash(entity)
+        entity_id: Optional[UUID] = getattr(entity, "id", None)
+        name: Optional[PrefixedName] = entity.name
+        self._keys[id(entity)] = (entity_hash, entity_id, name)
+
+        self._by_hash[entity_hash] = entity
+        if entity_id is not None:
+            self._by_id[entity_id] = entity
+        if name is not None:
+            self._by_name.setdefault(name, []).append(entity)
+            self._by_short_name.setdefault(name.name, []).append(entity)
+
+    def remove(self, entity: GenericIndexedWorldEntity) -> None:
+        """
+        Removes an entity from the index. Removing an entity that is not indexed has no effect.
+
+        :param entity: The entity to remove.
+        """
+        keys = self._keys.pop(id(entity), None)
+        if keys is None:
+            return
+        entity_hash, entity_id, name = keys
+
+        if self._by_hash.get(entity_hash) is entity:
+            del self._by_hash[entity_hash]
+        if entity_id is not None and self._by_id.get(entity_id) is entity:
+            del self._by_id[entity_id]
+        if name is not None:
+            self._remove_from_bucket(self._by_name, name, entity)
+            self._remove_from_bucket(self._by_short_name, name.name, entity)
+
+    @staticmethod
+    def _remove_from_bucket(
+        buckets: Dict, key: Union[str, PrefixedName], entity: GenericIndexedWorldEntity
+    ) -> None:
+        """
+        Removes an entity from a list of entities sharing the same key, and drops the list if it becomes empty.
+        Entities are compared by identity, since different entities may compare equal.
+        """
+        bucket = buckets.get(key)
+        if bucket is None:
+            return
+        bucket[:] = [other for other in bucket if other is not entity]
+        if not bucket:
+            del buckets[key]
+
+    def clear(self) -> None:
+        """
+        Removes all entities from the index.
+        """
+        self._by_hash.clear()
+        self._by_id.clear()
+        self._by_name.clear()
+        self._by_short_name.clear()
+        self._keys.clear()
+
+    def get_by_hash(self, entity_hash: int) -> Optional[GenericIndexedWorldEntity]:
+        """
+        :param entity_hash: The hash of the entity.
+        :return: The entity with the given hash, or None if there is none.
+        """
+        return self._by_hash.get(entity_hash)
+
+    def get_by_id(self, entity_id: UUID) -> Optional[GenericIndexedWorldEntity]:
+        """
+        :param entity_id: The id of the entity.
+        :return: The entity with the given id, or None if there is none.
+        """
+        return self._by_id.get(entity_id)
+
+    def get_by_name(
+        self, name: Union[str, PrefixedName]
+    ) -> List[GenericIndexedWorldEntity]:
+        """
+        If only a string is provided, it is matched against the name without prefix.
+        If a `PrefixedName` is provided, it is matched against the full name including prefix.
+
+        :param name: The name of the entities.
+        :return: A new list with all entities with the given name, in the order they were added.
+        """
+        match name:
+            case PrefixedName():
+                return list(self._by_name.get(name, ()))
+            case str():
+                return list(self._by_short_name.get(name, ()))
+        return []
+
+    def __contains__(self, entity: GenericIndexedWorldEntity) -> bool:
+        """
+        :return: True if the entity itself is indexed, even if its hash changed since it was added, or if an
+            entity with the same hash is indexed.
+        """
+        return id(entity) in self._keys or hash(entity) in self._by_hash
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+@dataclass
+class WorldEntityRegistry:
+    """
+    Owned by a world to look up its entities by hash, id or name in constant time.
+    The world keeps the registry up to date inside its atomic world modifications.
+    """
+
+    kinematic_structure_entities: WorldEntityIndex[KinematicStructureEntity] = field(
+        default_factory=WorldEntityIndex
+    )
+    connections: WorldEntityIndex[Connection] = field(default_factory=WorldEntityIndex)
+    degrees_of_freedom: WorldEntityIndex[DegreeOfFreedom] = field(
+        default_factory=WorldEntityIndex
+    )
+    semantic_annotations: WorldEntityIndex[SemanticAnnotation] = field(
+        default_factory=WorldEntityIndex
+    )
+    actuators: WorldEntityIndex[Actuator] = field(default_factory=WorldEntityIndex)
+
+    def clear(self) -> None:
+        """
+        Removes all entities from all indices.
+        """
+        self.kinematic_structure_entities.clear()
+        self.connections.clear()
+        self.degrees_of_freedom.clear()
+        self.semantic_annotations.clear()
+        self.actuators.clear()
@@ -1,9 +1,18 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
+from itertools import count
 from typing import Union, Iterator
 from uuid import UUID
 
-from typing_extensions import MutableMapping, List, Dict, Self, TYPE_CHECKING
+from typing_extensions import (
+    MutableMapping,
+    List,
+    Dict,
+    Iterable,
+    Optional,
+    Self,
+    TYPE_CHECKING,
+)
 
 import numpy as np
 
@@ -21,6 +30,11 @@ from ..spatial_types import spatial_types as cas
 if TYPE_CHECKING:
     from ..world import World
 
+_layout_versions = count()
+"""
+Source of layout versions, such that they are unique among all world states.
+"""
+
 
 class WorldStateView:
     """
@@ -76,19 +90,46 @@ class WorldState(MutableMapping):
     Tracks the state of all DOF in the world.
     Data is stored in a 4xN numpy array, such that it can be used as input for compiled functions without copying.
 
+    The array is a view on a larger buffer, which grows geometrically, such that adding a DOF is amortized O(1).
+    Removed DOFs only leave a tombstone column behind, all tombstones are compacted at once on the next access of the
+    data, while preserving the order of the remaining DOFs.
+
     This class adds a few convenience methods for manipulating this data.
     """
 
     _world: World = field(default=None)
 
-    # 4 rows (pos, vel, acc, jerk), columns are joints
-    data: np.ndarray = field(default_factory=lambda: np.zeros((4, 0), dtype=float))
+    _data: np.ndarray = field(default_factory=lambda: np.zeros((4, 0), dtype=float))
+    """
+    Column buffer with 4 rows (pos, vel, acc, jerk) and one column per DOF.
+    Only the first `_size` columns are in use, including the columns of removed DOFs that were not compacted yet.
+    """
 
-    # list of dof ids in column order
-    _ids: List[UUID] = field(default_factory=list)
+    _ids: List[Optional[UUID]] = field(default_factory=list)
+    """
+    List of dof ids in column order. Removed DOFs are marked with None until the next compaction.
+    """
 
-    # maps dof ids -> column index
     _index: Dict[UUID, int] = field(default_factory=dict)
+    """
+    Maps dof ids -> column index.
+    """
+
+    _size: int = field(init=False, default=0)
+    """
+    Number of columns of `_data` that are in use.
+    """
+
+    _number_of_tombstones: int = field(init=False, default=0)
+    """
+    Number of columns in use that belong to removed DOFs.
+    """
+
+    _data_view: np.ndarray = field(init=False, repr=False)
+    """
+    The view on the used columns of `_data`, returned by `data`.
+    Only recreated when the layout changes, such that it can be passed to compiled functions repeatedly.
+    """
 
     version: int = 0
     """
@@ -96,6 +137,14 @@ class WorldState(MutableMapping):
     Mostly triggered by updating connection values.
     """
 
+    layout_version: int = field(init=False, default=0)
+    """
+    Changes whenever columns are added, removed or reordered, and is unique among all world states.
+    Column indices of DOFs are only valid for one layout version.
+    Consumers that map other column orders onto this state, like the synchronization of binary state updates, rely on
+    it to notice new DOFs, too.
+    """
+
     state_change_callbacks: List[StateChangeCallback] = field(
         default_factory=list, repr=False
     )
@@ -103,6 +152,22 @@ class WorldState(MutableMapping):
     Callbacks to be called when the state of the world changes.
     """
 
+    def __post_init__(self):
+        self._data = np.asarray(self._data, dtype=float)
+        self._size = self._data.shape[1]
+        self._data_view = self._data[:, : self._size]
+        self.layout_version = next(_layout_versions)
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        4xN array where rows are derivatives and columns are dof values for that derivative.
+        This is a view on the used columns of a larger buffer, so each row is contiguous in memory, but the array as
+        a whole is not C-contiguous, unless the buffer is full.
+        """
+        self._compact()
+        return self._data_view
+
     def _notify_state_change(self) -> None:
         """
         If you have changed the state of the world, call this function to trigger necessary events and increase
@@ -112,26 +177,142 @@ class WorldState(MutableMapping):
         for callback in self.state_change_callbacks:
             callback.notify()
 
+    def _update_data_view(self) -> None:
+        self._data_view = self._data[:, : self._size]
+
+    def reserve(self, number_of_dofs: int) -> None:
+        """
+        Makes sure that the buffer has room for the given number of DOFs, without reallocating.
+
+        :param number_of_dofs: The total number of DOFs the state should be able to hold.
+        """
+        capacity = self._data.shape[1]
+        if capacity >= number_of_dofs:
+            return
+        new_data = np.zeros((4, max(number_of_dofs, 2 * capacity)), dtype=float)
+        new_data[:, : self._size] = self._data[:, : self._size]
+        self._data = new_data
+        self._update_data_view()
+
+    def _compact(self) -> None:
+        """
+        Removes the columns of all removed DOFs, while keeping the order of the remaining ones.
+        Column indices in `_index` are only valid after calling this.
+        """
+        if not self._number_of_tombstones:
+            return
+        alive_columns = [
+            column for column, dof_id in enumerate(self._ids) if dof_id is not None
+        ]
+        self._size = len(alive_columns)
+        self._data[:, : self._size] = self._data[:, alive_columns]
+        self._ids = [self._ids[column] for column in alive_columns]
+        self._index = {dof_id: column for column, dof_id in enumerate(self._ids)}
+        self._number_of_tombstones = 0
+        self._update_data_view()
+        self.layout_version = next(_layout_versions)
+
     def _add_dof(self, uuid: UUID) -> None:
-        idx = len(self._ids)
+        self._compact()
+        self.reserve(self._size + 1)
+        idx = self._size
         self._ids.append(uuid)
         self._index[uuid] = idx
         # append a zero column
-        new_col = np.zeros((4, 1), dtype=float)
-        if self.data.shape[1] == 0:
-            self.data = new_col
-        else:
-            self.data = np.hstack((self.data, new_col))
+        self._data[:, idx] = 0
+        self._size += 1
+        self._update_data_view()
+        self.layout_version = next(_layout_versions)
+
+    def get_column(self, dof: DegreeOfFreedom) -> int:
+        """
+        The column is cached on the degree of freedom until the layout of the state changes.
+
+        :param dof: A degree of freedom in this state.
+        :return: The column of the degree of freedom in `data`.
+        """
+        self._compact()
+        if dof._state_layout_version != self.layout_version:
+            try:
+                dof._state_column = self._index[dof.id]
+            except KeyError:
+                raise DofNotInWorldStateError(dof.id)
+            dof._state_layout_version = self.layout_version
+        return dof._state_column
+
+    def get_columns(self, dofs: Iterable[DegreeOfFreedom]) -> np.ndarray:
+        """
+        :param dofs: Degrees of freedom in this state.
+        :return: An index array with the columns of the degrees of freedom in `data`.
+            It stays valid as long as `layout_version` doesn't change.
+        """
+        return np.fromiter((self.get_column(dof) for dof in dofs), dtype=int)
+
+    def _as_columns(
+        self, dofs: Union[Iterable[DegreeOfFreedom], np.ndarray]
+    ) -> np.ndarray:
+        if isinstance(dofs, np.ndarray):
+            self._compact()
+            return dofs
+        return self.get_columns(dofs)
+
+    def get_value(
+        self, dof: DegreeOfFreedom, derivative: Derivatives = Derivatives.position
+    ) -> float:
+        """
+        :param dof: A degree of freedom in this state.
+        :param derivative: The derivative to read.
+        :return: The value of the derivative of the degree of freedom.
+        """
+        return self._data[derivative, self.get_column(dof)]
+
+    def set_value(
+        self,
+        dof: DegreeOfFreedom,
+        value: float,
+        derivative: Derivatives = Derivatives.position,
+    ) -> None:
+        """
+        Overwrites the value of a derivative of a degree of freedom, without notifying about the state change.
+
+        :param dof: A degree of freedom in this state.
+        :param value: The new value.
+        :param derivative: The derivative to write.
+        """
+        self._data[derivative, self.get_column(dof)] = value
+
+    def get_positions(
+        self, dofs: Union[Iterable[DegreeOfFreedom], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Reads the positions of multiple degrees of freedom with a single fancy-index operation.
+
+        :param dofs: Degrees of freedom in this state, or their columns as returned by `get_columns`.
+        :return: A new array with the positions in the order of `dofs`.
+        """
+        return self._data[Derivatives.position, self._as_columns(dofs)]
+
+    def set_positions(
+        self,
+        dofs: Union[Iterable[DegreeOfFreedom], np.ndarray],
+        values: np.ndarray,
+    ) -> None:
+        """
+        Overwrites the positions of multiple degrees of freedom with a single fancy-index operation, without notifying
+        about the state change.
+
+        :param dofs: Degrees of freedom in this state, or their columns as returned by `get_columns`.
+        :param values: The new positions in the order of `dofs`.
+        """
+        self._data[Derivatives.position, self._as_columns(dofs)] = values
 
     def __getitem__(self, dof_id: UUID) -> WorldStateView:
         if dof_id not in self._index:
             raise DofNotInWorldStateError(dof_id)
         idx = self._index[dof_id]
-        return WorldStateView(self.data[:, idx])
+        return WorldStateView(self._data[:, idx])
 
-    def __setitem__(
-        self, dof_id: UUID, value: np.ndarray | WorldStateView
-    ) -> None:
+    def __setitem__(self, dof_id: UUID, value: np.ndarray | WorldStateView) -> None:
         if dof_id not in self._index:
             raise DofNotInWorldStateError(dof_id)
         if isinstance(value, WorldStateView):
@@ -140,24 +321,21 @@ class WorldState(MutableMapping):
         if arr.shape != (4,):
             raise IncorrectWorldStateValueShapeError(dof_id)
         idx = self._index[dof_id]
-        self.data[:, idx] = arr
+        self._data[:, idx] = arr
 
     def __delitem__(self, dof_id: UUID) -> None:
         if dof_id not in self._index:
             raise DofNotInWorldStateError(dof_id)
         idx = self._index.pop(dof_id)
-        self._ids.pop(idx)
-        # remove column from data
-        self.data = np.delete(self.data, idx, axis=1)
-        # rebuild indices
-        for i, nm in enumerate(self._ids):
-            self._index[nm] = i
+        self._ids[idx] = None
+        self._number_of_tombstones += 1
+        self.layout_version = next(_layout_versions)
 
     def __iter__(self) -> Iterator[UUID]:
-        return iter(self._ids)
+        return iter(self.keys())
 
     def __len__(self) -> int:
-        return len(self._ids)
+        return len(self._index)
 
     def __eq__(self, other: Self) -> bool:
         if self is other:
@@ -166,7 +344,7 @@ class WorldState(MutableMapping):
         if len(self) != len(other):
             return False
 
-        if set(self._ids) != set(other._ids):
+        if set(self.keys()) != set(other.keys()):
             return False
 
         return np.allclose(
@@ -178,29 +356,37 @@ class WorldState(MutableMapping):
         )
 
     def keys(self) -> List[UUID]:
+        self._compact()
         return self._ids
 
     def items(self) -> List[tuple[UUID, np.ndarray]]:
-        return [(dof_id, self.data[:, self._index[dof_id]].copy()) for dof_id in self._ids]
+        return [
+            (dof_id, self.data[:, self._index[dof_id]].copy()) for dof_id in self.keys()
+        ]
 
     def values(self) -> List[np.ndarray]:
-        return [self.data[:, self._index[dof_id]].copy() for dof_id in self._ids]
+        return [self.data[:, self._index[dof_id]].copy() for dof_id in self.keys()]
 
     def __contains__(self, dof_or_uuid: Union[DegreeOfFreedom, UUID]) -> bool:
-        dof_id = dof_or_uuid.id if isinstance(dof_or_uuid, DegreeOfFreedom) else dof_or_uuid
+        dof_id = (
+            dof_or_uuid.id if isinstance(dof_or_uuid, DegreeOfFreedom) else dof_or_uuid
+        )
         return dof_id in self._index
 
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}({{ "
             + ", ".join(
-                f"{n}: {list(self.data[:, i])}" for i, n in enumerate(self._ids)
+                f"{n}: {list(self.data[:, i])}" for i, n in enumerate(self.keys())
             )
             + " })"
         )
 
     def to_position_dict(self) -> Dict[PrefixedName, float]:
-        return {self._world.get_degree_of_freedom_by_id(dof_id).name: self[dof_id].position for dof_id in self._ids}
+        return {
+            self._world.get_degree_of_freedom_by_id(dof_id).name: self[dof_id].position
+            for dof_id in self.keys()
+        }
 
     @property
     def positions(self) -> np.ndarray:
@@ -235,11 +421,12 @@ class WorldState(MutableMapping):
         """
         Create a deep copy of the WorldState.
         """
-        new_state = WorldState(_world=self._world)
-        new_state.data = self.data.copy()
-        new_state._ids = self._ids.copy()
-        new_state._index = self._index.copy()
-        return new_state
+        return WorldState(
+            _world=self._world,
+            _data=self.data.copy(),
+            _ids=self.keys().copy(),
+            _index=self._index.copy(),
+        )
 
     def add_degree_of_freedom(self, dof: DegreeOfFreedom):
         """
@@ -259,6 +446,17 @@ class WorldState(MutableMapping):
         self._add_dof(dof.id)
         self[dof.id].position = initial_position
 
+    def add_degrees_of_freedom(self, dofs: Iterable[DegreeOfFreedom]) -> None:
+        """
+        Adds multiple degrees of freedom to the world state, growing the buffer at most once.
+
+        :param dofs: The degrees of freedom to add.
+        """
+        dofs = list(dofs)
+        self.reserve(len(self) + len(dofs))
+        for dof in dofs:
+            self.add_degree_of_freedom(dof)
+
     def get_variables(self) -> List[cas.FloatVariable]:
         """
         Constructs and returns a list of variables representing the state of the system. The state
@@ -302,9 +500,9 @@ class WorldState(MutableMapping):
             applied.
         :return:
         """
-        if len(commands) != len(self._ids):
+        if len(commands) != len(self):
             raise MismatchingCommandLengthError(
-                expected_length=len(self._ids),
+                expected_length=len(self),
                 actual_length=len(commands),
             )
 
@@ -3246,6 +3246,17 @@ class TestCompiledFunction:
         expected = np.sqrt(np.cos(s1_value) + np.sin(s2_value))
         assert_allclose(actual.toarray(), expected)
 
+    def test_call_batch(self):
+        s1, s2 = cas.create_float_variables(["s1", "s2"])
+        e = cas.Expression(data=[[s1, s2], [s1 * s2, cas.sin(s1)]])
+        e_f = e.compile(parameters=[[s1], [s2]])
+        s1_values = np.random.rand(e_f.batch_size * 2 + 3, 1)
+        s2_values = np.random.rand(e_f.batch_size * 2 + 3, 1)
+        actual = e_f.call_batch(s1_values, s2_values)
+        assert actual.shape == (len(s1_values), 2, 2)
+        for i, (s1_value, s2_value) in enumerate(zip(s1_values, s2_values)):
+            assert_allclose(actual[i], e_f(s1_value, s2_value))
+
     def test_stacked_compiled_function_dense(self):
         s1_value = 420.0
         s2_value = 69.0
@@ -0,0 +1,37 @@
+import numpy as np
+
+from semantic_digital_twin.collision_checking.self_collision_matrix import (
+    DisableCollisionReason,
+    SelfCollisionMatrixGenerator,
+)
+from semantic_digital_twin.robots.pr2 import PR2
+from semantic_digital_twin.testing import pr2_world
+
+
+def test_generate_self_collision_srdf(pr2_world, tmp_path):
+    pr2 = PR2.from_world(pr2_world)
+    positions = pr2_world.state.positions.copy()
+    generator = SelfCollisionMatrixGenerator(pr2, number_of_samples=20, seed=0)
+
+    disabled_collision_pairs = generator.compute_disabled_collision_pairs()
+
+    assert np.array_equal(pr2_world.state.positions, positions)
+    base_link = pr2_world.get_body_by_name("base_link")
+    torso_lift_link = pr2_world.get_body_by_name("torso_lift_link")
+    reasons = {
+        frozenset(pair): reason for pair, reason in disabled_collision_pairs.items()
+    }
+    assert (
+        reasons[frozenset((base_link, torso_lift_link))]
+        == DisableCollisionReason.ADJACENT
+    )
+    assert DisableCollisionReason.NEVER in reasons.values()
+
+    srdf_path = str(tmp_path / "pr2.srdf")
+    generator.save_srdf(srdf_path)
+    pr2_world.load_collision_srdf(srdf_path)
+    loaded_pairs = {
+        frozenset(pair)
+        for pair in pr2_world._collision_pair_manager._disabled_collision_pairs
+    }
+    assert loaded_pairs == set(reasons)
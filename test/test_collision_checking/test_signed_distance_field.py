@@ -0,0 +1,120 @@
+import os
+
+import numpy as np
+import pytest
+
+from semantic_digital_twin.collision_checking.collision_detector import CollisionCheck
+from semantic_digital_twin.collision_checking.signed_distance_field import (
+    SignedDistanceField,
+    SignedDistanceFieldCache,
+)
+from semantic_digital_twin.collision_checking.trimesh_collision_detector import (
+    TrimeshCollisionDetector,
+)
+from semantic_digital_twin.datastructures.prefixed_name import PrefixedName
+from semantic_digital_twin.spatial_types import TransformationMatrix
+from semantic_digital_twin.testing import world_setup_simple
+from semantic_digital_twin.world_description.connections import FixedConnection
+from semantic_digital_twin.world_description.geometry import Box, Scale
+from semantic_digital_twin.world_description.shape_collection import ShapeCollection
+from semantic_digital_twin.world_description.world_entity import Body
+
+
+def box_distance(points: np.ndarray, half_extents: np.ndarray) -> np.ndarray:
+    offsets = np.abs(points) - half_extents
+    outside = np.linalg.norm(np.maximum(offsets, 0), axis=1)
+    inside = np.minimum(offsets.max(axis=1), 0)
+    return outside + inside
+
+
+def test_signed_distance_field_of_box():
+    half_extents = np.array([0.5, 0.3, 0.05])
+    mesh = Box(scale=Scale(*(half_extents * 2))).mesh
+    signed_distance_field = SignedDistanceField.from_mesh(
+        mesh, voxel_size=0.02, padding=0.1
+    )
+
+    points = np.random.default_rng(0).uniform(-0.6, 0.6, (1000, 3)) * [1, 0.6, 0.25]
+    errors = np.abs(
+        signed_distance_field.distance(points) - box_distance(points, half_extents)
+    )
+    assert np.all(errors <= signed_distance_field.max_error)
+
+    closest_points, distances = signed_distance_field.closest_points(
+        np.array([[0.0, 0.0, 0.3], [0.0, 0.0, -0.01]])
+    )
+    assert distances[0] == pytest.approx(0.25, abs=signed_distance_field.max_error)
+    assert distances[1] < 0
+    assert closest_points[0] == pytest.approx(
+        [0, 0, 0.05], abs=signed_distance_field.max_error
+    )
+
+
+def test_signed_distance_field_is_cached_by_mesh_content(tmp_path, monkeypatch):
+    mesh = Box(scale=Scale(0.2, 0.2, 0.2)).mesh
+    signed_distance_field = SignedDistanceField.from_mesh_cached(
+        mesh, 0.02, 0.05, str(tmp_path)
+    )
+    assert len(os.listdir(tmp_path)) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The signed distance field should be loaded from disk")
+
+    monkeypatch.setattr(SignedDistanceField, "from_mesh", fail)
+    loaded = SignedDistanceField.from_mesh_cached(
+        mesh.copy(), 0.02, 0.05, str(tmp_path)
+    )
+    assert np.array_equal(loaded.distances, signed_distance_field.distances)
+    assert np.array_equal(loaded.lower_corner, signed_distance_field.lower_corner)
+
+    with pytest.raises(AssertionError):
+        SignedDistanceField.from_mesh_cached(mesh, 0.01, 0.05, str(tmp_path))
+
+
+def test_static_bodies_use_signed_distance_fields(world_setup_simple, tmp_path):
+    world, body1, body2, body3, body4 = world_setup_simple
+    body2.parent_connection.origin = TransformationMatrix.from_xyz_rpy(10, 10, 10)
+    body3.parent_connection.origin = TransformationMatrix.from_xyz_rpy(-10, -10, 10)
+    body1.parent_connection.origin = TransformationMatrix.from_xyz_rpy(0.2, 0.1, 0)
+    table = Body(
+        name=PrefixedName("table", prefix="test"),
+        collision=ShapeCollection([Box(scale=Scale(1, 1, 0.1))]),
+    )
+    with world.modify_world():
+        world.add_connection(
+            FixedConnection(
+                parent=world.root,
+                child=table,
+                parent_T_connection_expression=TransformationMatrix.from_xyz_rpy(
+                    z=-0.5
+                ),
+            )
+        )
+    assert table in world.static_kinematic_structure_entities
+    signed_distance_fields = SignedDistanceFieldCache(cache_directory=str(tmp_path))
+    collision_checks = [CollisionCheck(body1, table, 0.5, world)]
+
+    [exact] = TrimeshCollisionDetector(world).check_collisions(collision_checks)
+    [approximated] = TrimeshCollisionDetector(
+        world, signed_distance_fields=signed_distance_fields
+    ).check_collisions(collision_checks)
+    assert exact.contact_distance == pytest.approx(0.325)
+    assert approximated.contact_distance == pytest.approx(
+        exact.contact_distance, abs=signed_distance_fields.max_error
+    )
+    map_P_table = (
+        approximated.map_P_pa if approximated.body_a is table else approximated.map_P_pb
+    )
+    assert map_P_table[2] == pytest.approx(-0.45, abs=signed_distance_fields.max_error)
+
+    points_body1, points_table, distances = body1.compute_closest_points_multi(
+        [table, body4], signed_distance_fields=signed_distance_fields
+    )
+    assert distances[0] == pytest.approx(0.325, abs=signed_distance_fields.max_error)
+    assert points_body1[0][2] == pytest.approx(
+        -0.125, abs=signed_distance_fields.max_error
+    )
+    assert points_table[0][2] == pytest.approx(
+        -0.45, abs=signed_distance_fields.max_error
+    )
+    assert np.array_equal(distances[1:], body1.compute_closest_points_multi([body4])[2])
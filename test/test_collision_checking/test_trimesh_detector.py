@@ -1,13 +1,41 @@
 import itertools
 
+import fcl
+import numpy as np
 import pytest
 
-from semantic_digital_twin.collision_checking.collision_detector import CollisionCheck
+from semantic_digital_twin.collision_checking.collision_detector import (
+    CollisionCheck,
+    CollisionMatrix,
+)
 from semantic_digital_twin.collision_checking.trimesh_collision_detector import (
     TrimeshCollisionDetector,
 )
 from semantic_digital_twin.spatial_types import TransformationMatrix
 from semantic_digital_twin.testing import world_setup_simple
+from semantic_digital_twin.world_description.geometry import (
+    Box,
+    Cylinder,
+    Scale,
+    TriangleMesh,
+)
+from semantic_digital_twin.world_description.world_entity import CollisionCheckingConfig
+
+
+@pytest.fixture
+def distance_calls(monkeypatch):
+    """
+    Records the arguments of every call of fcl.distance.
+    """
+    calls = []
+    fcl_distance = fcl.distance
+
+    def recording_distance(*args):
+        calls.append(args)
+        return fcl_distance(*args)
+
+    monkeypatch.setattr(fcl, "distance", recording_distance)
+    return calls
 
 
 def test_simple_collision(world_setup_simple):
@@ -56,3 +84,234 @@ def test_all_collisions(world_setup_simple):
     )
     assert len(collisions) == 1
     assert {collisions[0].body_a, collisions[0].body_b} == {body1, body2}
+
+
+def test_broadphase_skips_distant_pairs(world_setup_simple, distance_calls):
+    world, body1, body2, body3, body4 = world_setup_simple
+    tcd = TrimeshCollisionDetector(world)
+    body4.parent_connection.origin = TransformationMatrix.from_xyz_rpy(10, 10, 10)
+    body3.parent_connection.origin = TransformationMatrix.from_xyz_rpy(-10, -10, 10)
+
+    collisions = tcd.check_collisions(
+        [
+            CollisionCheck(a, b, _world=world, distance=0.0001)
+            for a, b in itertools.combinations(world.bodies_with_enabled_collision, 2)
+        ]
+    )
+    assert len(distance_calls) == 1
+    assert {collisions[0].body_a, collisions[0].body_b} == {body1, body2}
+
+    collisions = tcd.check_collisions([CollisionCheck(body3, body4, 30, world)])
+    assert len(collisions) == 1
+    assert len(distance_calls) == 2
+
+    body3.parent_connection.origin = TransformationMatrix.from_xyz_rpy(10, 10, 10.1)
+    collisions = tcd.check_collisions([CollisionCheck(body3, body4, 0.1, world)])
+    assert len(collisions) == 1
+    assert collisions[0].contact_distance == pytest.approx(0.08, abs=1e-3)
+
+
+def test_temporarily_disabled_collision_body(world_setup_simple):
+    world, body1, body2, body3, body4 = world_setup_simple
+    body3.parent_connection.origin = TransformationMatrix.from_xyz_rpy(-10, -10, 10)
+    body4.parent_connection.origin = TransformationMatrix.from_xyz_rpy(10, 10, 10)
+    body1.set_temporary_collision_config(CollisionCheckingConfig(disabled=True))
+    tcd = TrimeshCollisionDetector(world)
+    collision_checks = [
+        CollisionCheck(a, b, _world=world, distance=0.0)
+        for a, b in itertools.combinations(world.bodies_with_enabled_collision, 2)
+    ]
+    assert not tcd.check_collisions(collision_checks)
+
+    body2.parent_connection.origin = TransformationMatrix.from_xyz_rpy(-10, -10, 10)
+    collisions = tcd.check_collisions(collision_checks)
+    assert len(collisions) == 1
+    assert {collisions[0].body_a, collisions[0].body_b} == {body2, body3}
+
+
+def test_native_primitives(world_setup_simple):
+    world, body1, body2, body3, body4 = world_setup_simple
+    body3.parent_connection.origin = TransformationMatrix.from_xyz_rpy(10, 10, 10)
+    with world.modify_world():
+        body1.collision.shapes.append(
+            Cylinder(
+                origin=TransformationMatrix.from_xyz_rpy(z=2, reference_frame=body1),
+                width=0.2,
+                height=0.5,
+            )
+        )
+        body1.collision.shapes.append(
+            TriangleMesh(
+                origin=TransformationMatrix.from_xyz_rpy(x=-2, reference_frame=body1),
+                mesh=Box(scale=Scale(0.5, 0.5, 0.5)).mesh,
+            )
+        )
+    tcd = TrimeshCollisionDetector(world)
+    tcd.sync_world_model()
+    node_types = [
+        collision_object.getNodeType()
+        for collision_object in tcd._collision_objects[body1]
+    ]
+    assert node_types == [
+        fcl.NODE_TYPE.GEOM_BOX,
+        fcl.NODE_TYPE.GEOM_CYLINDER,
+        fcl.NODE_TYPE.BV_OBBRSS,
+    ]
+    assert tcd._collision_objects[body3][0].getNodeType() == fcl.NODE_TYPE.GEOM_SPHERE
+
+    body3.parent_connection.origin = TransformationMatrix.from_xyz_rpy(z=2.5)
+    collisions = tcd.check_collisions([CollisionCheck(body1, body3, 0.5, world)])
+    assert collisions[0].contact_distance == pytest.approx(0.24)
+
+    body3.parent_connection.origin = TransformationMatrix.from_xyz_rpy(x=-2.5)
+    collisions = tcd.check_collisions([CollisionCheck(body1, body3, 0.5, world)])
+    assert collisions[0].contact_distance == pytest.approx(0.24)
+
+
+def test_temporal_coherence_skips_pairs_that_stay_distant(
+    world_setup_simple, distance_calls
+):
+    world, body1, body2, body3, body4 = world_setup_simple
+    tcd = TrimeshCollisionDetector(world)
+    # the rotated box of body2 makes the bounding boxes closer than the bodies
+    body2.parent_connection.origin = TransformationMatrix.from_xyz_rpy(yaw=np.pi / 4)
+    body3.parent_connection.origin = TransformationMatrix.from_xyz_rpy(0.7, 0.7, 0)
+    body4.parent_connection.origin = TransformationMatrix.from_xyz_rpy(10, 10, 10)
+    collision_checks = [CollisionCheck(body2, body3, 0.8, world)]
+
+    assert not tcd.check_collisions(collision_checks)
+    assert len(distance_calls) == 1
+
+    # the distance of 0.855 can shrink by at most 0.01 + 0.5 times the radius of body3
+    body3.parent_connection.origin = TransformationMatrix.from_xyz_rpy(
+        0.69, 0.7, 0, yaw=0.5
+    )
+    assert not tcd.check_collisions(collision_checks)
+    assert len(distance_calls) == 1
+
+    body3.parent_connection.origin = TransformationMatrix.from_xyz_rpy(0.5, 0.5, 0)
+    collisions = tcd.check_collisions(collision_checks)
+    assert len(distance_calls) == 2
+    assert collisions[0].contact_distance == pytest.approx(
+        np.sqrt(0.5) - 0.135, abs=1e-3
+    )
+
+    tcd.use_temporal_coherence = False
+    body3.parent_connection.origin = TransformationMatrix.from_xyz_rpy(0.7, 0.7, 0)
+    assert not tcd.check_collisions(collision_checks)
+    assert not tcd.check_collisions(collision_checks)
+    assert len(distance_calls) == 4
+
+
+def test_collision_matrix_materializes_only_broadphase_candidates(
+    world_setup_simple, monkeypatch
+):
+    world, body1, body2, body3, body4 = world_setup_simple
+    tcd = TrimeshCollisionDetector(world)
+    body4.parent_connection.origin = TransformationMatrix.from_xyz_rpy(10, 10, 10)
+    body3.parent_connection.origin = TransformationMatrix.from_xyz_rpy(-10, -10, 10)
+    bodies = world.bodies_with_enabled_collision
+    collision_matrix = CollisionMatrix(
+        bodies=bodies,
+        mask=np.triu(np.ones((len(bodies), len(bodies)), dtype=bool), k=1),
+        distance=0.0001,
+        _world=world,
+    )
+
+    number_of_collision_checks = 0
+    post_init = CollisionCheck.__post_init__
+
+    def counting_post_init(self):
+        nonlocal number_of_collision_checks
+        number_of_collision_checks += 1
+        post_init(self)
+
+    monkeypatch.setattr(CollisionCheck, "__post_init__", counting_post_init)
+    collisions = tcd.check_collisions(collision_matrix)
+    assert len(collision_matrix) == 6
+    assert number_of_collision_checks == 1
+    assert len(collisions) == 1
+    assert {collisions[0].body_a, collisions[0].body_b} == {body1, body2}
+
+    collision_matrix.disable_pairs(
+        np.array([collision_matrix.body_indices[body2]]),
+        np.array([collision_matrix.body_indices[body1]]),
+    )
+    assert not tcd.check_collisions(collision_matrix)
+    assert number_of_collision_checks == 1
+
+
+def test_check_trajectory_finds_collisions_between_waypoints(world_setup_simple):
+    world, body1, body2, body3, body4 = world_setup_simple
+    tcd = TrimeshCollisionDetector(world)
+    body4.parent_connection.origin = TransformationMatrix.from_xyz_rpy(10, 10, 10)
+    body3.parent_connection.origin = TransformationMatrix.from_xyz_rpy(-10, -10, 10)
+    body1.parent_connection.origin = TransformationMatrix.from_xyz_rpy(-1, 0.5, 0)
+    positions = world.state.positions.copy()
+    collision_checks = [
+        CollisionCheck(a, b, _world=world, distance=0.0)
+        for a, b in itertools.combinations(world.bodies_with_enabled_collision, 2)
+    ]
+
+    # both waypoints are collision free, body1 passes through body2 in between
+    trajectory = np.array([[-1.0, 0.5], [1.0, 0.5], [1.0, 0.0], [-1.0, 0.0]])
+    x_and_y = [body1.parent_connection.x, body1.parent_connection.y]
+    assert tcd.check_trajectory(trajectory[:2], collision_checks, x_and_y) is None
+
+    trajectory_collision = tcd.check_trajectory(
+        trajectory, collision_checks, x_and_y, resolution=0.01
+    )
+    assert trajectory_collision.segment_index == 2
+    assert trajectory_collision.segment_fraction == pytest.approx(0.375, abs=0.01)
+    assert {
+        trajectory_collision.collision.body_a,
+        trajectory_collision.collision.body_b,
+    } == {body1, body2}
+    assert trajectory_collision.configuration[
+        world.state.get_column(body1.parent_connection.x)
+    ] == pytest.approx(0.25, abs=0.02)
+    assert np.array_equal(world.state.positions, positions)
+
+    # the detector moves its collision objects back to the current state
+    assert not tcd.check_collisions(collision_checks)
+
+
+def test_trajectory_subdivisions_respect_resolution(world_setup_simple):
+    world, body1, body2, body3, body4 = world_setup_simple
+    tcd = TrimeshCollisionDetector(world)
+    tcd.sync_world_model()
+
+    # linearly interpolated quaternions rotate body1 non-uniformly by 180 degrees
+    configurations = tcd._complete_configurations(
+        np.array([[1.0, 0.0], [0.0, 1.0]]),
+        [body1.parent_connection.qw, body1.parent_connection.qz],
+    )
+    [(fractions, segment_configurations, map_T_bodies)] = tcd._subdivide_trajectory(
+        configurations, tcd._body_radii, 0.005
+    )
+    assert fractions[0] == 0 and fractions[-1] == 1
+    assert len(segment_configurations) == len(fractions)
+    assert np.all(tcd._motion_bounds(map_T_bodies, tcd._body_radii) <= 0.005)
+
+
+def test_sync_only_moved_bodies(world_setup_simple):
+    world, body1, body2, body3, body4 = world_setup_simple
+    tcd = TrimeshCollisionDetector(world)
+    tcd.sync_world_model()
+    tcd.sync_world_state()
+    assert tcd._last_synced_state == world.state.version
+    assert tcd._last_synced_model == world.get_world_model_manager().version
+
+    marker = fcl.Transform(np.eye(3), np.array([42.0, 0, 0]))
+    tcd._collision_objects[body1][0].setTransform(marker)
+    tcd._collision_objects[body2][0].setTransform(marker)
+    tcd.sync_world_state()
+    assert np.allclose(tcd._collision_objects[body1][0].getTranslation(), [42, 0, 0])
+
+    body1.parent_connection.origin = TransformationMatrix.from_xyz_rpy(1, 2, 3)
+    tcd.sync_world_state()
+    assert np.allclose(tcd._collision_objects[body1][0].getTranslation(), [1, 2, 3])
+    assert np.allclose(tcd._collision_objects[body2][0].getTranslation(), [42, 0, 0])
+    assert np.allclose(
+        tcd._map_T_bodies[tcd._body_indices[body1]], body1.global_pose.to_np()
+    )
@@ -1,8 +1,14 @@
 import numpy as np
+import pytest
 
+from semantic_digital_twin.datastructures.prefixed_name import PrefixedName
 from semantic_digital_twin.spatial_computations.raytracer import RayTracer
 from semantic_digital_twin.spatial_types.spatial_types import TransformationMatrix
 from semantic_digital_twin.testing import world_setup_simple
+from semantic_digital_twin.world_description.connections import FixedConnection
+from semantic_digital_twin.world_description.geometry import Box, Scale
+from semantic_digital_twin.world_description.shape_collection import ShapeCollection
+from semantic_digital_twin.world_description.world_entity import Body
 
 
 def test_create_segmentation_mask(world_setup_simple):
@@ -148,3 +154,64 @@ def test_max_distance(world_setup_simple):
     hits, indices, bodies = rt.ray_test(rays, targets, max_dist=1)
 
     assert len(hits) == 0
+
+
+def test_ray_test_static_and_moving_bodies(world_setup_simple):
+    world, body1, body2, body3, body4 = world_setup_simple
+    static_body = Body(
+        name=PrefixedName("static"),
+        collision=ShapeCollection([Box(scale=Scale(0.25, 0.25, 0.25))]),
+    )
+    with world.modify_world():
+        world.add_kinematic_structure_entity(static_body)
+        world.add_connection(
+            FixedConnection(
+                parent=world.root,
+                child=static_body,
+                parent_T_connection_expression=TransformationMatrix.from_xyz_rpy(
+                    x=2, reference_frame=world.root
+                ),
+            )
+        )
+    body1.parent_connection.origin = TransformationMatrix.from_xyz_rpy(x=1, yaw=0.3)
+    body3.parent_connection.origin = TransformationMatrix.from_xyz_rpy(z=5)
+    body4.parent_connection.origin = TransformationMatrix.from_xyz_rpy(z=5)
+
+    rt = RayTracer(world)
+    hits, indices, bodies = rt.ray_test(
+        np.array([3, 0, 0.1]), np.array([-3, 0, 0.1]), multiple_hits=True
+    )
+    assert bodies[::2] == [static_body, body1, body2]
+    assert np.all(np.diff(-hits[:, 0]) >= 0)
+    static_mesh = rt._static_mesh
+
+    body1.parent_connection.origin = TransformationMatrix.from_xyz_rpy(x=3)
+    hits, indices, bodies = rt.ray_test(np.array([3.5, 0, 0.1]), np.array([0, 0, 0.1]))
+    assert bodies == [body1]
+    assert hits[0] == pytest.approx([3.125, 0, 0.1])
+    assert rt._static_mesh is static_mesh
+
+
+def test_scene_bookkeeping(world_setup_simple):
+    world, body1, body2, body3, body4 = world_setup_simple
+    rt = RayTracer(world)
+    assert rt._registered_body_ids == {body1.id, body2.id, body3.id, body4.id}
+    body2_node = rt._body_node_names[body2.id][0]
+
+    marker = np.eye(4)
+    marker[0, 3] = 42
+    rt.scene.graph[body2_node] = marker
+    body1.parent_connection.origin = TransformationMatrix.from_xyz_rpy(x=1)
+    rt.update_scene()
+    body1_node = rt._body_node_names[body1.id][0]
+    assert rt.scene.graph[body1_node][0][0, 3] == 1
+    assert rt.scene.graph[body2_node][0][0, 3] == 42
+
+    with world.modify_world():
+        world.remove_connection(body3.parent_connection)
+        world.remove_kinematic_structure_entity(body3)
+    rt.update_scene()
+    assert rt._registered_body_ids == {body1.id, body2.id, body4.id}
+    assert not any(str(body3.id) in node for node in rt.scene.graph.nodes)
+    hits, indices, bodies = rt.ray_test(np.array([1, 0, 1]), np.array([1, 0, -1]))
+    assert bodies == [body1]
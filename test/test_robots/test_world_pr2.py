@@ -1,3 +1,4 @@
+import itertools
 import os
 from collections import defaultdict
 
@@ -11,12 +12,15 @@ from semantic_digital_twin.reasoning.predicates import LeftOf
 from semantic_digital_twin.robots.hsrb import HSRB
 from semantic_digital_twin.spatial_types.spatial_types import TransformationMatrix
 from semantic_digital_twin.world_description.connections import (
+    ActiveConnection,
     OmniDrive,
     PrismaticConnection,
     RevoluteConnection,
 )
 from semantic_digital_twin.spatial_computations.ik_solver import (
+    InverseKinematicsSolver,
     MaxIterationsException,
+    SolverState,
     UnreachableException,
 )
 from semantic_digital_twin.datastructures.prefixed_name import PrefixedName
@@ -229,6 +233,61 @@ def test_compute_ik(pr2_world):
     assert np.allclose(actual_fk, fk, atol=1e-3)
 
 
+def test_compute_ik_reuses_compiled_problem(pr2_world):
+    bf = pr2_world.root
+    eef = pr2_world.get_kinematic_structure_entity_by_name(
+        "r_gripper_tool_frame"
+    )
+    pr2_world._cache_manager.reset_statistics()
+    start_fk = pr2_world.compute_forward_kinematics_np(bf, eef)
+    for offset in [(-0.1, 0.0, 0.0), (0.0, 0.1, 0.05)]:
+        fk = start_fk.copy()
+        fk[:3, 3] += offset
+        joint_state = pr2_world.compute_inverse_kinematics(
+            bf, eef, TransformationMatrix(fk, reference_frame=bf)
+        )
+        for joint, state in joint_state.items():
+            pr2_world.state[joint.id].position = state
+        pr2_world.notify_state_change()
+        actual_fk = pr2_world.compute_forward_kinematics_np(bf, eef)
+        assert np.allclose(actual_fk, fk, atol=1e-3)
+
+    statistics = pr2_world._cache_manager.statistics[
+        InverseKinematicsSolver.get_qp_problem.__qualname__
+    ]
+    assert statistics.misses == 1
+    assert statistics.hits == 1
+
+
+def test_ik_qp_evaluation_reuses_buffers(pr2_world):
+    bf = pr2_world.root
+    eef = pr2_world.get_kinematic_structure_entity_by_name(
+        "r_gripper_tool_frame"
+    )
+    qp_problem = InverseKinematicsSolver(pr2_world).get_qp_problem(
+        bf, eef, 0.05, 0.2, 0.2
+    )
+    target = pr2_world.compute_forward_kinematics_np(bf, eef)
+    target[0, 3] -= 0.2
+    solver_state = SolverState(
+        position=np.array(
+            [pr2_world.state[dof.id].position for dof in qp_problem.active_dofs]
+        ),
+        passive_position=np.array(
+            [pr2_world.state[dof.id].position for dof in qp_problem.passive_dofs]
+        ),
+        target=target[:3].flatten(),
+    )
+    qp_matrices = qp_problem.evaluate_at_state(solver_state)
+    assert np.allclose(qp_matrices.H, np.diag(np.diag(qp_matrices.H)))
+    assert np.all(np.diag(qp_matrices.H) > 0)
+    upper_bounds = qp_matrices.u.copy()
+
+    solver_state.update_position(np.ones_like(solver_state.position), 0.05)
+    assert qp_problem.evaluate_at_state(solver_state) is qp_matrices
+    assert not np.allclose(qp_matrices.u, upper_bounds)
+
+
 def test_compute_ik_max_iter(pr2_world):
     bf = pr2_world.root
     eef = pr2_world.get_kinematic_structure_entity_by_name(
@@ -387,6 +446,39 @@ def test_load_collision_config_srdf(pr2_world):
     assert len(pr2_world._collision_pair_manager.disabled_collision_pairs) == 1128
 
 
+def test_collision_matrix_matches_pairwise_rules(pr2_world):
+    PR2.from_world(pr2_world)
+    with pr2_world.modify_world():
+        for connection in pr2_world.get_connections_by_type(ActiveConnection):
+            connection.has_hardware_interface = True
+    collision_pair_manager = pr2_world._collision_pair_manager
+    disabled_pair = (
+        pr2_world.get_body_by_name("r_forearm_link"),
+        pr2_world.get_body_by_name("l_forearm_link"),
+    )
+    collision_pair_manager.add_disabled_collision_pair(*disabled_pair)
+
+    collision_matrix = collision_pair_manager.compute_collision_matrix(0.05)
+
+    robot_bodies = {
+        body
+        for robot in pr2_world.get_semantic_annotations_by_type(PR2)
+        for body in robot.bodies_with_collisions
+    }
+    expected_pairs = {
+        frozenset((body_a, body_b))
+        for body_a, body_b in itertools.combinations(
+            pr2_world.bodies_with_enabled_collision, 2
+        )
+        if pr2_world.is_controlled_connection_in_chain(body_a, body_b)
+        and (body_a in robot_bodies or body_b in robot_bodies)
+    } - {frozenset(disabled_pair)}
+    assert len(collision_matrix) == len(expected_pairs) > 0
+    assert {frozenset(pair) for pair in collision_matrix.pairs()} == expected_pairs
+    assert not collision_matrix.is_enabled(*disabled_pair)
+    assert not np.any(np.tril(collision_matrix.mask))
+
+
 def test_tracy_semantic_annotation(tracy_world):
     tracy = Tracy.from_world(tracy_world)
 
@@ -0,0 +1,68 @@
+from uuid import uuid4
+
+import numpy as np
+
+from semantic_digital_twin.adapters.ros.messages import (
+    PackedMessage,
+    PackedWorldStateUpdate,
+    WorldStateSchema,
+)
+from semantic_digital_twin.datastructures.prefixed_name import PrefixedName
+from semantic_digital_twin.spatial_types import Vector3
+from semantic_digital_twin.testing import world_setup
+from semantic_digital_twin.world_description.connections import PrismaticConnection
+from semantic_digital_twin.world_description.degree_of_freedom import DegreeOfFreedom
+from semantic_digital_twin.world_description.world_entity import Body
+
+
+def test_packed_messages_round_trip():
+    schema = WorldStateSchema(schema_id=2**64 - 1, ids=[uuid4(), uuid4()])
+    assert PackedMessage.from_bytes(schema.to_bytes()) == schema
+
+    update = PackedWorldStateUpdate(
+        schema_id=3, indices=np.array([1, 0]), states=np.array([0.5, -1.0])
+    )
+    received = PackedMessage.from_bytes(bytearray(update.to_bytes()))
+    assert isinstance(received, PackedWorldStateUpdate)
+    assert received.schema_id == 3
+    np.testing.assert_array_equal(received.indices, [1, 0])
+    np.testing.assert_array_equal(received.states, [0.5, -1.0])
+
+
+def test_schema_columns_of_dofs_added_after_announcement(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    unknown_dof_id = uuid4()
+    schema = PackedMessage.from_bytes(
+        WorldStateSchema(
+            schema_id=1, ids=[unknown_dof_id, *reversed(world.state.keys())]
+        ).to_bytes()
+    )
+    columns = schema.columns_in(world.state)
+    assert columns[0] == -1
+    np.testing.assert_array_equal(columns[1:], np.arange(len(world.state))[::-1])
+
+    # adding a DOF changes the layout, such that a new schema is announced and received columns are resolved again
+    layout_version = world.state.layout_version
+    with world.modify_world():
+        world.add_degree_of_freedom(
+            DegreeOfFreedom(name=PrefixedName("new_dof"), id=unknown_dof_id)
+        )
+        world.add_connection(
+            PrismaticConnection(
+                parent=world.root,
+                child=Body(name=PrefixedName("new_body")),
+                dof_id=unknown_dof_id,
+                axis=Vector3.X(reference_frame=world.root),
+            )
+        )
+    assert world.state.layout_version != layout_version
+    assert schema.columns_in(world.state)[0] == world.state.keys().index(unknown_dof_id)
+    new_schema = WorldStateSchema(schema_id=2, ids=world.state.keys())
+    update = PackedWorldStateUpdate(
+        schema_id=2,
+        indices=np.array([len(world.state) - 1]),
+        states=np.array([0.5]),
+    )
+    columns = new_schema.columns_in(world.state)[update.indices]
+    world.state.data[0, columns] = update.states
+    assert world.state[unknown_dof_id].position == 0.5
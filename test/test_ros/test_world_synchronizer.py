@@ -8,10 +8,15 @@ from uuid import UUID, uuid4
 
 import numpy as np
 import sqlalchemy
+import std_msgs.msg
 from krrood.ormatic.utils import drop_database, create_engine
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from semantic_digital_twin.adapters.ros.messages import (
+    PackedWorldStateUpdate,
+    WorldStateSchema,
+)
 from semantic_digital_twin.adapters.ros.world_synchronizer import (
     StateSynchronizer,
     ModelReloadSynchronizer,
@@ -112,6 +117,97 @@ def test_state_synchronization(rclpy_node):
     synchronizer_2.close()
 
 
+def test_state_synchronization_json_fallback(rclpy_node):
+    w1 = create_dummy_world()
+    w2 = create_dummy_world()
+
+    synchronizer_1 = StateSynchronizer(
+        node=rclpy_node, world=w1, use_binary_messages=False
+    )
+    synchronizer_2 = StateSynchronizer(node=rclpy_node, world=w2)
+
+    time.sleep(0.2)
+
+    w1.state.data[0, 1] = 2.0
+    w1.notify_state_change()
+    time.sleep(0.2)
+    assert w2.state.data[0, 1] == 2.0
+
+    w2.state.data[0, 2] = 3.0
+    w2.notify_state_change()
+    time.sleep(0.2)
+    assert w1.state.data[0, 2] == 3.0
+
+    synchronizer_1.close()
+    synchronizer_2.close()
+
+
+def test_packed_update_with_only_unknown_dofs_keeps_local_changes(
+    rclpy_node, monkeypatch
+):
+    w = create_dummy_world()
+    s = StateSynchronizer(node=rclpy_node, world=w)
+    published_changes = 0
+
+    def counting_world_callback():
+        nonlocal published_changes
+        published_changes += 1
+
+    monkeypatch.setattr(s, "world_callback", counting_world_callback)
+
+    schema = WorldStateSchema(schema_id=42, ids=[uuid4()])
+    update = PackedWorldStateUpdate(
+        schema_id=42, indices=np.array([0]), states=np.array([1.0])
+    )
+    s.binary_subscription_callback(std_msgs.msg.UInt8MultiArray(data=schema.to_bytes()))
+    s.binary_subscription_callback(std_msgs.msg.UInt8MultiArray(data=update.to_bytes()))
+    assert not s._skip_next_world_callback
+
+    w.state.data[0, 0] = 1.0
+    w.notify_state_change()
+    assert published_changes == 1
+
+    s.close()
+
+
+def test_state_synchronization_of_dofs_added_after_first_publish(rclpy_node):
+    w1 = create_dummy_world()
+    w2 = create_dummy_world()
+
+    synchronizer_1 = StateSynchronizer(node=rclpy_node, world=w1)
+    synchronizer_2 = StateSynchronizer(node=rclpy_node, world=w2)
+
+    time.sleep(0.2)
+
+    w1.state.data[0, 0] = 1.0
+    w1.notify_state_change()
+    time.sleep(0.2)
+    assert w2.state.data[0, 0] == 1.0
+
+    new_dof_id = uuid4()
+    for w in [w1, w2]:
+        with w.modify_world():
+            w.add_degree_of_freedom(
+                DegreeOfFreedom(name=PrefixedName("new_dof"), id=new_dof_id)
+            )
+            w.add_connection(
+                PrismaticConnection(
+                    parent=w.root,
+                    child=Body(name=PrefixedName("new_body")),
+                    dof_id=new_dof_id,
+                    axis=Vector3.X(reference_frame=w.root),
+                )
+            )
+
+    w1.state[new_dof_id].position = 2.0
+    w1.notify_state_change()
+    time.sleep(0.2)
+    assert w2.state[new_dof_id].position == 2.0
+
+    synchronizer_1.close()
+    synchronizer_2.close()
+
+
 def test_state_synchronization_world_model_change_after_init(rclpy_node):
     w1 = World()
     w2 = World()
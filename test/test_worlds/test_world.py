@@ -21,7 +21,10 @@ from semantic_digital_twin.exceptions import (
     DuplicateKinematicStructureEntityError,
     UsageError,
     MissingWorldModificationContextError,
+    MismatchingBatchLengthError,
+    WrongDimensionsError,
     DofNotInWorldStateError,
+    WorldEntityNotFoundError,
 )
 from semantic_digital_twin.datastructures.prefixed_name import PrefixedName
 from semantic_digital_twin.spatial_types.derivatives import Derivatives, DerivativeMap
@@ -239,6 +242,222 @@ def test_compute_fk(world_setup):
     )
 
 
+def test_compute_fk_batch(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    world.get_connection(r1, r2).position = 1.0
+    world.get_connection(world.root, bf).origin = TransformationMatrix.from_xyz_rpy(
+        x=1, y=-2, yaw=0.5
+    )
+    roots = [world.root, l2, r2, bf, r1, l1]
+    tips = [r2, r2, l2, bf, world.root, l1]
+    fks = world.compute_forward_kinematics_np_batch(roots, tips)
+    assert fks.shape == (len(roots), 4, 4)
+    for fk, root, tip in zip(fks, roots, tips):
+        assert np.allclose(fk, world.compute_forward_kinematics_np(root, tip))
+
+    assert world.compute_forward_kinematics_np_batch([], []).shape == (0, 4, 4)
+    with pytest.raises(MismatchingBatchLengthError):
+        world.compute_forward_kinematics_np_batch(roots, tips[1:])
+
+
+def test_compute_fk_for_configurations(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    fk_manager = world._forward_kinematic_manager
+    rng = np.random.default_rng(42)
+    configurations = rng.uniform(-1, 1, (5, len(world.degrees_of_freedom)))
+    state_before = world.state.data.copy()
+
+    fks = fk_manager.compute_for_configurations(configurations)
+    subset = fk_manager.compute_for_configurations(configurations, [r2, world.root])
+    assert np.array_equal(world.state.data, state_before)
+    assert fks.shape == (5, len(world.kinematic_structure_entities), 4, 4)
+    assert subset.shape == (5, 2, 4, 4)
+
+    for configuration, fk, fk_subset in zip(configurations, fks, subset):
+        world.state.positions[:] = configuration
+        world.notify_state_change()
+        for entity in world.kinematic_structure_entities:
+            index = fk_manager.idx_start[entity.id] // 4
+            assert np.allclose(
+                fk[index], world.compute_forward_kinematics_np(world.root, entity)
+            )
+        assert np.allclose(
+            fk_subset[0], world.compute_forward_kinematics_np(world.root, r2)
+        )
+        assert np.allclose(fk_subset[1], np.eye(4))
+
+    with pytest.raises(WrongDimensionsError):
+        fk_manager.compute_for_configurations(configurations[:, 1:])
+
+
+def test_compute_fk_lazy(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    world.lazy_forward_kinematics = True
+    fk_manager = world._forward_kinematic_manager
+    eager_collision_fks = world.compute_forward_kinematics_of_all_collision_bodies()
+    eager_collision_fks = eager_collision_fks.copy()
+
+    connection: RevoluteConnection = world.get_connection(r1, r2)
+    world.state[connection.dof.id].position = 1.0
+    world.notify_state_change()
+    assert fk_manager._all_fks_is_dirty
+    assert fk_manager._collision_fks_is_dirty
+
+    fk = world.compute_forward_kinematics_np(r1, r2)
+    assert fk[0, 0] == pytest.approx(np.cos(1.0))
+    assert not fk_manager._all_fks_is_dirty
+    assert fk_manager._collision_fks_is_dirty
+
+    world.state[connection.dof.id].position = 0.0
+    world.notify_state_change()
+    assert np.allclose(
+        world.compute_forward_kinematics_of_all_collision_bodies(),
+        eager_collision_fks,
+    )
+    assert np.allclose(world.compute_forward_kinematics_np(r1, r2), np.eye(4))
+
+
+def test_compute_fk_only_changed_groups():
+    world = World()
+    root = Body(name=PrefixedName("root"))
+    link_a = Body(name=PrefixedName("link_a"))
+    link_b = Body(name=PrefixedName("link_b"))
+    static_body = Body(name=PrefixedName("static_body"))
+    with world.modify_world():
+        connection_a = RevoluteConnection.create_with_dofs(
+            world=world, parent=root, child=link_a, axis=Vector3.Z()
+        )
+        world.add_connection(connection_a)
+        connection_b = RevoluteConnection.create_with_dofs(
+            world=world, parent=root, child=link_b, axis=Vector3.Z()
+        )
+        world.add_connection(connection_b)
+        world.add_connection(FixedConnection(parent=root, child=static_body))
+
+    fk_manager = world._forward_kinematic_manager
+    assert len(fk_manager.groups) == 2
+
+    evaluated_groups = []
+    for group in fk_manager.groups:
+
+        def compiled_fks(positions, group=group, original=group.compiled_fks):
+            evaluated_groups.append(group)
+            return original(positions)
+
+        group.compiled_fks = compiled_fks
+
+    connection_a.position = 1.0
+    assert [group.kinematic_structure_entities for group in evaluated_groups] == [
+        [link_a]
+    ]
+    assert world.compute_forward_kinematics_np(root, link_a)[0, 0] == pytest.approx(
+        np.cos(1.0)
+    )
+    assert np.allclose(world.compute_forward_kinematics_np(root, link_b), np.eye(4))
+
+
+def test_compute_fk_static_entities(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    fixed_body = Body(name=PrefixedName("fixed_body"))
+    static_body = Body(name=PrefixedName("static_body"))
+    root_T_static = TransformationMatrix.from_xyz_rpy(x=1, yaw=0.5)
+    with world.modify_world():
+        world.add_connection(
+            FixedConnection(
+                parent=world.root,
+                child=static_body,
+                parent_T_connection_expression=root_T_static,
+            )
+        )
+        world.add_connection(FixedConnection(parent=r2, child=fixed_body))
+
+    fk_manager = world._forward_kinematic_manager
+    assert set(fk_manager.static_entities) == {world.root, static_body}
+    assert all(
+        static_body not in group.kinematic_structure_entities
+        for group in fk_manager.groups
+    )
+    assert np.allclose(
+        world.compute_forward_kinematics_np(world.root, static_body),
+        root_T_static.to_np(),
+    )
+
+    world.get_connection(r1, r2).position = 1.0
+    assert np.allclose(
+        world.compute_forward_kinematics_np(static_body, fixed_body),
+        root_T_static.inverse().to_np()
+        @ world.compute_forward_kinematics_np(world.root, r2),
+    )
+
+
+def test_compute_fk_incremental_compilation(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    fk_manager = world._forward_kinematic_manager
+    [robot_group] = fk_manager.groups
+    tool = Body(name=PrefixedName("tool"))
+    with world.modify_world():
+        world.add_connection(
+            FixedConnection(
+                parent=r2,
+                child=tool,
+                parent_T_connection_expression=TransformationMatrix.from_xyz_rpy(x=1),
+            )
+        )
+    assert fk_manager.groups[0] is robot_group
+    assert [group.kinematic_structure_entities for group in fk_manager.groups[1:]] == [
+        [tool]
+    ]
+
+    connection: RevoluteConnection = world.get_connection(r1, r2)
+    connection.position = 1.0
+    assert np.allclose(
+        world.compute_forward_kinematics_np(world.root, tool),
+        world.compute_forward_kinematics_np(world.root, r2)
+        @ TransformationMatrix.from_xyz_rpy(x=1).to_np(),
+    )
+
+    with world.modify_world():
+        world.remove_connection(world.get_connection(r2, tool))
+        world.remove_kinematic_structure_entity(tool)
+    assert fk_manager.groups == [robot_group]
+    assert world.compute_forward_kinematics_np(r1, r2)[0, 0] == pytest.approx(
+        np.cos(1.0)
+    )
+
+
+def test_compute_fk_full_recompilation(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    fk_manager = world._forward_kinematic_manager
+    fk_manager.full_recompile_threshold = 0.0
+    [robot_group] = fk_manager.groups
+    tool = Body(name=PrefixedName("tool"))
+    with world.modify_world():
+        world.add_connection(FixedConnection(parent=r2, child=tool))
+    [group] = fk_manager.groups
+    assert group is not robot_group
+    assert tool in group.kinematic_structure_entities
+
+
+def test_batch_state_update(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    prismatic: PrismaticConnection = world.get_connection(l1, l2)
+    base: Connection6DoF = world.get_connection(world.root, bf)
+    state_version = world.state.version
+
+    with world.batch_state_update():
+        prismatic.position = 1.0
+        base.origin = TransformationMatrix.from_xyz_rpy(x=2)
+        with world.batch_state_update():
+            prismatic.velocity = 0.5
+        assert world.state.version == state_version
+    assert world.state.version == state_version + 1
+    assert not world.state_is_being_batch_updated
+    assert world.compute_forward_kinematics_np(world.root, bf)[0, 3] == pytest.approx(
+        2.0
+    )
+    assert world.compute_forward_kinematics_np(bf, l2)[0, 3] == pytest.approx(1.0)
+
+
 def test_compute_ik(world_setup):
     world, l1, l2, bf, r1, r2 = world_setup
     target = np.array(
@@ -383,12 +602,28 @@ def test_add_semantic_annotation(world_setup):
 def test_duplicate_semantic_annotation(world_setup):
     world, l1, l2, bf, r1, r2 = world_setup
     v = SemanticAnnotation(name=PrefixedName("muh"))
+    v2 = Handle(body=l1, name=PrefixedName("muh"))
     with world.modify_world():
         world.add_semantic_annotation(v)
-        world.semantic_annotations.append(v)
+        world.add_semantic_annotation(v2)
     with pytest.raises(DuplicateWorldEntityError):
         world.get_semantic_annotation_by_name(v.name)
 
+
+def test_remove_semantic_annotation_after_changing_it(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    handle = Handle(body=l1)
+    with world.modify_world():
+        world.add_semantic_annotation(handle)
+
+    # the hash of a semantic annotation depends on its fields
+    handle.body = l2
+    assert world.is_semantic_annotation_in_world(handle)
+    with world.modify_world():
+        world.remove_semantic_annotation(handle)
+    assert not world.is_semantic_annotation_in_world(handle)
+    assert handle not in world.semantic_annotations
+
 def test_all_kinematic_structure_entities_have_uuid(world_setup):
     world, _, _, _, _, _ = world_setup
     uuids = {
@@ -606,6 +841,75 @@ def test_remove_connection(world_setup):
             # if you remove a connection, the child must be connected some other way or deleted
             world.remove_connection(world.get_connection(r1, r2))
 
+def test_lookups_after_removal(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    connection = world.get_connection(l1, l2)
+    assert world.get_kinematic_structure_entity_by_id(l2.id) is l2
+    assert world.get_connection_by_name(connection.name) is connection
+    with world.modify_world():
+        # removing l2 implicitly removes the connection from the kinematic structure
+        world.remove_kinematic_structure_entity(l2)
+        world.remove_connection(connection)
+    assert not world.is_kinematic_structure_entity_in_world(l2)
+    assert not world.is_connection_in_world(connection)
+    with pytest.raises(WorldEntityNotFoundError):
+        world.get_kinematic_structure_entity_by_id(l2.id)
+    with pytest.raises(WorldEntityNotFoundError):
+        world.get_body_by_name("l2")
+    assert world.get_connections_by_name(connection.name) == []
+
+
+def test_lookups_by_name_and_id(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    assert world.get_body_by_name("l1") is l1
+    assert world.get_body_by_name(PrefixedName("l1")) is l1
+    assert world.get_kinematic_structure_entities_by_name("root") == [world.root]
+    dof = world.get_degree_of_freedom_by_name("dof")
+    assert world.get_degree_of_freedom_by_id(dof.id) is dof
+    assert world.is_degree_of_freedom_in_world(dof)
+    assert world.is_body_in_world(l1)
+
+    with world.modify_world():
+        world.remove_connection(world.get_connection(r1, r2))
+        world.remove_kinematic_structure_entity(r2)
+    assert world.get_degree_of_freedom_by_name("dof") is dof
+
+
+def test_model_cache_statistics(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    world._cache_manager.reset_statistics()
+    world.compute_chain_of_kinematic_structure_entities(world.root, l2)
+    world.compute_chain_of_kinematic_structure_entities(world.root, l2)
+    statistics = world._cache_manager.statistics[
+        World.compute_chain_of_kinematic_structure_entities.__qualname__
+    ]
+    assert statistics.misses == 1
+    assert statistics.hits == 1
+    assert statistics.size == 1
+
+
+def test_model_cache_invalidated_on_model_change(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    assert world.compute_parent_kinematic_structure_entity(r2) is r1
+    assert world._cache_manager.size > 0
+    with world.modify_world():
+        world.remove_connection(world.get_connection(r1, r2))
+        world.add_connection(FixedConnection(l1, r2))
+    assert world.compute_parent_kinematic_structure_entity(r2) is l1
+    assert world.compose_forward_kinematics_expression(
+        l1, r2
+    ).to_np() == pytest.approx(np.eye(4))
+
+
+def test_descendants_contain_no_duplicates(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    descendants = world.compute_descendent_child_kinematic_structure_entities(
+        world.root
+    )
+    assert len(descendants) == len(set(descendants))
+    assert set(descendants) == set(world.kinematic_structure_entities) - {world.root}
+
+
 def test_kinematic_structure_entity_hash(world_setup):
     _, l1, _, _, _, _ = world_setup
     assert hash(l1) == hash(l1.id)
@@ -669,6 +973,62 @@ def test_world_state_item_not_set_yet(world_setup):
         assert world.state[new_dof.id].position == 1.0
 
 
+def test_world_state_bulk_add_and_removal(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    old_ids = list(world.state.keys())
+    world.state[old_ids[-1]].position = 0.5
+    new_dofs = [DegreeOfFreedom(name=PrefixedName(f"dof_{i}")) for i in range(100)]
+
+    with world.modify_world():
+        world.add_degrees_of_freedom(new_dofs)
+        assert world.state._data.shape[1] >= len(old_ids) + 100
+        assert world.state.keys() == old_ids + [dof.id for dof in new_dofs]
+        assert world.state.positions.flags["C_CONTIGUOUS"]
+        world.state[new_dofs[50].id].position = 1.0
+        assert world.state.positions[len(old_ids) + 50] == 1.0
+    # the new dofs are orphans and removed when the modification ends
+
+    assert world.state.keys() == old_ids
+    assert len(world.state) == len(old_ids)
+    assert world.state.data.shape == (4, len(old_ids))
+    assert world.state[old_ids[-1]].position == 0.5
+
+
+def test_world_state_vectorized_positions(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    base: Connection6DoF = world.get_connection(world.root, bf)
+    dofs = base.passive_dofs
+    columns = world.state.get_columns(dofs)
+    assert list(columns) == [world.state._index[dof.id] for dof in dofs]
+
+    world.state.set_positions(columns, np.arange(7, dtype=float))
+    assert np.allclose(world.state.get_positions(dofs), np.arange(7))
+    assert world.state[base.qw.id].position == 6.0
+    assert world.state.get_value(base.qw) == 6.0
+
+
+def test_world_state_column_cache_invalidation(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    base: Connection6DoF = world.get_connection(world.root, bf)
+    removed_dof = base.qw
+    connection: RevoluteConnection = world.get_connection(r1, r2)
+    connection.position = 0.3
+    world.state.get_column(connection.raw_dof)
+    layout_version = world.state.layout_version
+    assert connection.raw_dof._state_layout_version == layout_version
+
+    with world.modify_world():
+        world.remove_connection(base)
+        world.add_connection(FixedConnection(parent=world.root, child=bf))
+    assert world.state.layout_version != layout_version
+    assert world.state.get_column(connection.raw_dof) == world.state._index[
+        connection.raw_dof.id
+    ]
+    assert connection.position == pytest.approx(0.3)
+    with pytest.raises(DofNotInWorldStateError):
+        world.state.get_column(removed_dof)
+
+
 def test_match_index(world_setup):
     world, l1, l2, bf, r1, r2 = world_setup
     world_copy = deepcopy(world)